@@ -0,0 +1,188 @@
+from functools import lru_cache
+import json
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+)
+
+from dbt_common.utils.encoding import ForgivingJSONEncoder
+
+if TYPE_CHECKING:
+    import agate
+    import pyarrow
+
+
+@lru_cache(maxsize=None)
+def arrow_available() -> bool:
+    """Check if pyarrow is installed. It is an optional dependency, only
+    needed for Arrow-backed results. Checked once per process.
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _pyarrow_types() -> Any:
+    import pyarrow.types
+
+    return pyarrow.types
+
+
+def _is_nested(arrow_type: "pyarrow.DataType") -> bool:
+    types = _pyarrow_types()
+    return (
+        types.is_list(arrow_type)
+        or types.is_large_list(arrow_type)
+        or types.is_struct(arrow_type)
+        or types.is_map(arrow_type)
+    )
+
+
+def _agate_type(arrow_type: "pyarrow.DataType") -> Optional["agate.DataType"]:
+    """Get the agate type that type inference would pick for a column of the
+    given Arrow type, or None if there isn't an unambiguous one.
+    """
+    import agate
+    from dbt_common.clients.agate_helper import Integer, Number
+
+    types = _pyarrow_types()
+    null_values = ("null", "")
+    if types.is_integer(arrow_type):
+        return Integer(null_values=null_values)
+    if types.is_floating(arrow_type) or types.is_decimal(arrow_type):
+        return Number(null_values=null_values)
+    if types.is_boolean(arrow_type):
+        return agate.data_types.Boolean(
+            true_values=("true",), false_values=("false",), null_values=null_values
+        )
+    if types.is_date(arrow_type):
+        return agate.data_types.Date(null_values=null_values, date_format="%Y-%m-%d")
+    if types.is_timestamp(arrow_type):
+        return agate.data_types.DateTime(
+            null_values=null_values, datetime_format="%Y-%m-%d %H:%M:%S"
+        )
+    if types.is_string(arrow_type) or types.is_large_string(arrow_type) or _is_nested(arrow_type):
+        # like text_only_columns, keep '' and 'null' as they are
+        return agate.data_types.Text(null_values=())
+    return None
+
+
+def _unique_column_names(column_names: Iterable[str]) -> List[str]:
+    # match SQLConnectionManager.process_results: duplicates get a suffix
+    seen: Dict[str, int] = {}
+    unique = []
+    for name in column_names:
+        if name in seen:
+            seen[name] += 1
+            unique.append(f"{name}_{seen[name]}")
+        else:
+            seen[name] = 1
+            unique.append(name)
+    return unique
+
+
+class ArrowResultTable:
+    """The result of execute(fetch=True), held as a pyarrow.Table.
+
+    Macros expect an agate.Table, but building one means creating a Python
+    object per cell and running type inference over all of them. This wraps
+    the Arrow table instead, and only builds the agate.Table the first time
+    anything other than the row count or column names is used. Attribute
+    access is forwarded to that table, so it can be used wherever an
+    agate.Table is expected.
+
+    :attr pyarrow.Table arrow_table: The fetched result.
+    :param fix_rows: If set, applied to the rows of the Arrow table before
+        the agate.Table is built from them, like an adapter's process_results
+        is to the rows of its driver.
+    """
+
+    def __init__(
+        self,
+        arrow_table: "pyarrow.Table",
+        fix_rows: Optional[Callable[[List[Tuple[Any, ...]]], Iterable[Sequence[Any]]]] = None,
+    ) -> None:
+        self.arrow_table = arrow_table
+        self._fix_rows = fix_rows
+        self._agate_table = None
+
+    @property
+    def column_names(self) -> List[str]:
+        return _unique_column_names(self.arrow_table.column_names)
+
+    @property
+    def agate_table(self) -> "agate.Table":
+        """The agate.Table for this result, built on first use."""
+        if self._agate_table is None:
+            self._agate_table = self._build_agate_table()
+        return self._agate_table
+
+    def _build_agate_table(self) -> "agate.Table":
+        import agate
+        from dbt_common.clients.agate_helper import table_from_rows
+
+        column_names = self.column_names
+        columns = []
+        column_types: List[Optional[agate.DataType]] = []
+        for column in self.arrow_table.columns:
+            values = column.to_pylist()
+            if _is_nested(column.type):
+                # represent container types as json strings, like table_from_data_flat
+                values = [
+                    v if v is None else json.dumps(v, cls=ForgivingJSONEncoder) for v in values
+                ]
+            columns.append(values)
+            column_types.append(_agate_type(column.type))
+        rows: List[Any] = list(zip(*columns))
+        if self._fix_rows is not None:
+            rows = [tuple(row) for row in self._fix_rows(rows)]
+
+        if all(column_types):
+            # the arrow schema already says what each column is, so skip type
+            # inference, which would otherwise test every value
+            return agate.Table(rows, column_names, column_types=column_types)
+
+        text_only_columns = [
+            name
+            for name, column in zip(column_names, self.arrow_table.columns)
+            if _pyarrow_types().is_string(column.type) or _is_nested(column.type)
+        ]
+        return table_from_rows(rows, column_names, text_only_columns)
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for attributes not found on this instance. Never
+        # forward its own attributes, which are missing while unpickling.
+        if name.startswith("__") or name in ("arrow_table", "_fix_rows", "_agate_table"):
+            raise AttributeError(name)
+        return getattr(self.agate_table, name)
+
+    def __len__(self) -> int:
+        return self.arrow_table.num_rows
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.agate_table)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.agate_table[key]
+
+    def __repr__(self) -> str:
+        return f"<ArrowResultTable rows={self.arrow_table.num_rows} columns={self.column_names}>"
+
+
+def is_agate_table(value: Any) -> bool:
+    """Check if the value is an agate.Table, or an ArrowResultTable standing
+    in for one. Use this instead of checking for agate.Table directly.
+    """
+    import agate
+
+    return isinstance(value, (agate.Table, ArrowResultTable))
@@ -26,6 +26,7 @@ from dbt_common.events.functions import fire_event
 from dbt_common.exceptions import DbtInternalError, NotImplementedError
 from dbt_common.utils import cast_to_str
 
+from dbt.adapters.arrow import arrow_available
 from dbt.adapters.base.query_headers import MacroQueryStringSetter
 from dbt.adapters.contracts.connection import (
     AdapterRequiredConfig,
@@ -77,6 +78,19 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
         self.thread_connections: Dict[Hashable, Connection] = {}
         self.lock: RLock = mp_context.RLock()
         self.query_header: Optional[MacroQueryStringSetter] = None
+        # Set by the adapter after initialization via set_arrow_results_checker
+        self._arrow_results_checker: Optional[Callable[[], bool]] = None
+
+    def set_arrow_results_checker(self, checker: Callable[[], bool]) -> None:
+        self._arrow_results_checker = checker
+
+    def _should_fetch_arrow_results(self) -> bool:
+        """Check if fetched results should be returned as an Arrow-backed
+        table, when the driver can produce one.
+        """
+        if self._arrow_results_checker is None or not self._arrow_results_checker():
+            return False
+        return arrow_available()
 
     def set_query_header(self, query_header_context: Dict[str, Any]) -> None:
         self.query_header = MacroQueryStringSetter(self.profile, query_header_context)
@@ -1,11 +1,14 @@
 import abc
+import os
+import threading
 import time
-from concurrent.futures import as_completed, Future
+from concurrent.futures import as_completed, Future, InvalidStateError
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from importlib import import_module
+from itertools import islice
 from multiprocessing.context import SpawnContext
 from typing import (
     Any,
@@ -61,7 +64,10 @@ from dbt_common.utils import (
     executor,
     filter_null_values,
 )
+from dbt_common.utils.executor import ConnectingExecutor
+from dbt_common.utils.formatting import lowercase
 
+from dbt.adapters.arrow import is_agate_table
 from dbt.adapters.base.column import Column as BaseColumn
 from dbt.adapters.base.connections import (
     AdapterResponse,
@@ -87,6 +93,7 @@ from dbt.adapters.catalogs import (
     CatalogWriteIntegrationConfig,
     CATALOG_INTEGRATION_MODEL_CONFIG_NAME,
 )
+from dbt.adapters.column_cache import ColumnCache
 from dbt.adapters.contracts.connection import Credentials
 from dbt.adapters.contracts.macros import MacroResolverProtocol
 from dbt.adapters.contracts.relation import RelationConfig
@@ -110,6 +117,7 @@ from dbt.adapters.exceptions import (
     SnapshotTargetNotSnapshotTableError,
     UnexpectedNonTimestampError,
 )
+from dbt.adapters.persistent_cache import PersistentRelationsCache
 from dbt.adapters.protocol import AdapterConfig, MacroContextGeneratorCallable
 from dbt.adapters.events.logging import AdapterLogger
 
@@ -133,6 +141,41 @@ DEFAULT_BASE_BEHAVIOR_FLAGS = [
         "default": False,
         "docs_url": "",
     },
+    {
+        "name": "enable_persistent_relations_cache",
+        "default": False,
+        "docs_url": "",
+    },
+    {
+        "name": "enable_lazy_relations_cache",
+        "default": False,
+        "docs_url": "",
+    },
+    {
+        "name": "spill_fetched_results_to_disk",
+        "default": False,
+        "docs_url": "",
+    },
+    {
+        "name": "enable_arrow_fetch_results",
+        "default": False,
+        "docs_url": "",
+    },
+    {
+        "name": "enable_bulk_seed_loading",
+        "default": False,
+        "docs_url": "",
+    },
+    {
+        "name": "enable_column_cache",
+        "default": False,
+        "docs_url": "",
+    },
+    {
+        "name": "enable_column_prefetch",
+        "default": False,
+        "docs_url": "",
+    },
 ]
 
 
@@ -149,19 +192,19 @@ def _parse_callback_empty_table(*args, **kwargs) -> Tuple[str, "agate.Table"]:
     return "", empty_table()
 
 
-def _expect_row_value(key: str, row: "agate.Row"):
-    if key not in row.keys():
+def _expect_column_index(key: str, table: "agate.Table") -> int:
+    if key not in table.column_names:
         raise DbtInternalError(
-            'Got a row without "{}" column, columns: {}'.format(key, row.keys())
+            'Got a row without "{}" column, columns: {}'.format(key, table.column_names)
         )
-    return row[key]
+    return table.column_names.index(key)
 
 
 def _catalog_filter_schemas(
     used_schemas: FrozenSet[Tuple[str, str]]
-) -> Callable[["agate.Row"], bool]:
-    """Return a function that takes a row and decides if the row should be
-    included in the catalog output.
+) -> Callable[[Any, Any], bool]:
+    """Return a function that takes a row's table_database and table_schema
+    and decides if the row should be included in the catalog output.
     """
     schemas = frozenset(
         (d.lower(), s.lower()) for d, s in used_schemas if d is not None and s is not None
@@ -171,18 +214,16 @@ def _catalog_filter_schemas(
             f"used_schemas contains None for either database or schema, skipping {null_schemas}"
         )
 
-    def test(row: "agate.Row") -> bool:
-        table_database = _expect_row_value("table_database", row)
-        table_schema = _expect_row_value("table_schema", row)
+    def test(table_database: Any, table_schema: Any) -> bool:
         # the schema may be present but None, which is not an error and should
         # be filtered out
-
         if table_schema is None:
             return False
         if table_database is None:
             logger.debug(f"table_database is None, skipping {table_schema}")
             return False
-        return (table_database.lower(), table_schema.lower()) in schemas
+        # database and schema names may have been inferred as numbers
+        return (str(table_database).lower(), str(table_schema).lower()) in schemas
 
     return test
 
@@ -210,6 +251,12 @@ def _relation_name(rel: Optional[BaseRelation]) -> str:
         return str(rel)
 
 
+def _schema_key(
+    database: Optional[str], schema: Optional[str]
+) -> Tuple[Optional[str], Optional[str]]:
+    return lowercase(database), lowercase(schema)
+
+
 def _config_get(config: Any, key: str) -> Any:
     """Read ``key`` from a node config that may not be dict-like.
 
@@ -350,6 +397,16 @@ class BaseAdapter(metaclass=AdapterMeta):
         self._macro_context_generator: Optional[MacroContextGeneratorCallable] = None
         self.behavior = DEFAULT_BASE_BEHAVIOR_FLAGS  # type: ignore
         self._catalog_client = CatalogIntegrationClient(self.CATALOG_INTEGRATIONS)
+        self.connections.set_arrow_results_checker(
+            lambda: self.behavior.enable_arrow_fetch_results.no_warn
+        )
+        self._persistent_cache: Optional[PersistentRelationsCache] = None
+        # schemas whose cached relations are being (re)listed in the background
+        # or on first use, keyed by lowercased (database, schema)
+        self._pending_cache_schemas: Dict[Tuple[Optional[str], Optional[str]], Future] = {}
+        self._pending_cache_schemas_lock = threading.Lock()
+        self._column_cache = ColumnCache()
+        self._cache_executor: Optional[ConnectingExecutor] = None
 
     def add_catalog_integration(
         self, catalog_integration: CatalogIntegrationConfig
@@ -466,6 +523,8 @@ class BaseAdapter(metaclass=AdapterMeta):
         self.connections.release()
 
     def cleanup_connections(self) -> None:
+        self._persist_relations_cache()
+        self._clear_column_cache()
         self.connections.cleanup_all()
 
     def clear_transaction(self) -> None:
@@ -521,7 +580,15 @@ class BaseAdapter(metaclass=AdapterMeta):
         :return: A tuple of the query status and results (empty if fetch=False).
         :rtype: Tuple[AdapterResponse, "agate.Table"]
         """
-        return self.connections.execute(sql=sql, auto_begin=auto_begin, fetch=fetch, limit=limit)
+        try:
+            return self.connections.execute(
+                sql=sql, auto_begin=auto_begin, fetch=fetch, limit=limit
+            )
+        finally:
+            # after the statement ran, so columns fetched while it was running
+            # are not cached either
+            if self.behavior.enable_column_cache.no_warn:
+                self._column_cache.invalidate_statement(sql)
 
     def validate_sql(self, sql: str) -> AdapterResponse:
         """Submit the given SQL to the engine for validation, but not execution.
@@ -589,6 +656,7 @@ class BaseAdapter(metaclass=AdapterMeta):
     ###
     def _schema_is_cached(self, database: Optional[str], schema: str) -> bool:
         """Check if the schema is cached, and by default logs if it is not."""
+        self._wait_for_cache_schema(database, schema)
 
         if (database, schema) not in self.cache:
             fire_event(
@@ -663,32 +731,321 @@ class BaseAdapter(metaclass=AdapterMeta):
         """
         if not cache_schemas:
             cache_schemas = self._get_cache_schemas(relation_configs)
+
+        persistent_cache = self._get_persistent_relations_cache()
+        signals: Dict[Tuple[Optional[str], Optional[str]], str] = {}
+        schemas_to_list: Set[BaseRelation] = cache_schemas
+        if persistent_cache is not None:
+            schemas_to_list = self._hydrate_relations_cache(persistent_cache, cache_schemas)
+            if schemas_to_list:
+                # read the signals before listing, so a change made in between
+                # is caught on the next run rather than missed
+                signals = self._read_relations_cache_signals(schemas_to_list)
+
+        prefetch_columns = (
+            self.behavior.enable_column_cache.no_warn
+            and self.behavior.enable_column_prefetch.no_warn
+        )
         with executor(self.config) as tpe:
-            futures: List[Future[List[BaseRelation]]] = []
-            for cache_schema in cache_schemas:
+            futures: Dict[Future[List[BaseRelation]], BaseRelation] = {}
+            for cache_schema in schemas_to_list:
                 fut = tpe.submit_connected(
                     self,
                     f"list_{cache_schema.database}_{cache_schema.schema}",
                     self.list_relations_without_caching,
                     cache_schema,
                 )
-                futures.append(fut)
+                futures[fut] = cache_schema
+                if prefetch_columns:
+                    # waited on when the executor shuts down, and never raises
+                    tpe.submit_connected(
+                        self,
+                        f"columns_{cache_schema.database}_{cache_schema.schema}",
+                        self._prefetch_columns_in_schema,
+                        cache_schema,
+                    )
 
             for future in as_completed(futures):
                 # if we can't read the relations we need to just raise anyway,
                 # so just call future.result() and let that raise on failure
-                for relation in future.result():
+                relations = future.result()
+                for relation in relations:
                     self.cache.add(relation)
+                if persistent_cache is not None:
+                    cache_schema = futures[future]
+                    persistent_cache.update(
+                        cache_schema.database,
+                        cache_schema.schema,
+                        relations,
+                        signals.get(_schema_key(cache_schema.database, cache_schema.schema)),
+                    )
 
         # it's possible that there were no relations in some schemas. We want
         # to insert the schemas we query into the cache's `.schemas` attribute
-        # so we can check it later
+        # so we can check it later. Hydrated schemas were added already, and
+        # may have been dropped again if revalidating them failed.
         cache_update: Set[Tuple[Optional[str], str]] = set()
-        for relation in cache_schemas:
+        for relation in schemas_to_list:
             if relation.schema:
                 cache_update.add((relation.database, relation.schema))
         self.cache.update_schemas(cache_update)
 
+    def _get_persistent_relations_cache(self) -> Optional[PersistentRelationsCache]:
+        """Get the on-disk relations cache for these credentials, loading it
+        on first use. Returns None unless the
+        `enable_persistent_relations_cache` behavior flag is set.
+        """
+        if not self.behavior.enable_persistent_relations_cache.no_warn:
+            return None
+
+        if self._persistent_cache is None:
+            unique_field = self.config.credentials.hashed_unique_field()
+            target_path = getattr(self.config, "project_target_path", self.config.target_path)
+            path = os.path.join(target_path, f"relations_cache_{unique_field}.json")
+            self._persistent_cache = PersistentRelationsCache(path, unique_field)
+            self._persistent_cache.load()
+        return self._persistent_cache
+
+    def _get_relations_cache_signals(
+        self, schemas: Iterable[BaseRelation]
+    ) -> Dict[Tuple[Optional[str], Optional[str]], str]:
+        """Get a cheap change signal for each of the given schemas, used to
+        decide whether a persisted schema can be trusted without listing it
+        again. A signal can be any string that changes whenever a relation in
+        the schema is created, dropped, renamed or replaced.
+
+        Keys are lowercased (database, schema) pairs. Schemas without a cheap
+        signal should be left out, and are always listed again. By default no
+        adapter has one.
+        """
+        return {}
+
+    def _read_relations_cache_signals(
+        self, schemas: Iterable[BaseRelation]
+    ) -> Dict[Tuple[Optional[str], Optional[str]], str]:
+        """Get the signals of the given schemas, or none if reading them
+        fails. Signals are optional, a schema without one is listed again.
+        """
+        try:
+            return self._get_relations_cache_signals(schemas)
+        except Exception as exc:
+            logger.debug(f"Could not read relations cache signals, listing all schemas: {exc}")
+            return {}
+
+    def _hydrate_relations_cache(
+        self, persistent_cache: PersistentRelationsCache, cache_schemas: Set[BaseRelation]
+    ) -> Set[BaseRelation]:
+        """Add the persisted relations for each schema to the cache, and start
+        revalidating them in the background. Returns the schemas that were not
+        persisted, and still need to be listed.
+        """
+        schemas_to_list: Set[BaseRelation] = set()
+        hydrated: List[BaseRelation] = []
+        for cache_schema in cache_schemas:
+            persisted = persistent_cache.get(cache_schema.database, cache_schema.schema)
+            if persisted is None or not cache_schema.schema:
+                persistent_cache.stats.misses += 1
+                schemas_to_list.add(cache_schema)
+                continue
+
+            _, relations = persisted
+            for relation in relations:
+                self.cache.add(self.Relation.from_dict(relation))
+            self.cache.update_schemas([(cache_schema.database, cache_schema.schema)])
+
+            key = _schema_key(cache_schema.database, cache_schema.schema)
+            with self._pending_cache_schemas_lock:
+                self._pending_cache_schemas[key] = Future()
+            hydrated.append(cache_schema)
+
+        if hydrated:
+            try:
+                if self._cache_executor is None:
+                    self._cache_executor = executor(self.config)
+                self._cache_executor.submit_connected(
+                    self,
+                    "revalidate_relations_cache",
+                    self._revalidate_relations_cache,
+                    persistent_cache,
+                    hydrated,
+                )
+            except BaseException as exc:
+                self._discard_hydrated_cache_schemas(hydrated, exc)
+                raise
+
+        return schemas_to_list
+
+    def _revalidate_relations_cache(
+        self, persistent_cache: PersistentRelationsCache, schemas: List[BaseRelation]
+    ) -> None:
+        """Compare the persisted signal of each hydrated schema with its
+        current signal, and list the schemas that changed again.
+
+        Every schema's pending future is resolved, by this task or by the
+        listing it starts, even if either fails. Otherwise anything waiting
+        on the schema would block forever. A schema that could not be
+        revalidated is dropped from the cache, and listed again on demand.
+        """
+        try:
+            signals = self._read_relations_cache_signals(schemas)
+            for cache_schema in schemas:
+                key = _schema_key(cache_schema.database, cache_schema.schema)
+                persisted = persistent_cache.get(cache_schema.database, cache_schema.schema)
+                signal = signals.get(key)
+                if signal is not None and persisted is not None and persisted[0] == signal:
+                    persistent_cache.stats.hits += 1
+                    self._resolve_hydrated_cache_schema(key)
+                    continue
+
+                persistent_cache.stats.stale += 1
+                assert self._cache_executor is not None
+                self._cache_executor.submit_connected(
+                    self,
+                    f"list_{cache_schema.database}_{cache_schema.schema}",
+                    self._refresh_cached_schema,
+                    persistent_cache,
+                    cache_schema,
+                    signal,
+                )
+        except BaseException as exc:
+            self._discard_hydrated_cache_schemas(schemas, exc)
+            raise
+
+    def _refresh_cached_schema(
+        self,
+        persistent_cache: PersistentRelationsCache,
+        cache_schema: BaseRelation,
+        signal: Optional[str],
+    ) -> None:
+        """List a hydrated schema again, and replace its cached relations."""
+        key = _schema_key(cache_schema.database, cache_schema.schema)
+        try:
+            relations = self.list_relations_without_caching(cache_schema)
+            self.cache.replace_schema(cache_schema.database, cache_schema.schema, relations)
+            persistent_cache.update(cache_schema.database, cache_schema.schema, relations, signal)
+        except BaseException as exc:
+            self._discard_hydrated_cache_schemas([cache_schema], exc)
+            if not isinstance(exc, Exception):
+                raise
+            return
+        self._resolve_hydrated_cache_schema(key)
+
+    def _resolve_hydrated_cache_schema(self, key: Tuple[Optional[str], Optional[str]]) -> None:
+        """Wake up anything waiting on a hydrated schema, once it has been
+        revalidated.
+        """
+        with self._pending_cache_schemas_lock:
+            future = self._pending_cache_schemas.get(key)
+        if future is None or future.done():
+            return
+        try:
+            future.set_result(None)
+        except InvalidStateError:
+            # resolved by a failed revalidation in the meantime
+            pass
+
+    def _discard_hydrated_cache_schemas(
+        self, schemas: Iterable[BaseRelation], exc: BaseException
+    ) -> None:
+        """Drop the given hydrated schemas from the cache after revalidating
+        them failed, unless they were already resolved. The next lookup in
+        such a schema lists it again, instead of trusting its persisted
+        relations or raising exc for the rest of the run.
+        """
+        for cache_schema in schemas:
+            key = _schema_key(cache_schema.database, cache_schema.schema)
+            with self._pending_cache_schemas_lock:
+                future = self._pending_cache_schemas.get(key)
+            if future is None or future.done():
+                continue
+            logger.debug(
+                f"Could not revalidate the cached relations in {cache_schema}, "
+                f"listing it again when needed: {exc}"
+            )
+            # anything looking the schema up is still waiting on the future
+            self.cache.drop_schema(cache_schema.database, cache_schema.schema)
+            with self._pending_cache_schemas_lock:
+                if self._pending_cache_schemas.get(key) is future:
+                    del self._pending_cache_schemas[key]
+            try:
+                future.set_result(None)
+            except InvalidStateError:
+                # resolved by its revalidation in the meantime
+                pass
+
+    def _wait_for_cache_schema(self, database: Optional[str], schema: Optional[str]) -> None:
+        """Block until the schema is no longer being populated in the
+        background, raising if populating it failed.
+        """
+        if not self._pending_cache_schemas:
+            return
+        future = self._pending_cache_schemas.get(_schema_key(database, schema))
+        if future is not None:
+            future.result()
+
+    def _finish_cache_listing(
+        self,
+        key: Tuple[Optional[str], Optional[str]],
+        listing: Future,
+        exc: Optional[BaseException] = None,
+    ) -> None:
+        """Stop tracking a schema listed by `list_relations`, and wake up any
+        threads waiting on it. A failed listing is not remembered, so the
+        next miss lists the schema again.
+        """
+        with self._pending_cache_schemas_lock:
+            if self._pending_cache_schemas.get(key) is listing:
+                del self._pending_cache_schemas[key]
+        if exc is None:
+            listing.set_result(None)
+        else:
+            listing.set_exception(exc)
+
+    def _link_lazily_cached_schema(self, schema_relation: BaseRelation) -> None:
+        """Add the links between relations for a schema that was just listed
+        on demand, when the `enable_lazy_relations_cache` behavior flag is
+        set. Adapters that link cached relations in `_relations_cache_for_schemas`
+        should override this, since that is skipped in lazy mode. By default
+        nothing is linked.
+        """
+        pass
+
+    def _invalidate_persisted_schema(self, relation: BaseRelation) -> None:
+        """Wait for the relation's schema to be populated, then mark it as
+        modified by this run so the next run lists it again.
+        """
+        self._wait_for_cache_schema(relation.database, relation.schema)
+        if self._persistent_cache is not None:
+            self._persistent_cache.invalidate(relation.database, relation.schema)
+
+    def _is_unlisted_lazy_schema(self, relation: BaseRelation) -> bool:
+        """Check if the relation's schema has not been listed yet, when the
+        `enable_lazy_relations_cache` behavior flag is set. Relations in such a
+        schema are left out of the cache, as adding one would mark the schema as
+        cached with only that relation in it. The whole schema is listed the
+        first time it is needed instead.
+        """
+        return (
+            self.behavior.enable_lazy_relations_cache.no_warn
+            and (relation.database, relation.schema) not in self.cache
+        )
+
+    def _persist_relations_cache(self) -> None:
+        """Wait for any background revalidation to finish, then write the
+        relations cache to disk.
+        """
+        if self._cache_executor is not None:
+            self._cache_executor.shutdown(wait=True)
+            self._cache_executor = None
+
+        if self._persistent_cache is not None:
+            self._persistent_cache.save(self.cache)
+            stats = self._persistent_cache.stats
+            logger.debug(
+                f"Persistent relations cache: {stats.hits} hits, {stats.misses} misses, "
+                f"{stats.stale} stale"
+            )
+
     def set_relations_cache(
         self,
         relation_configs: Iterable[RelationConfig],
@@ -697,10 +1054,18 @@ class BaseAdapter(metaclass=AdapterMeta):
     ) -> None:
         """Run a query that gets a populated cache of the relations in the
         database and set the cache on this adapter.
+
+        If the `enable_lazy_relations_cache` behavior flag is set, no schemas
+        are listed up front. Each schema is instead listed the first time
+        `list_relations` misses it.
         """
         with self.cache.lock:
             if clear:
                 self.cache.clear()
+                with self._pending_cache_schemas_lock:
+                    self._pending_cache_schemas.clear()
+            if self.behavior.enable_lazy_relations_cache.no_warn:
+                return
             self._relations_cache_for_schemas(relation_configs, required_schemas)
 
     @auto_record_function("AdapterCacheAdded", group="Available")
@@ -710,7 +1075,10 @@ class BaseAdapter(metaclass=AdapterMeta):
         if relation is None:
             name = self.nice_connection_name()
             raise NullRelationCacheAttemptedError(name)
-        self.cache.add(relation)
+        self._invalidate_persisted_schema(relation)
+        if not self._is_unlisted_lazy_schema(relation):
+            self.cache.add(relation)
+        self._column_cache.invalidate(relation)
         # so jinja doesn't render things
         return ""
 
@@ -723,7 +1091,9 @@ class BaseAdapter(metaclass=AdapterMeta):
         if relation is None:
             name = self.nice_connection_name()
             raise NullRelationDropAttemptedError(name)
+        self._invalidate_persisted_schema(relation)
         self.cache.drop(relation)
+        self._column_cache.invalidate(relation)
         return ""
 
     @auto_record_function("AdapterCacheRenamed", group="Available")
@@ -742,9 +1112,69 @@ class BaseAdapter(metaclass=AdapterMeta):
             dst_name = _relation_name(to_relation)
             raise RenameToNoneAttemptedError(src_name, dst_name, name)
 
-        self.cache.rename(from_relation, to_relation)
+        self._invalidate_persisted_schema(from_relation)
+        self._invalidate_persisted_schema(to_relation)
+        if self._is_unlisted_lazy_schema(to_relation):
+            self.cache.drop(from_relation)
+        else:
+            self.cache.rename(from_relation, to_relation)
+        self._column_cache.invalidate(from_relation)
+        self._column_cache.invalidate(to_relation)
         return ""
 
+    @available
+    def invalidate_cached_columns(self, relation: Optional[BaseRelation]) -> str:
+        """Forget the cached columns of a relation, after changing them in a
+        way the adapter can't see, like through an API.
+        """
+        self._column_cache.invalidate(relation)
+        return ""
+
+    def _cached_columns_in_relation(
+        self, relation: BaseRelation, get_columns: Callable[[], List[BaseColumn]]
+    ) -> List[BaseColumn]:
+        """Get the columns of a relation from the column cache, if the
+        `enable_column_cache` behavior flag is set, or with get_columns.
+
+        Implementations of get_columns_in_relation wrap the lookup with this.
+        """
+        if not self.behavior.enable_column_cache.no_warn:
+            return get_columns()
+        return self._column_cache.get_or_fetch(relation, get_columns)
+
+    def _prefetch_columns_in_schema(self, schema_relation: BaseRelation) -> None:
+        """Seed the column cache with the columns of every relation in a
+        schema, fetched with get_columns_in_schema. This only saves queries,
+        so failing to is logged rather than raised, and the columns are
+        looked up per relation instead.
+        """
+
+        def fetch() -> List[Tuple[BaseRelation, List[BaseColumn]]]:
+            columns_by_identifier = self.get_columns_in_schema(schema_relation)
+            if columns_by_identifier is None:
+                return []
+            return [
+                (schema_relation.incorporate(path={"identifier": identifier}), columns)
+                for identifier, columns in columns_by_identifier.items()
+            ]
+
+        try:
+            count = self._column_cache.prefetch(fetch)
+        except Exception as exc:
+            logger.debug(f"Could not prefetch the columns in {schema_relation}: {exc}")
+            return
+        logger.debug(f"Prefetched the columns of {count} relations in {schema_relation}")
+
+    def _clear_column_cache(self) -> None:
+        stats = self._column_cache.stats
+        if stats.hits or stats.misses:
+            logger.debug(
+                f"Column cache: {stats.hits} hits (metadata queries saved), "
+                f"{stats.misses} misses, {stats.invalidations} invalidations, "
+                f"{stats.prefetched} prefetched"
+            )
+        self._column_cache = ColumnCache()
+
     ###
     # Abstract methods for database-specific values, attributes, and types
     ###
@@ -821,6 +1251,19 @@ class BaseAdapter(metaclass=AdapterMeta):
         """Get a list of the columns in the given Relation."""
         raise NotImplementedError("`get_columns_in_relation` is not implemented for this adapter!")
 
+    def get_columns_in_schema(
+        self, schema_relation: BaseRelation
+    ) -> Optional[Dict[str, List[BaseColumn]]]:
+        """Get the columns of every relation in a schema, by identifier, with
+        as few queries as possible. Used to prefetch columns into the column
+        cache when the `enable_column_prefetch` behavior flag is set.
+
+        Relations left out are looked up with get_columns_in_relation as
+        usual. Returns None if the adapter can't list the columns of a schema,
+        which is the default.
+        """
+        return None
+
     @record_function(
         AdapterGetPseudocolumnsForRelationRecord,
         method=True,
@@ -1055,20 +1498,43 @@ class BaseAdapter(metaclass=AdapterMeta):
             quote_policy=self.config.quoting,
         ).without_identifier()
 
-        # we can't build the relations cache because we don't have a
-        # manifest so we can't run any operations.
-        relations = self.list_relations_without_caching(schema_relation)
+        # another thread may have missed this schema at the same time. Only
+        # one of them lists it, and the others wait for it to be cached.
+        key = _schema_key(database, schema)
+        with self._pending_cache_schemas_lock:
+            pending = self._pending_cache_schemas.get(key)
+            if pending is None or pending.done():
+                if (database, schema) in self.cache:
+                    return self.cache.get_relations(database, schema)
+                listing: Future = Future()
+                self._pending_cache_schemas[key] = listing
+                pending = None
+        if pending is not None:
+            pending.result()
+            # the schema is listed again if it was dropped while waiting
+            return self.list_relations(database, schema)
 
-        # if the cache is already populated, add this schema in
-        # otherwise, skip updating the cache and just ignore
-        if self.cache:
-            for relation in relations:
-                self.cache.add(relation)
-            if not relations:
-                # it's possible that there were no relations in some schemas. We want
-                # to insert the schemas we query into the cache's `.schemas` attribute
-                # so we can check it later
-                self.cache.update_schemas([(database, schema)])
+        try:
+            # we can't build the relations cache because we don't have a
+            # manifest so we can't run any operations.
+            relations = self.list_relations_without_caching(schema_relation)
+
+            # if the cache is already populated, add this schema in
+            # otherwise, skip updating the cache and just ignore
+            if self.cache:
+                for relation in relations:
+                    self.cache.add(relation)
+                if not relations:
+                    # it's possible that there were no relations in some schemas. We want
+                    # to insert the schemas we query into the cache's `.schemas` attribute
+                    # so we can check it later
+                    self.cache.update_schemas([(database, schema)])
+                if self.behavior.enable_lazy_relations_cache.no_warn:
+                    self._link_lazily_cached_schema(schema_relation)
+        except BaseException as exc:
+            self._finish_cache_listing(key, listing, exc)
+            raise
+        self._finish_cache_listing(key, listing)
 
         fire_event(
             ListRelations(
@@ -1116,9 +1582,34 @@ class BaseAdapter(metaclass=AdapterMeta):
 
         return matches
 
+    def _get_cached_relation(
+        self, database: str, schema: str, identifier: str
+    ) -> Optional[BaseRelation]:
+        """Look up an exact match for the given path directly in the cache,
+        without listing and scanning every relation in the schema. Returns
+        None if the schema is not cached or there is no exact match, in which
+        case callers should fall back to the full search.
+        """
+        if schema is None or identifier is None:
+            return None
+        self._wait_for_cache_schema(database, schema)
+        if (database, schema) not in self.cache:
+            return None
+
+        search = self._make_match_kwargs(database, schema, identifier)
+        relation = self.cache.get_relation(
+            search.get("database"), search.get("schema"), search.get("identifier")
+        )
+        if relation is not None and relation.matches(**search):
+            return relation
+        return None
+
     @auto_record_function("AdapterGetRelation", group="Available")
     @available.parse_none
     def get_relation(self, database: str, schema: str, identifier: str) -> Optional[BaseRelation]:
+        cached_relation = self._get_cached_relation(database, schema, identifier)
+        if cached_relation is not None:
+            return cached_relation
 
         relations_list = self.list_relations(database, schema)
 
@@ -1210,6 +1701,57 @@ class BaseAdapter(metaclass=AdapterMeta):
         else:
             return column
 
+    @available.parse_none
+    def bulk_load_csv_rows(
+        self, relation: BaseRelation, agate_table: "agate.Table", column_names_csv: str
+    ) -> Optional[str]:
+        """Load the rows of a seed into its (existing, empty) table through the
+        database's native bulk load path, rather than batches of inserts.
+
+        Seed materializations call this when the enable_bulk_seed_loading
+        behavior flag is set.
+
+        :param relation: The seed's table.
+        :param agate_table: The rows to load.
+        :param column_names_csv: The quoted column names, as in
+            get_seed_column_quoted_csv.
+        :return: The statement that loaded the rows, or None if the adapter
+            has no bulk load path, or it isn't configured. The caller then
+            falls back to batched inserts.
+        """
+        return None
+
+    @available
+    def seed_insert_batches(
+        self,
+        agate_table: "agate.Table",
+        batch_size: int,
+        placeholders: Union[str, List[str]],
+    ) -> Iterator[Tuple[str, List[Any]]]:
+        """Split the rows of a seed into batches for insert ... values
+        statements.
+
+        For each batch this yields the list of row placeholders that follows
+        'values', like '(%s,%s),(%s,%s)', and the bindings for them, flattened
+        row by row. The placeholders are built once, and reused for every
+        full batch.
+
+        :param agate_table: The rows to insert.
+        :param batch_size: The most rows per batch.
+        :param placeholders: The placeholder for a value, e.g. '%s', or a
+            list with the placeholder for each column.
+        """
+        if isinstance(placeholders, str):
+            placeholders = [placeholders] * len(agate_table.column_names)
+        row_sql = "(" + ",".join(placeholders) + ")"
+        batch_sql = ",".join([row_sql] * batch_size)
+
+        rows = iter(agate_table.rows)
+        while batch := list(islice(rows, batch_size)):
+            if len(batch) < batch_size:
+                batch_sql = ",".join([row_sql] * len(batch))
+            yield batch_sql, [value for row in batch for value in row]
+
     ###
     # Conversions: These must be implemented by concrete implementations, for
     # converting agate types into their sql equivalents.
@@ -1403,9 +1945,25 @@ class BaseAdapter(metaclass=AdapterMeta):
         """
         from dbt_common.clients.agate_helper import table_from_rows
 
-        # force database + schema to be strings
-        table = table_from_rows(
-            table.rows,
+        rows = []
+        if len(table) > 0:
+            database_index = _expect_column_index("table_database", table)
+            schema_index = _expect_column_index("table_schema", table)
+            test = _catalog_filter_schemas(used_schemas)
+            # every column of every relation in a schema shares the same
+            # (database, schema), so only test each distinct pair once
+            included: Dict[Tuple[Any, Any], bool] = {}
+            for row in table.rows:
+                key = (row[database_index], row[schema_index])
+                keep = included.get(key)
+                if keep is None:
+                    keep = included[key] = test(*key)
+                if keep:
+                    rows.append(row)
+
+        # build the filtered table once, forcing database + schema to be strings
+        return table_from_rows(
+            rows,
             table.column_names,
             text_only_columns=[
                 "table_database",
@@ -1419,7 +1977,6 @@ class BaseAdapter(metaclass=AdapterMeta):
                 "column_comment",
             ],
         )
-        return table.where(_catalog_filter_schemas(used_schemas))
 
     def _get_one_catalog(
         self,
@@ -1476,15 +2033,22 @@ class BaseAdapter(metaclass=AdapterMeta):
                 )
                 for r in relations
             }
+            indexes = [
+                _expect_column_index(key, catalogs)
+                for key in ("table_database", "table_schema", "table_name")
+            ]
+            # a relation has one row per column, so only casefold and test
+            # each distinct relation once
+            included: Dict[Tuple[Any, ...], bool] = {}
 
             def in_map(row: "agate.Row"):
-                d = _expect_row_value("table_database", row)
-                s = _expect_row_value("table_schema", row)
-                i = _expect_row_value("table_name", row)
-                d = d.casefold() if d is not None else None
-                s = s.casefold() if s is not None else None
-                i = i.casefold() if i is not None else None
-                return (d, s, i) in relation_map
+                key = tuple(row[index] for index in indexes)
+                keep = included.get(key)
+                if keep is None:
+                    keep = included[key] = (
+                        tuple(v.casefold() if v is not None else None for v in key) in relation_map
+                    )
+                return keep
 
             catalogs = catalogs.where(in_map)
 
@@ -1546,11 +2110,9 @@ class BaseAdapter(metaclass=AdapterMeta):
         macro_resolver: Optional[MacroResolverProtocol] = None,
     ) -> Tuple[Optional[AdapterResponse], FreshnessResponse]:
         """Execute and process a freshness macro to generate a FreshnessResponse"""
-        import agate
-
         result = self.execute_macro(macro_name, kwargs=kwargs, macro_resolver=macro_resolver)
 
-        if isinstance(result, agate.Table):
+        if is_agate_table(result):
             warn_or_error(CollectFreshnessReturnSignature())
             table = result
             adapter_response = None
@@ -1812,6 +2374,8 @@ class BaseAdapter(metaclass=AdapterMeta):
             parsed_model, self.connections.profile.credentials
         )
         submission_result = job_helper.submit(compiled_code)
+        # the job creates or replaces the model outside of any SQL dbt can see
+        self._column_cache.clear()
         # process submission result to generate adapter response
         return self.generate_python_submission_response(submission_result)
 
@@ -2099,13 +2663,62 @@ join diff_count using (id)
 """.strip()
 
 
+class _CatalogAccumulator:
+    """Collects catalog tables as they arrive into a single list of rows.
+
+    The column names and types are taken from the first non-empty table. Later
+    tables with the same columns (the usual case, since every shard goes
+    through the same catalog macro and _catalog_filter_table) have their rows
+    appended as is. Only a table whose columns differ falls back to
+    merge_tables to reconcile the column types.
+    """
+
+    def __init__(self) -> None:
+        self.rows: List["agate.Row"] = []
+        self.column_names: Tuple[str, ...] = ()
+        self.column_types: Tuple["agate.data_types.DataType", ...] = ()
+
+    def _matches(self, table: "agate.Table") -> bool:
+        # agate data types don't define equality, so compare their classes
+        return tuple(table.column_names) == self.column_names and [
+            type(t) for t in table.column_types
+        ] == [type(t) for t in self.column_types]
+
+    def add(self, table: "agate.Table") -> None:
+        from dbt_common.clients.agate_helper import merge_tables
+
+        if not self.column_names:
+            self.column_names = tuple(table.column_names)
+            self.column_types = tuple(table.column_types)
+            self.rows.extend(table.rows)
+        elif self._matches(table):
+            self.rows.extend(table.rows)
+        else:
+            merged = merge_tables([self.table(), table])
+            self.column_names = tuple(merged.column_names)
+            self.column_types = tuple(merged.column_types)
+            self.rows = list(merged.rows)
+
+    def table(self) -> "agate.Table":
+        import agate
+        from dbt_common.clients.agate_helper import Integer, empty_table
+
+        if not self.column_names:
+            return empty_table()
+        # like merge_tables, a column that is null in every row has no type
+        # of its own, and becomes an Integer
+        column_types = tuple(
+            Integer() if all(row[i] is None for row in self.rows) else column_type
+            for i, column_type in enumerate(self.column_types)
+        )
+        # _is_fork to tell agate that we already made things into `Row`s.
+        return agate.Table(self.rows, self.column_names, column_types, _is_fork=True)
+
+
 def catch_as_completed(
     futures,  # typing: List[Future["agate.Table"]]
 ) -> Tuple["agate.Table", List[Exception]]:
-    from dbt_common.clients.agate_helper import merge_tables
-
-    # catalogs: "agate.Table" =".Table(rows=[])
-    tables: List["agate.Table"] = []
+    catalogs = _CatalogAccumulator()
     exceptions: List[Exception] = []
 
     for future in as_completed(futures):
@@ -2117,11 +2730,11 @@ def catch_as_completed(
             # Empty results cause agate to infer text columns (e.g. column_name)
             # as Number, which conflicts with Text when merged with non-empty tables.
             if len(catalog) > 0:
-                tables.append(catalog)
+                catalogs.add(catalog)
         elif isinstance(exc, KeyboardInterrupt) or not isinstance(exc, Exception):
             raise exc
         else:
             warn_or_error(CatalogGenerationError(exc=str(exc)))
             # exc is not None, derives from Exception, and isn't ctrl+c
             exceptions.append(exc)
-    return merge_tables(tables), exceptions
+    return catalogs.table(), exceptions
@@ -0,0 +1,132 @@
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from dbt.adapters.contracts.connection import Credentials
+from dbt.adapters.events.logging import AdapterLogger
+
+
+AdapterHandle = Any
+
+
+def pool_key(credentials: Credentials) -> str:
+    """A key for the handles opened with the given credentials. Handles are
+    only ever shared between connections with identical credentials.
+    """
+    contents = json.dumps(credentials.to_dict(), sort_keys=True, default=str)
+    return hashlib.sha256(contents.encode("utf-8")).hexdigest()
+
+
+class HandlePool:
+    """Open database handles kept between nodes, so the next connection a
+    thread opens can reuse one, rather than connecting and authenticating
+    again.
+
+    Handles are kept per pool_key, most recently released first. Each key
+    keeps at most the max_size given on release. A handle that has been idle
+    for longer than the idle_timeout given on acquire is closed rather than
+    reused.
+
+    Hits and misses are counted, and reported through the adapter's debug
+    events.
+
+    :param adapter_type: The adapter's type, used in log messages.
+    :param close: Closes a handle that is dropped from the pool.
+    """
+
+    def __init__(self, adapter_type: str, close: Callable[[AdapterHandle], None]) -> None:
+        self._logger = AdapterLogger(adapter_type.capitalize())
+        self._close = close
+        self._lock = threading.Lock()
+        # (released at, handle), oldest first
+        self._idle: Dict[str, List[Tuple[float, AdapterHandle]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def acquire(
+        self,
+        key: str,
+        idle_timeout: float,
+        check: Optional[Callable[[AdapterHandle, float], bool]] = None,
+    ) -> Optional[AdapterHandle]:
+        """Take an idle handle out of the pool, or return None if there is
+        none to reuse.
+
+        :param key: The pool_key of the connection's credentials.
+        :param idle_timeout: Close handles idle for longer than this many
+            seconds, instead of reusing them.
+        :param check: Called with a handle and the seconds it has been idle,
+            before reusing it. A handle it returns False for is closed.
+        """
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                if not idle:
+                    self.misses += 1
+                    hits, misses = self.hits, self.misses
+                    break
+                released_at, handle = idle.pop()
+            idle_seconds = time.monotonic() - released_at
+
+            if idle_seconds > idle_timeout:
+                self._discard(handle, f"idle for {idle_seconds:.0f}s")
+                continue
+            if check is not None and not self._safe_check(check, handle, idle_seconds):
+                self._discard(handle, "failed its check")
+                continue
+
+            with self._lock:
+                self.hits += 1
+                hits, misses = self.hits, self.misses
+            self._logger.debug(
+                f"Reusing a pooled connection, idle for {idle_seconds:.1f}s "
+                f"(pool hits: {hits}, misses: {misses})"
+            )
+            return handle
+
+        self._logger.debug(f"No pooled connection to reuse (pool hits: {hits}, misses: {misses})")
+        return None
+
+    def release(self, key: str, handle: AdapterHandle, max_size: int) -> bool:
+        """Put a handle back into the pool. The caller must have checked that
+        it is open, and has no transaction in progress.
+
+        :return: False if the pool for the key is full. The handle is not
+            taken, and the caller should close it.
+        """
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) >= max_size:
+                return False
+            idle.append((time.monotonic(), handle))
+            return True
+
+    def drain(self, key: str) -> None:
+        """Close every idle handle of a key."""
+        with self._lock:
+            idle = self._idle.pop(key, [])
+            hits, misses = self.hits, self.misses
+        for _, handle in idle:
+            self._discard(handle, "pool drained")
+        if hits or misses:
+            self._logger.debug(
+                f"Closed {len(idle)} pooled connections (pool hits: {hits}, misses: {misses})"
+            )
+
+    def _safe_check(
+        self, check: Callable[[AdapterHandle, float], bool], handle: AdapterHandle, idle: float
+    ) -> bool:
+        try:
+            return check(handle, idle)
+        except Exception as exc:
+            self._logger.debug(f"Pooled connection check failed: {exc}")
+            return False
+
+    def _discard(self, handle: AdapterHandle, reason: str) -> None:
+        self._logger.debug(f"Closing a pooled connection ({reason})")
+        try:
+            self._close(handle)
+        except Exception as exc:
+            self._logger.debug(f"Failed to close a pooled connection: {exc}")
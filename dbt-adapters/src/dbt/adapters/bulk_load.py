@@ -0,0 +1,84 @@
+import datetime
+import io
+from typing import Any, IO, Iterable, Iterator, Sequence
+
+
+# rows encoded per chunk handed out by CsvRowsReader
+CSV_CHUNK_ROWS = 1000
+
+
+def csv_field(value: Any) -> str:
+    """Encode a single value of an agate table as a CSV field for a bulk load.
+
+    NULL is an empty, unquoted field, and every other value is quoted. This
+    way an empty string stays distinguishable from NULL, which is how
+    Postgres, Redshift and Snowflake all read CSV.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, datetime.timedelta):
+        # the form an interval literal accepts, not "1 day, 0:00:00"
+        value = f"{value.total_seconds()} seconds"
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _csv_lines(rows: Iterable[Sequence[Any]]) -> Iterator[str]:
+    chunk = []
+    for row in rows:
+        chunk.append(",".join([csv_field(value) for value in row]))
+        if len(chunk) == CSV_CHUNK_ROWS:
+            yield "\n".join(chunk) + "\n"
+            chunk = []
+    if chunk:
+        yield "\n".join(chunk) + "\n"
+
+
+class CsvRowsReader(io.TextIOBase):
+    """A read-only file of the rows of an agate table, encoded as CSV with
+    csv_field as they are read.
+
+    Drivers that stream a file into COPY ... FROM STDIN call read() with a
+    buffer size, so the CSV for a large seed is never held in memory all at
+    once.
+    """
+
+    def __init__(self, rows: Iterable[Sequence[Any]]) -> None:
+        super().__init__()
+        self._chunks = _csv_lines(rows)
+        self._buffer = ""
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> str:  # type: ignore[override]
+        if size is None or size < 0:
+            data = self._buffer + "".join(self._chunks)
+            self._buffer = ""
+            return data
+        while len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def readline(self, size: int = -1) -> str:  # type: ignore[override]
+        while "\n" not in self._buffer:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        end = self._buffer.find("\n") + 1 or len(self._buffer)
+        if size is not None and 0 <= size < end:
+            end = size
+        data, self._buffer = self._buffer[:end], self._buffer[end:]
+        return data
+
+
+def write_csv_rows(rows: Iterable[Sequence[Any]], file: IO[str]) -> None:
+    """Write the rows of an agate table to a file as CSV, for drivers that
+    upload a file rather than stream one.
+    """
+    for chunk in _csv_lines(rows):
+        file.write(chunk)
@@ -167,6 +167,15 @@ class RelationsCache:
 
     def __init__(self, log_cache_events: bool = False) -> None:
         self.relations: Dict[_ReferenceKey, _CachedRelation] = {}
+        # secondary index of relations by (database, schema), kept in sync with
+        # self.relations so schema-scoped lookups don't scan the whole cache.
+        self._schema_index: Dict[
+            Tuple[Optional[str], Optional[str]], Dict[Optional[str], _CachedRelation]
+        ] = {}
+        # reverse of _CachedRelation.referenced_by: maps a dependent's key to
+        # the keys of the relations it refers to, so drops and renames only
+        # visit the relations they actually touch.
+        self._references: Dict[_ReferenceKey, Set[_ReferenceKey]] = {}
         self.lock = threading.RLock()
         self.schemas: Set[Tuple[Optional[str], Optional[str]]] = set()
         self.log_cache_events = log_cache_events
@@ -241,8 +250,27 @@ class RelationsCache:
         """
         self.add_schema(relation.database, relation.schema)
         key = relation.key()
+        if key not in self.relations:
+            self._index_relation(key, relation)
         return self.relations.setdefault(key, relation)
 
+    def _index_relation(self, key: _ReferenceKey, relation: _CachedRelation) -> None:
+        """Add a relation to the per-schema index. Callers should hold the lock."""
+        schema_key = (key.database, key.schema)
+        self._schema_index.setdefault(schema_key, {})[key.identifier] = relation
+
+    def _unindex_relation(self, key: _ReferenceKey) -> None:
+        """Remove a relation from the per-schema index. Callers should hold the
+        lock. Unknown keys are ignored.
+        """
+        schema_key = (key.database, key.schema)
+        in_schema = self._schema_index.get(schema_key)
+        if in_schema is None:
+            return
+        in_schema.pop(key.identifier, None)
+        if not in_schema:
+            del self._schema_index[schema_key]
+
     def _add_link(self, referenced_key, dependent_key):
         """Add a link between two relations to the database. Both the old and
         new entries must alraedy exist in the database.
@@ -266,6 +294,7 @@ class RelationsCache:
         assert dependent is not None  # we just raised!
 
         referenced.add_reference(dependent)
+        self._references.setdefault(dependent_key, set()).add(referenced_key)
 
     # This is called in plugins/postgres/dbt/adapters/postgres/impl.py
     def add_link(self, referenced, dependent):
@@ -341,10 +370,17 @@ class RelationsCache:
         """
         # remove direct refs
         for key in keys:
-            del self.relations[key]
+            removed = self.relations.pop(key)
+            self._unindex_relation(key)
+            for dependent_key in removed.referenced_by:
+                if dependent_key in self._references:
+                    self._references[dependent_key].discard(key)
         # then remove all entries from each child
-        for cached in self.relations.values():
-            cached.release_references(keys)
+        for key in keys:
+            for referenced_key in self._references.pop(key, ()):
+                referenced = self.relations.get(referenced_key)
+                if referenced is not None:
+                    referenced.release_references(keys)
 
     def drop(self, relation):
         """Drop the named relation and cascade it appropriately to all
@@ -388,13 +424,16 @@ class RelationsCache:
         # basically, the name changes but some underlying ID moves. Kind of
         # like an object reference!
         relation = self.relations.pop(old_key)
+        self._unindex_relation(old_key)
         new_key = new_relation.key()
 
         # relation has to rename its innards, so it needs the _CachedRelation.
         relation.rename(new_relation)
         # update all the relations that refer to it
-        for cached in self.relations.values():
-            if cached.is_referenced_by(old_key):
+        referenced_keys = self._references.pop(old_key, set())
+        for referenced_key in referenced_keys:
+            cached = self.relations.get(referenced_key)
+            if cached is not None and cached.is_referenced_by(old_key):
                 fire_event(
                     CacheAction(
                         action="update_reference",
@@ -405,8 +444,17 @@ class RelationsCache:
                 )
 
                 cached.rename_key(old_key, new_key)
+        if referenced_keys:
+            self._references[new_key] = referenced_keys
+        # and the relations it is referenced by now refer to the new key
+        for dependent_key in relation.referenced_by:
+            dependent_refs = self._references.get(dependent_key)
+            if dependent_refs is not None and old_key in dependent_refs:
+                dependent_refs.discard(old_key)
+                dependent_refs.add(new_key)
 
         self.relations[new_key] = relation
+        self._index_relation(new_key, relation)
         # also fixup the schemas!
         self.add_schema(new_key.database, new_key.schema)
 
@@ -479,23 +527,68 @@ class RelationsCache:
         :return List[BaseRelation]: The list of relations with the given
             schema
         """
-        database = lowercase(database)
-        schema = lowercase(schema)
+        key = (lowercase(database), lowercase(schema))
         with self.lock:
-            results = [
-                r.inner
-                for r in self.relations.values()
-                if (lowercase(r.schema) == schema and lowercase(r.database) == database)
-            ]
+            results = [r.inner for r in self._schema_index.get(key, {}).values()]
 
         if None in results:
             raise NoneRelationFoundError()
         return results
 
+    def get_relation(
+        self, database: Optional[str], schema: Optional[str], identifier: Optional[str]
+    ) -> Optional[Any]:
+        """Case-insensitively get the relation with the given name, if it is
+        cached.
+
+        :param str database: The case-insensitive database name.
+        :param str schema: The case-insensitive schema name.
+        :param str identifier: The case-insensitive identifier.
+        :return Optional[BaseRelation]: The cached relation, or None if it is
+            not in the cache.
+        """
+        key = (lowercase(database), lowercase(schema))
+        with self.lock:
+            cached = self._schema_index.get(key, {}).get(lowercase(identifier))
+
+        if cached is None:
+            return None
+        if cached.inner is None:
+            raise NoneRelationFoundError()
+        return cached.inner
+
+    def replace_schema(
+        self, database: Optional[str], schema: Optional[str], relations: Iterable[Any]
+    ) -> None:
+        """Replace the cached contents of a schema with the given relations,
+        as freshly listed from the database. Relations that are still present
+        keep their references. Relations that are gone are removed without
+        cascading, since the listing already reflects their dependents.
+
+        :param str database: The database of the schema to replace.
+        :param str schema: The schema to replace.
+        :param Iterable[BaseRelation] relations: The relations in the schema.
+        """
+        key = (lowercase(database), lowercase(schema))
+        listed = {_make_ref_key(relation): relation for relation in relations}
+        with self.lock:
+            existing = self._schema_index.get(key, {})
+            removed = [cached.key() for cached in existing.values() if cached.key() not in listed]
+            self._remove_refs(removed)
+            for ref_key, relation in listed.items():
+                cached = self.relations.get(ref_key)
+                if cached is None:
+                    self._setdefault(_CachedRelation(relation))
+                else:
+                    cached.inner = relation
+            self.schemas.add(key)
+
     def clear(self):
         """Clear the cache"""
         with self.lock:
             self.relations.clear()
+            self._schema_index.clear()
+            self._references.clear()
             self.schemas.clear()
 
     def _list_relations_in_schema(
@@ -503,12 +596,7 @@ class RelationsCache:
     ) -> List[_CachedRelation]:
         """Get the relations in a schema. Callers should hold the lock."""
         key = (lowercase(database), lowercase(schema))
-
-        to_remove: List[_CachedRelation] = []
-        for cachekey, relation in self.relations.items():
-            if (cachekey.database, cachekey.schema) == key:
-                to_remove.append(relation)
-        return to_remove
+        return list(self._schema_index.get(key, {}).values())
 
     def _remove_all(self, to_remove: List[_CachedRelation]):
         """Remove all the listed relations. Ignore relations that have been
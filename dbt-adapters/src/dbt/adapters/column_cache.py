@@ -0,0 +1,148 @@
+from dataclasses import dataclass
+import re
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from dbt.adapters.reference_keys import _make_ref_key, _ReferenceKey
+
+
+# Statements that can change the columns of a relation. Anything else, like
+# selects and DML, leaves the cached columns of every relation intact.
+_DDL = re.compile(
+    r"\b(?:create|alter|drop|undrop|rename|replace(?!\s*\()|call|execute)\b", re.IGNORECASE
+)
+# DDL on a whole schema or database, that doesn't name the relations it changes
+_SCHEMA_DDL = re.compile(r"\b(?:schema|database|catalog|call|execute)\b", re.IGNORECASE)
+
+
+@dataclass
+class ColumnCacheStats:
+    """How get_columns_in_relation used the column cache.
+
+    :attr int hits: Lookups served from the cache. Each one is a metadata
+        query, or API call, that did not have to be made.
+    :attr int misses: Lookups that had to fetch the columns.
+    :attr int invalidations: Relations forgotten because they were changed,
+        or could have been.
+    :attr int prefetched: Relations whose columns were cached ahead of any
+        lookup, by a query for a whole schema.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    prefetched: int = 0
+
+
+class ColumnCache:
+    """The columns of relations, as returned by get_columns_in_relation,
+    kept for the rest of the run.
+
+    A relation's columns are forgotten when dbt drops, renames, creates or
+    alters it, and when the adapter executes DDL that mentions its
+    identifier. DDL that mentions a schema or database, or calls a procedure,
+    forgets every relation.
+
+    :attr ColumnCacheStats stats: Hit/miss/invalidation counts for this run.
+    """
+
+    def __init__(self) -> None:
+        self.stats = ColumnCacheStats()
+        self._lock = threading.Lock()
+        self._columns: Dict[_ReferenceKey, List[Any]] = {}
+        # bumped by every invalidation, so columns fetched while one happened
+        # are not cached
+        self._generation = 0
+
+    def get_or_fetch(self, relation: Any, fetch: Callable[[], List[Any]]) -> List[Any]:
+        """Get the cached columns of a relation, or fetch and cache them.
+
+        A relation without columns is not cached, as that usually means it
+        does not exist yet. The list returned is always a copy, callers may
+        change it.
+        """
+        key = _make_ref_key(relation)
+        with self._lock:
+            columns = self._columns.get(key)
+            if columns is not None:
+                self.stats.hits += 1
+                return list(columns)
+            self.stats.misses += 1
+            generation = self._generation
+
+        columns = fetch()
+        if columns:
+            with self._lock:
+                if generation == self._generation:
+                    self._columns[key] = list(columns)
+        return columns
+
+    def prefetch(self, fetch: Callable[[], Iterable[Tuple[Any, List[Any]]]]) -> int:
+        """Cache the columns of many relations at once, as fetched by a single
+        query for their schema. Returns how many relations were cached.
+
+        Relations whose columns are cached already are left as they are, as
+        are relations without columns, and relations whose names only differ
+        by case, which the cache can't tell apart. Nothing is cached if an
+        invalidation happens while fetching.
+        """
+        with self._lock:
+            generation = self._generation
+
+        fetched: Dict[_ReferenceKey, List[Any]] = {}
+        ambiguous = set()
+        for relation, columns in fetch():
+            key = _make_ref_key(relation)
+            if key in fetched:
+                ambiguous.add(key)
+            fetched[key] = list(columns)
+
+        with self._lock:
+            if generation != self._generation:
+                return 0
+            count = 0
+            for key, columns in fetched.items():
+                if key in ambiguous or not columns or key in self._columns:
+                    continue
+                self._columns[key] = columns
+                count += 1
+            self.stats.prefetched += count
+            return count
+
+    def invalidate(self, relation: Optional[Any]) -> None:
+        """Forget the columns of a relation."""
+        if relation is None:
+            return
+        with self._lock:
+            self._generation += 1
+            if self._columns.pop(_make_ref_key(relation), None) is not None:
+                self.stats.invalidations += 1
+
+    def invalidate_statement(self, sql: str) -> None:
+        """Forget the columns of every relation that the given SQL could
+        change. Relations are matched by identifier alone, which forgets too
+        many rather than too few.
+        """
+        if not _DDL.search(sql):
+            return
+        with self._lock:
+            self._generation += 1
+            if _SCHEMA_DDL.search(sql):
+                forget = list(self._columns)
+            else:
+                lowered = sql.lower()
+                forget = [
+                    key
+                    for key in self._columns
+                    if key.identifier is None or key.identifier in lowered
+                ]
+            for key in forget:
+                del self._columns[key]
+            self.stats.invalidations += len(forget)
+
+    def clear(self) -> None:
+        """Forget the columns of every relation."""
+        with self._lock:
+            self._generation += 1
+            self.stats.invalidations += len(self._columns)
+            self._columns.clear()
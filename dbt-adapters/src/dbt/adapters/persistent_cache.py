@@ -0,0 +1,154 @@
+from dataclasses import dataclass
+import json
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from dbt_common.utils.formatting import lowercase
+
+from dbt.adapters.events.logging import AdapterLogger
+
+
+logger = AdapterLogger(__name__)
+
+PERSISTENT_CACHE_VERSION = 1
+
+_SchemaKey = Tuple[Optional[str], Optional[str]]
+
+
+@dataclass
+class PersistentCacheStats:
+    """How persisted schemas were used to warm the relations cache.
+
+    :attr int hits: Schemas hydrated from disk and confirmed unchanged.
+    :attr int misses: Schemas that were not persisted and had to be listed.
+    :attr int stale: Schemas hydrated from disk that had changed, or had no
+        change signal to compare against, and were listed again.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    stale: int = 0
+
+
+class PersistentRelationsCache:
+    """An on-disk copy of the relations cache, used to warm start the
+    in-memory RelationsCache across invocations.
+
+    Relations are stored per schema together with an optional change signal:
+    an adapter-defined string that changes whenever the contents of the schema
+    change. A persisted schema is only trusted without listing it again if the
+    adapter reports the same signal it was stored with.
+
+    :attr str path: The file the cache is read from and written to.
+    :attr str unique_field: The hashed credentials unique_field. A file written
+        for different credentials is ignored.
+    :attr PersistentCacheStats stats: Hit/miss/stale counts for this run.
+    """
+
+    def __init__(self, path: str, unique_field: str) -> None:
+        self.path = path
+        self.unique_field = unique_field
+        self.stats = PersistentCacheStats()
+        self.lock = threading.Lock()
+        self._schemas: Dict[_SchemaKey, Dict[str, Any]] = {}
+        # schemas modified by this run, whose signal can no longer be trusted
+        self._invalidated: Set[_SchemaKey] = set()
+
+    def load(self) -> None:
+        """Read the persisted schemas from disk. A missing, unreadable or
+        mismatched file leaves the cache empty.
+        """
+        try:
+            with open(self.path) as fp:
+                data = json.load(fp)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as exc:
+            logger.debug(f"Ignoring unreadable relations cache at {self.path}: {exc}")
+            return
+
+        if data.get("version") != PERSISTENT_CACHE_VERSION:
+            return
+        if data.get("unique_field") != self.unique_field:
+            return
+
+        with self.lock:
+            for entry in data.get("schemas", []):
+                key = (lowercase(entry["database"]), lowercase(entry["schema"]))
+                self._schemas[key] = entry
+
+    def get(
+        self, database: Optional[str], schema: Optional[str]
+    ) -> Optional[Tuple[Optional[str], List[Dict[str, Any]]]]:
+        """Get the persisted signal and serialized relations for a schema, or
+        None if the schema was not persisted.
+        """
+        key = (lowercase(database), lowercase(schema))
+        with self.lock:
+            entry = self._schemas.get(key)
+            if entry is None:
+                return None
+            return entry["signal"], entry["relations"]
+
+    def update(
+        self,
+        database: Optional[str],
+        schema: Optional[str],
+        relations: Iterable[Any],
+        signal: Optional[str],
+    ) -> None:
+        """Record the freshly listed contents of a schema, along with the
+        change signal that was read before it was listed.
+        """
+        key = (lowercase(database), lowercase(schema))
+        entry = {
+            "database": database,
+            "schema": schema,
+            "signal": signal,
+            "relations": [relation.to_dict(omit_none=True) for relation in relations],
+        }
+        with self.lock:
+            self._schemas[key] = entry
+            self._invalidated.discard(key)
+
+    def invalidate(self, database: Optional[str], schema: Optional[str]) -> None:
+        """Mark a schema as modified by this run. Its persisted contents are
+        refreshed from the relations cache on save, but without a signal, so
+        the next run lists it again.
+        """
+        key = (lowercase(database), lowercase(schema))
+        with self.lock:
+            if key in self._schemas:
+                self._invalidated.add(key)
+
+    def save(self, relations_cache) -> None:
+        """Write the persisted schemas to disk, replacing the contents of any
+        schemas invalidated during this run with their state in the given
+        RelationsCache.
+        """
+        with self.lock:
+            for key in self._invalidated:
+                entry = self._schemas[key]
+                entry["signal"] = None
+                entry["relations"] = [
+                    relation.to_dict(omit_none=True)
+                    for relation in relations_cache.get_relations(*key)
+                ]
+            self._invalidated.clear()
+            data = {
+                "version": PERSISTENT_CACHE_VERSION,
+                "unique_field": self.unique_field,
+                "schemas": list(self._schemas.values()),
+            }
+
+        # write to a temporary file first, so a concurrent reader never sees
+        # a partially written cache
+        tmp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(tmp_path, "w") as fp:
+                json.dump(data, fp)
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            logger.debug(f"Could not write relations cache to {self.path}: {exc}")
@@ -1,12 +1,17 @@
 import abc
+import pickle
+import tempfile
 import time
+import uuid
 from typing import (
     Any,
+    Callable,
     Dict,
     Iterable,
     Iterator,
     List,
     Optional,
+    Sequence,
     Tuple,
     TYPE_CHECKING,
     Type,
@@ -17,6 +22,7 @@ from dbt_common.events.functions import fire_event
 from dbt_common.exceptions import DbtInternalError, NotImplementedError
 from dbt_common.utils import cast_to_str
 
+from dbt.adapters.arrow import ArrowResultTable
 from dbt.adapters.base import BaseConnectionManager
 from dbt.adapters.contracts.connection import (
     AdapterResponse,
@@ -33,6 +39,13 @@ from dbt.adapters.events.types import (
 
 if TYPE_CHECKING:
     import agate
+    import pyarrow
+
+
+DEFAULT_STREAM_BATCH_SIZE = 10_000
+
+# column names, and an iterator over batches of raw driver rows
+ResultStream = Tuple[List[str], Iterator[Sequence[Any]]]
 
 
 class SQLConnectionManager(BaseConnectionManager):
@@ -45,6 +58,20 @@ class SQLConnectionManager(BaseConnectionManager):
         - open
     """
 
+    # Set by the adapter after initialization via set_spill_results_checker
+    _spill_results_checker: Optional[Callable[[], bool]] = None
+
+    def set_spill_results_checker(self, checker: Callable[[], bool]) -> None:
+        self._spill_results_checker = checker
+
+    def _should_spill_results(self) -> bool:
+        """Check if fetched results should be streamed to a temporary file
+        before the result table is built.
+        """
+        if self._spill_results_checker is None:
+            return False
+        return self._spill_results_checker()
+
     @abc.abstractmethod
     def cancel(self, connection: Connection):
         """Cancel the given connection."""
@@ -206,6 +233,190 @@ class SQLConnectionManager(BaseConnectionManager):
 
         return table_from_data_flat(data, column_names)
 
+    @classmethod
+    def get_arrow_result_from_cursor(
+        cls, cursor: Any, limit: Optional[int]
+    ) -> Optional["pyarrow.Table"]:
+        """Fetch the cursor's results as a pyarrow.Table, for drivers that can
+        produce one natively. Returns None if the driver can't, in which case
+        the results are fetched as an agate.Table instead.
+        """
+        return None
+
+    @classmethod
+    def fix_arrow_rows(cls, rows: List[Tuple[Any, ...]]) -> Iterable[Sequence[Any]]:
+        """Fix the rows of a fetched pyarrow.Table, as they are turned into an
+        agate.Table. Adapters that fix the rows of their driver in
+        process_results should do the same here. By default they are used as
+        they are.
+        """
+        return rows
+
+    def _get_fetched_result(self, cursor: Any, limit: Optional[int]) -> "agate.Table":
+        if self._should_fetch_arrow_results() and cursor.description is not None:
+            arrow_table = self.get_arrow_result_from_cursor(cursor, limit)
+            if arrow_table is not None:
+                return ArrowResultTable(  # type: ignore[return-value]
+                    arrow_table, fix_rows=self.fix_arrow_rows
+                )
+        return self.get_result_from_cursor(cursor, limit)
+
+    @classmethod
+    def _fetch_batches(cls, cursor: Any, batch_size: int) -> Iterator[Sequence[Any]]:
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            yield rows
+
+    def _open_result_stream(
+        self, sql: str, auto_begin: bool, batch_size: int
+    ) -> Tuple[AdapterResponse, ResultStream]:
+        """Execute the given SQL and return its status, along with its column
+        names and an iterator over its rows in batches of at most batch_size.
+
+        By default rows are read from an ordinary cursor with fetchmany.
+        Adapters whose drivers buffer the whole result on execute should
+        override this to use a server-side cursor instead, for example with
+        _open_declared_result_stream.
+        """
+        return self._open_cursor_result_stream(sql, auto_begin, batch_size)
+
+    def _open_spilled_result_stream(
+        self, sql: str, auto_begin: bool, batch_size: int
+    ) -> Tuple[Callable[[int], AdapterResponse], ResultStream]:
+        """Execute the given SQL for _get_spilled_result. Returns a function
+        that gets the statement's response, given the number of rows that were
+        fetched, along with the column names and the batches of rows.
+
+        Unlike stream(), this runs every statement execute(fetch=True) runs,
+        so by default rows are read from an ordinary cursor with fetchmany.
+        Adapters can override this to read single SELECT statements through a
+        server-side cursor.
+        """
+        response, result_stream = self._open_cursor_result_stream(sql, auto_begin, batch_size)
+        return lambda fetched: response, result_stream
+
+    def _open_cursor_result_stream(
+        self, sql: str, auto_begin: bool, batch_size: int
+    ) -> Tuple[AdapterResponse, ResultStream]:
+        _, cursor = self.add_query(sql, auto_begin)
+        response = self.get_response(cursor)
+        if cursor.description is None:
+            return response, ([], iter([]))
+        column_names = [col[0] for col in cursor.description]
+        return response, (column_names, self._fetch_batches(cursor, batch_size))
+
+    def _open_declared_result_stream(
+        self,
+        sql: str,
+        auto_begin: bool,
+        batch_size: int,
+        with_hold: bool = False,
+        begin: bool = False,
+    ) -> Tuple[AdapterResponse, ResultStream]:
+        """Stream the results of the given SQL through a named server-side
+        cursor, fetching batch_size rows per round trip.
+
+        :param with_hold: If set, declare the cursor WITH HOLD so it can be
+            used outside of a transaction block.
+        :param begin: If set, wrap the cursor in its own transaction block,
+            for databases that only allow cursors inside one.
+        """
+        name = f"dbt_cursor_{uuid.uuid4().hex}"
+        hold = " with hold" if with_hold else ""
+        if begin:
+            self.add_query("begin", auto_begin=False)
+            auto_begin = False
+        _, cursor = self.add_query(f"declare {name} cursor{hold} for {sql}", auto_begin)
+        response = self.get_response(cursor)
+        # a declared cursor has no description until the first fetch
+        _, cursor = self.add_query(f"fetch forward {batch_size} from {name}", auto_begin=False)
+        column_names = [col[0] for col in cursor.description or []]
+
+        def batches() -> Iterator[Sequence[Any]]:
+            nonlocal cursor
+            try:
+                while True:
+                    rows = cursor.fetchall()
+                    if rows:
+                        yield rows
+                    if len(rows) < batch_size:
+                        return
+                    _, cursor = self.add_query(
+                        f"fetch forward {batch_size} from {name}", auto_begin=False
+                    )
+            finally:
+                self.add_query(f"close {name}", auto_begin=False)
+                if begin:
+                    self.add_query("commit", auto_begin=False)
+
+        return response, (column_names, batches())
+
+    def stream(
+        self,
+        sql: str,
+        auto_begin: bool = False,
+        batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Execute the given SQL and yield its results as lists of at most
+        batch_size rows, without holding the full result in memory.
+
+        The query runs when iteration starts. Closing the iterator early
+        releases any server-side cursor.
+
+        :param str sql: The sql to execute.
+        :param bool auto_begin: If set, and dbt is not currently inside a
+            transaction, automatically begin one.
+        :param int batch_size: The maximum number of rows fetched at once.
+        """
+        sql = self._add_query_comment(sql)
+        _, (column_names, batches) = self._open_result_stream(sql, auto_begin, batch_size)
+        for rows in batches:
+            yield list(self.process_results(column_names, rows))
+
+    def _get_spilled_result(
+        self, sql: str, auto_begin: bool, limit: Optional[int]
+    ) -> Tuple[AdapterResponse, "agate.Table"]:
+        """Execute the given SQL, streaming its rows to a temporary file
+        before building the result table from it. Only one batch of driver
+        rows is held in memory at a time.
+        """
+        from dbt_common.clients.agate_helper import table_from_data_flat
+
+        batch_size = min(limit, DEFAULT_STREAM_BATCH_SIZE) if limit else DEFAULT_STREAM_BATCH_SIZE
+        get_response, (column_names, batches) = self._open_spilled_result_stream(
+            sql, auto_begin, batch_size
+        )
+        with tempfile.TemporaryFile() as spill:
+            fetched = 0
+            for rows in batches:
+                if limit:
+                    rows = rows[: limit - fetched]
+                # some drivers return memoryviews for binary data, which
+                # can't be pickled
+                rows = [
+                    tuple(bytes(v) if isinstance(v, memoryview) else v for v in row)
+                    for row in rows
+                ]
+                pickle.dump(rows, spill)
+                fetched += len(rows)
+                if limit and fetched >= limit:
+                    batches.close()  # type: ignore[attr-defined]
+                    break
+
+            def spilled_rows() -> Iterator[Sequence[Any]]:
+                spill.seek(0)
+                while True:
+                    try:
+                        yield from pickle.load(spill)
+                    except EOFError:
+                        return
+
+            data = self.process_results(column_names, spilled_rows())
+            table = table_from_data_flat(data, column_names)
+        return get_response(fetched), table
+
     def execute(
         self,
         sql: str,
@@ -216,10 +427,13 @@ class SQLConnectionManager(BaseConnectionManager):
         from dbt_common.clients.agate_helper import empty_table
 
         sql = self._add_query_comment(sql)
+        if fetch and self._should_spill_results():
+            return self._get_spilled_result(sql, auto_begin, limit)
+
         _, cursor = self.add_query(sql, auto_begin)
         response = self.get_response(cursor)
         if fetch:
-            table = self.get_result_from_cursor(cursor, limit)
+            table = self._get_fetched_result(cursor, limit)
         else:
             table = empty_table()
         return response, table
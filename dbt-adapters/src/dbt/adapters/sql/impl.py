@@ -1,19 +1,22 @@
-from typing import Any, List, Optional, Tuple, Type, TYPE_CHECKING
+from multiprocessing.context import SpawnContext
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, TYPE_CHECKING
 
 from dbt_common.events.functions import fire_event
 from dbt_common.record import record_function
 
 from dbt.adapters.base import BaseAdapter, BaseRelation, available
+from dbt.adapters.base.column import Column as BaseColumn
 from dbt.adapters.cache import _make_ref_key_dict
 from dbt.adapters.contracts.connection import AdapterResponse, Connection
 from dbt.adapters.events.types import ColTypeChange, SchemaCreation, SchemaDrop
 from dbt.adapters.exceptions import RelationTypeNullError
 from dbt.adapters.record.base import AdapterTestSqlRecord, AdapterAddQueryRecord
-from dbt.adapters.sql.connections import SQLConnectionManager
+from dbt.adapters.sql.connections import DEFAULT_STREAM_BATCH_SIZE, SQLConnectionManager
 
 LIST_RELATIONS_MACRO_NAME = "list_relations_without_caching"
 LIST_FUNCTION_RELATIONS_MACRO_NAME = "list_function_relations_without_caching"
 GET_COLUMNS_IN_RELATION_MACRO_NAME = "get_columns_in_relation"
+GET_COLUMNS_IN_SCHEMA_MACRO_NAME = "get_columns_in_schema"
 LIST_SCHEMAS_MACRO_NAME = "list_schemas"
 CHECK_SCHEMA_EXISTS_MACRO_NAME = "check_schema_exists"
 CREATE_SCHEMA_MACRO_NAME = "create_schema"
@@ -49,6 +52,12 @@ class SQLAdapter(BaseAdapter):
     ConnectionManager: Type[SQLConnectionManager]
     connections: SQLConnectionManager
 
+    def __init__(self, config, mp_context: SpawnContext) -> None:
+        super().__init__(config, mp_context)
+        self.connections.set_spill_results_checker(
+            lambda: self.behavior.spill_fetched_results_to_disk.no_warn
+        )
+
     @available.parse(lambda *a, **k: (None, None))
     @record_function(
         AdapterAddQueryRecord, method=True, index_on_thread_id=True, id_field_name="thread_id"
@@ -72,6 +81,22 @@ class SQLAdapter(BaseAdapter):
         """
         return self.connections.add_query(sql, auto_begin, bindings, abridge_sql_log)
 
+    def stream(
+        self,
+        sql: str,
+        auto_begin: bool = False,
+        batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Execute the given SQL and yield its results in batches of rows. A
+        thin wrapper around ConnectionManager.stream.
+
+        :param sql: The SQL query to execute
+        :param auto_begin: If set and there is no transaction in progress,
+            begin a new one.
+        :param batch_size: The maximum number of rows in each batch.
+        """
+        return self.connections.stream(sql, auto_begin, batch_size)
+
     @classmethod
     def convert_text_type(cls, agate_table: "agate.Table", col_idx: int) -> str:
         return "text"
@@ -142,6 +167,7 @@ class SQLAdapter(BaseAdapter):
             "new_column_type": new_column_type,
         }
         self.execute_macro(ALTER_COLUMN_TYPE_MACRO_NAME, kwargs=kwargs)
+        self.invalidate_cached_columns(relation)
 
     def drop_relation(self, relation):
         if relation.type is None:
@@ -160,10 +186,32 @@ class SQLAdapter(BaseAdapter):
         self.execute_macro(RENAME_RELATION_MACRO_NAME, kwargs=kwargs)
 
     def get_columns_in_relation(self, relation):
-        return self.execute_macro(
-            GET_COLUMNS_IN_RELATION_MACRO_NAME, kwargs={"relation": relation}
+        return self._cached_columns_in_relation(
+            relation,
+            lambda: self.execute_macro(
+                GET_COLUMNS_IN_RELATION_MACRO_NAME, kwargs={"relation": relation}
+            ),
         )
 
+    def get_columns_in_schema(
+        self, schema_relation: BaseRelation
+    ) -> Optional[Dict[str, List[BaseColumn]]]:
+        kwargs = {"schema_relation": schema_relation}
+        results = self.execute_macro(GET_COLUMNS_IN_SCHEMA_MACRO_NAME, kwargs=kwargs)
+        if results is None:
+            return None
+        return self.parse_columns_in_schema(results)
+
+    def parse_columns_in_schema(self, table: "agate.Table") -> Dict[str, List[BaseColumn]]:
+        """Group the rows returned by the get_columns_in_schema macro into
+        the columns of each relation. Each row is a table name, followed by
+        the arguments of the adapter's Column.
+        """
+        columns: Dict[str, List[BaseColumn]] = {}
+        for row in table:
+            columns.setdefault(row[0], []).append(self.Column(*row[1:]))
+        return columns
+
     def create_schema(self, relation: BaseRelation) -> None:
         relation = relation.without_identifier()
         fire_event(SchemaCreation(relation=_make_ref_key_dict(relation)))
@@ -0,0 +1,86 @@
+import re
+from functools import lru_cache
+from typing import List, Tuple
+
+
+# Everything in SQL that can contain a ';' without ending a statement, plus
+# the ';' itself. Text between matches is plain SQL, which the regex engine
+# skips over without any Python-level work.
+_TOKEN_REGEX = r"""
+    (?P<single>'(?:[^'\\]+|\\.|'')*(?:'|\Z))
+    | (?P<double>"(?:[^"\\]+|\\.|"")*(?:"|\Z))
+    | (?P<dollar>(?<![\w$])\$(?P<tag>(?:[A-Za-z_]\w*)?)\$.*?(?:\$(?P=tag)\$|\Z))
+    | (?P<line_comment>--[^\n]*{slash_comment})
+    | (?P<block_comment>/\*.*?(?:\*/|\Z))
+    | (?P<delimiter>;)
+"""
+
+_TOKENS = re.compile(_TOKEN_REGEX.format(slash_comment=""), re.VERBOSE | re.DOTALL)
+# Snowflake also accepts '//' line comments, but not in unquoted URLs like
+# file:///tmp/data.csv, which are matched as plain SQL first
+_TOKENS_WITH_SLASH_COMMENTS = re.compile(
+    r"(?P<url>:/{2,}[^\s;]*) |" + _TOKEN_REGEX.format(slash_comment=r"|//[^\n]*"),
+    re.VERBOSE | re.DOTALL,
+)
+_NON_SPACE = re.compile(r"\S")
+_SAME_LINE_SPACE = re.compile(r"[ \t]*")
+
+# large enough for a run's repeated statements, small enough that holding
+# the compiled SQL of the entries doesn't matter
+SPLIT_CACHE_SIZE = 64
+
+
+def split_statements(sql: str, slash_comments: bool = False) -> List[str]:
+    """Split a string of SQL into its statements.
+
+    Statements end at a ';' that is not inside a quoted string or identifier,
+    a dollar-quoted string ($$...$$ or $tag$...$tag$) or a comment. Each
+    statement keeps its trailing ';', and a line comment that follows the ';'
+    on the same line. Statements that contain nothing but whitespace and
+    comments are left out.
+
+    This runs in a single pass over the SQL, and the result for a given
+    string is memoized.
+
+    :param sql: The SQL to split.
+    :param slash_comments: Also treat '//' as the start of a line comment,
+        like Snowflake does.
+    :return: The statements, stripped of surrounding whitespace.
+    """
+    return list(_split_statements(sql, slash_comments))
+
+
+@lru_cache(maxsize=SPLIT_CACHE_SIZE)
+def _split_statements(sql: str, slash_comments: bool) -> Tuple[str, ...]:
+    tokens = _TOKENS_WITH_SLASH_COMMENTS if slash_comments else _TOKENS
+    statements: List[str] = []
+    # where the current statement starts, and where the last kept one did
+    start = 0
+    last_start = -1
+    last_end = -1
+    pos = 0
+    has_code = False
+
+    for match in tokens.finditer(sql):
+        if not has_code and _NON_SPACE.search(sql, pos, match.start()):
+            has_code = True
+        pos = match.end()
+        kind = match.lastgroup
+
+        if kind in ("single", "double", "dollar", "url"):
+            has_code = True
+        elif kind == "line_comment" and not has_code and start == last_end:
+            # a comment on the same line as the previous statement's ';' belongs to it
+            if _SAME_LINE_SPACE.match(sql, start).end() == match.start():
+                statements[-1] = sql[last_start:pos].strip()
+                start = last_end = pos
+        elif kind == "delimiter":
+            if has_code:
+                statements.append(sql[start:pos].strip())
+                last_start, last_end = start, pos
+            start = pos
+            has_code = False
+
+    if has_code or _NON_SPACE.search(sql, pos):
+        statements.append(sql[start:].strip())
+    return tuple(statements)
@@ -16,6 +16,17 @@
   {{ return(columns) }}
 {% endmacro %}
 
+{#-- the columns of every relation in a schema, as rows of the table name
+     followed by the fields of get_columns_in_relation, or none if the
+     adapter can't list them in one query #}
+{% macro get_columns_in_schema(schema_relation) -%}
+  {{ return(adapter.dispatch('get_columns_in_schema', 'dbt')(schema_relation)) }}
+{% endmacro %}
+
+{% macro default__get_columns_in_schema(schema_relation) -%}
+  {{ return(none) }}
+{% endmacro %}
+
 {% macro get_columns_for_unit_tests(relation) -%}
   {{ return(adapter.dispatch('get_columns_for_unit_tests', 'dbt')(relation)) }}
 {% endmacro %}
@@ -94,26 +94,20 @@
   {% set batch_size = get_batch_size() %}
 
   {% set cols_sql = get_seed_column_quoted_csv(model, agate_table.column_names) %}
-  {% set bindings = [] %}
 
-  {% set statements = [] %}
-
-  {% for chunk in agate_table.rows | batch(batch_size) %}
-      {% set bindings = [] %}
+  {% if adapter.behavior.enable_bulk_seed_loading.no_warn and (agate_table.rows | length) > 0 %}
+      {% set sql = adapter.bulk_load_csv_rows(this, agate_table, cols_sql) %}
+      {% if sql %}
+          {{ return(sql) }}
+      {% endif %}
+  {% endif %}
 
-      {% for row in chunk %}
-          {% do bindings.extend(row) %}
-      {% endfor %}
+  {% set statements = [] %}
 
+  {% for values_sql, bindings in adapter.seed_insert_batches(agate_table, batch_size, get_binding_char()) %}
       {% set sql %}
           insert into {{ this.render() }} ({{ cols_sql }}) values
-          {% for row in chunk -%}
-              ({%- for column in agate_table.column_names -%}
-                  {{ get_binding_char() }}
-                  {%- if not loop.last%},{%- endif %}
-              {%- endfor -%})
-              {%- if not loop.last%},{%- endif %}
-          {%- endfor %}
+          {{ values_sql }}
       {% endset %}
 
       {% do adapter.add_query(sql, bindings=bindings, abridge_sql_log=True) %}
@@ -0,0 +1,79 @@
+"""
+Results:
+
+| sql                    | size    | sqlparse.split | split_statements | memoized |
+|------------------------|---------|----------------|------------------|----------|
+| incremental merge      |  46 KiB |        355.7ms |          10.96ms |    0.6us |
+| seed insert ... values | 127 KiB |       1067.4ms |          29.57ms |    0.5us |
+
+Notes:
+- run locally on Linux, single threaded
+- "memoized" is a repeated call with the same SQL
+"""
+
+import timeit
+
+import pytest
+
+from dbt.adapters.sql.statements import _split_statements, split_statements
+
+
+def incremental_merge_sql(columns: int = 400) -> str:
+    names = [f"column_{i}" for i in range(columns)]
+    select = ",\n".join(f'    cast("{n}" as varchar(256)) as "{n}" -- {n}; cast' for n in names)
+    update = ",\n".join(f'        "{n}" = src."{n}"' for n in names)
+    return f"""
+/* {{"app": "dbt", "node_id": "model.project.orders"}} */
+create temporary table "orders__dbt_tmp" as (
+with source as (
+    select * from "analytics"."raw"."orders" where updated_at > '2024-01-01; 00:00'
+)
+select
+{select}
+from source
+);
+-- merge the new rows in
+begin;
+delete from "analytics"."marts"."orders" using "orders__dbt_tmp" as src
+    where "orders".id = src.id;
+update "analytics"."marts"."orders" set
+{update}
+    from "orders__dbt_tmp" as src where "orders".id = src.id;
+insert into "analytics"."marts"."orders" select * from "orders__dbt_tmp";
+commit;
+"""
+
+
+def seed_insert_sql(rows: int = 2_000) -> str:
+    values = ",\n".join(
+        f"({i}, 'customer {i}; o''brien', '2024-01-{i % 28 + 1:02d}', {i * 1.5}, $${i}$$)"
+        for i in range(rows)
+    )
+    return f'insert into "analytics"."seeds"."customers" (id, name, day, amount, note) values\n{values};\n'
+
+
+@pytest.mark.parametrize(
+    "name,sql", [("merge", incremental_merge_sql()), ("seed", seed_insert_sql())]
+)
+def test_split_statements_against_sqlparse(name, sql):
+    sqlparse = pytest.importorskip("sqlparse")
+
+    expected = [s for s in sqlparse.split(sql) if s.strip()]
+    _split_statements.cache_clear()
+    assert split_statements(sql) == expected
+
+    sqlparse_duration = timeit.timeit(lambda: sqlparse.split(sql), number=3) / 3
+
+    def cold():
+        _split_statements.cache_clear()
+        split_statements(sql)
+
+    duration = timeit.timeit(cold, number=20) / 20
+    memoized_duration = timeit.timeit(lambda: split_statements(sql), number=1_000) / 1_000
+    print(
+        f"\n{name} ({len(sql) / 1024:.0f} KiB): sqlparse {sqlparse_duration * 1e3:.1f}ms, "
+        f"split_statements {duration * 1e3:.2f}ms, memoized {memoized_duration * 1e6:.1f}us"
+    )
+
+    # sqlparse tokenizes every word in Python; leave plenty of room for noise
+    assert duration * 10 < sqlparse_duration
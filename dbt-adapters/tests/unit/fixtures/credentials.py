@@ -10,5 +10,9 @@ class CredentialsStub(Credentials):
     def type(self) -> str:
         return "test"
 
+    @property
+    def unique_field(self) -> str:
+        return self.database
+
     def _connection_keys(self):
         return {"database": self.database, "schema": self.schema}
@@ -1,13 +1,19 @@
+import threading
 from unittest import mock
 
 import pytest
 
+from dbt.adapters.base.column import Column
 from dbt.adapters.base.impl import BaseAdapter, ConstraintSupport
+from dbt.adapters.exceptions import ApproximateMatchError
+from dbt_common.exceptions import DbtInternalError, DbtRuntimeError
 
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 import agate
+import pyarrow
 import pytz
+from dbt.adapters.arrow import ArrowResultTable
 from dbt.adapters.contracts.connection import AdapterResponse
 
 
@@ -383,6 +389,24 @@ class TestCalculateFreshnessFromCustomSQL:
         assert freshness_response["snapshotted_at"] == current_time
         assert isinstance(freshness_response["age"], float)
 
+    @patch("dbt.adapters.base.BaseAdapter.execute_macro")
+    def test_calculate_freshness_from_arrow_result_table(
+        self, mock_execute_macro, adapter, mock_relation
+    ):
+        """Test a macro that returns the fetched table, which may be Arrow backed"""
+        current_time = datetime.now(pytz.UTC)
+        last_modified = datetime(2023, 1, 1, tzinfo=pytz.UTC)
+        mock_execute_macro.return_value = ArrowResultTable(
+            pyarrow.table({"last_modified": [last_modified], "snapshotted_at": [current_time]})
+        )
+
+        adapter_response, freshness_response = adapter.calculate_freshness_from_custom_sql(
+            source=mock_relation, sql="SELECT max(updated_at) as last_modified"
+        )
+
+        assert adapter_response is None
+        assert freshness_response["max_loaded_at"] == last_modified
+
 
 class TestGrantsMacroQuotesGrantees:
     """Test that get_grant_sql and get_revoke_sql macros properly quote grantees.
@@ -494,3 +518,300 @@ class TestGrantsMacroQuotesGrantees:
         # Verify the SQL structure is correct
         assert result.startswith("revoke select on")
         assert "from" in result
+
+
+class TestCatalogFilterTable:
+    column_names = ["table_database", "table_schema", "table_name", "column_index"]
+
+    def test_filters_to_used_schemas(self):
+        rows = [
+            ["a", "b", "foo", 1],  # include
+            ["a", "1234", "foo", 1],  # include, w/ table schema inferred as a number
+            ["c", "B", "foo", 1],  # skip
+            ["A", "B", "bar", 1],  # include
+            [None, "B", "foo", 1],  # skip, w/ table database as None
+            ["A", None, "foo", 1],  # skip, w/ table schema as None
+        ]
+        table = agate.Table(rows, self.column_names)
+
+        result = BaseAdapter._catalog_filter_table(
+            table, frozenset({("a", "B"), ("a", "1234"), (None, "b")})
+        )
+
+        assert [tuple(row)[:3] for row in result.rows] == [
+            ("a", "b", "foo"),
+            ("a", "1234", "foo"),
+            ("A", "B", "bar"),
+        ]
+        assert isinstance(result.column_types[1], agate.Text)
+
+    def test_missing_column_raises(self):
+        table = agate.Table([["a", "foo"]], ["table_database", "table_name"])
+
+        with pytest.raises(DbtInternalError):
+            BaseAdapter._catalog_filter_table(table, frozenset({("a", "b")}))
+
+
+class TestSeedInsertBatches:
+    table = agate.Table(
+        [["a", "b"], ["c", "d"], ["e", "f"]], ["x", "y"], [agate.Text(), agate.Text()]
+    )
+
+    def test_batches_rows(self):
+        batches = list(BaseAdapter.seed_insert_batches(None, self.table, 2, "%s"))
+
+        assert batches == [
+            ("(%s,%s),(%s,%s)", ["a", "b", "c", "d"]),
+            ("(%s,%s)", ["e", "f"]),
+        ]
+
+    def test_placeholder_per_column(self):
+        batches = list(
+            BaseAdapter.seed_insert_batches(None, self.table, 5, ["cast(? as int)", "?"])
+        )
+
+        assert batches == [
+            (
+                "(cast(? as int),?),(cast(? as int),?),(cast(? as int),?)",
+                ["a", "b", "c", "d", "e", "f"],
+            )
+        ]
+
+    def test_no_rows(self):
+        table = agate.Table([], ["x"])
+        assert list(BaseAdapter.seed_insert_batches(None, table, 2, "%s")) == []
+
+
+class TestGetRelation:
+    @pytest.fixture
+    def adapter(self, adapter):
+        adapter.config.quoting = {"database": False, "schema": False, "identifier": False}
+        adapter.cache.add(
+            adapter.Relation.create(database="dbt", schema="analytics", identifier="orders")
+        )
+        return adapter
+
+    def test_exact_match_is_served_from_cache(self, adapter):
+        with patch.object(adapter, "list_relations") as list_relations:
+            relation = adapter.get_relation("dbt", "analytics", "orders")
+
+        assert relation is not None
+        assert relation.identifier == "orders"
+        list_relations.assert_not_called()
+
+    def test_exact_match_ignores_case_when_unquoted(self, adapter):
+        with patch.object(adapter, "list_relations") as list_relations:
+            relation = adapter.get_relation("DBT", "ANALYTICS", "ORDERS")
+
+        assert relation is not None
+        assert relation.identifier == "orders"
+        list_relations.assert_not_called()
+
+    def test_missing_relation_falls_back_to_search(self, adapter):
+        with patch.object(
+            adapter, "list_relations", wraps=adapter.list_relations
+        ) as list_relations:
+            relation = adapter.get_relation("dbt", "analytics", "customers")
+
+        assert relation is None
+        list_relations.assert_called_once_with("dbt", "analytics")
+
+    def test_approximate_match_still_raises(self, adapter):
+        adapter.config.quoting = {"database": True, "schema": True, "identifier": True}
+        with pytest.raises(ApproximateMatchError):
+            adapter.get_relation("dbt", "analytics", "ORDERS")
+
+
+class TestLazyRelationsCache:
+    @pytest.fixture
+    def flags(self):
+        return {"enable_lazy_relations_cache": True}
+
+    @pytest.fixture
+    def adapter(self, adapter):
+        adapter.config.quoting = {"database": False, "schema": False, "identifier": False}
+        return adapter
+
+    @pytest.fixture
+    def schema(self, adapter):
+        return adapter.Relation.create(database="dbt", schema="analytics").without_identifier()
+
+    @pytest.fixture
+    def orders(self, adapter):
+        return adapter.Relation.create(database="dbt", schema="analytics", identifier="orders")
+
+    def test_set_relations_cache_lists_nothing(self, adapter, schema):
+        with patch.object(adapter, "list_relations_without_caching") as list_relations:
+            adapter.set_relations_cache([], required_schemas={schema})
+
+        list_relations.assert_not_called()
+        assert ("dbt", "analytics") not in adapter.cache
+
+    def test_first_miss_lists_schema_once(self, adapter, schema, orders):
+        adapter.set_relations_cache([], required_schemas={schema})
+        with patch.object(
+            adapter, "list_relations_without_caching", return_value=[orders]
+        ) as list_relations:
+            assert adapter.list_relations("dbt", "analytics") == [orders]
+            assert adapter.get_relation("dbt", "analytics", "orders") == orders
+
+        list_relations.assert_called_once()
+        assert ("dbt", "analytics") in adapter.cache
+
+    def test_concurrent_misses_are_coalesced(self, adapter, orders):
+        started = threading.Event()
+        release = threading.Event()
+
+        def list_slowly(schema_relation):
+            started.set()
+            release.wait(timeout=5)
+            return [orders]
+
+        results = []
+        with patch.object(
+            adapter, "list_relations_without_caching", side_effect=list_slowly
+        ) as list_relations:
+            first = threading.Thread(
+                target=lambda: results.append(adapter.list_relations("dbt", "analytics"))
+            )
+            first.start()
+            started.wait(timeout=5)
+            second = threading.Thread(
+                target=lambda: results.append(adapter.list_relations("dbt", "analytics"))
+            )
+            second.start()
+            release.set()
+            first.join()
+            second.join()
+
+        list_relations.assert_called_once()
+        assert results == [[orders], [orders]]
+
+    def test_failed_listing_is_retried(self, adapter, orders):
+        with patch.object(
+            adapter,
+            "list_relations_without_caching",
+            side_effect=[DbtRuntimeError("boom"), [orders]],
+        ):
+            with pytest.raises(DbtRuntimeError):
+                adapter.list_relations("dbt", "analytics")
+            assert adapter.list_relations("dbt", "analytics") == [orders]
+
+        assert adapter._pending_cache_schemas == {}
+
+    def test_added_relation_does_not_cache_unlisted_schema(self, adapter, orders):
+        customers = orders.incorporate(path={"identifier": "customers"})
+        adapter.cache_added(customers)
+
+        assert ("dbt", "analytics") not in adapter.cache
+        with patch.object(
+            adapter, "list_relations_without_caching", return_value=[orders, customers]
+        ) as list_relations:
+            assert adapter.get_relation("dbt", "analytics", "orders") == orders
+
+        list_relations.assert_called_once()
+
+    def test_renamed_relation_does_not_cache_unlisted_schema(self, adapter, orders):
+        staging = adapter.Relation.create(database="dbt", schema="staging", identifier="orders")
+        with patch.object(adapter, "list_relations_without_caching", return_value=[orders]):
+            adapter.list_relations("dbt", "analytics")
+        adapter.cache_renamed(orders, staging)
+
+        assert ("dbt", "staging") not in adapter.cache
+        assert adapter.get_relation("dbt", "analytics", "orders") is None
+
+    def test_listed_schema_is_kept_up_to_date(self, adapter, orders):
+        with patch.object(adapter, "list_relations_without_caching", return_value=[]):
+            adapter.list_relations("dbt", "analytics")
+        adapter.cache_added(orders)
+
+        assert adapter.get_relation("dbt", "analytics", "orders") == orders
+
+
+class TestColumnCache:
+    @pytest.fixture
+    def flags(self):
+        return {"enable_column_cache": True}
+
+    @pytest.fixture
+    def orders(self, adapter):
+        return adapter.Relation.create(database="dbt", schema="analytics", identifier="orders")
+
+    @pytest.fixture
+    def get_columns(self):
+        return MagicMock(return_value=[Column("id", "int")])
+
+    def test_columns_are_cached(self, adapter, orders, get_columns):
+        adapter._cached_columns_in_relation(orders, get_columns)
+        adapter._cached_columns_in_relation(orders, get_columns)
+
+        get_columns.assert_called_once()
+
+    def test_dropped_relations_are_forgotten(self, adapter, orders, get_columns):
+        adapter._cached_columns_in_relation(orders, get_columns)
+        adapter.cache_dropped(orders)
+        adapter._cached_columns_in_relation(orders, get_columns)
+
+        assert get_columns.call_count == 2
+
+    def test_executed_ddl_forgets_the_relation(self, adapter, orders, get_columns):
+        adapter._cached_columns_in_relation(orders, get_columns)
+        adapter.execute("select * from dbt.analytics.orders")
+        adapter._cached_columns_in_relation(orders, get_columns)
+        adapter.execute("alter table dbt.analytics.orders add column x int")
+        adapter._cached_columns_in_relation(orders, get_columns)
+
+        assert get_columns.call_count == 2
+
+
+class TestColumnPrefetch:
+    @pytest.fixture
+    def flags(self):
+        return {"enable_column_cache": True, "enable_column_prefetch": True}
+
+    @pytest.fixture
+    def adapter(self, adapter):
+        adapter.config.args = MagicMock(single_threaded=True)
+        return adapter
+
+    @pytest.fixture
+    def schema(self, adapter):
+        return adapter.Relation.create(database="dbt", schema="analytics").without_identifier()
+
+    @pytest.fixture
+    def orders(self, adapter):
+        return adapter.Relation.create(database="dbt", schema="analytics", identifier="orders")
+
+    def test_listed_schemas_seed_the_column_cache(self, adapter, schema, orders):
+        get_columns = MagicMock()
+        with patch.object(
+            adapter, "list_relations_without_caching", return_value=[orders]
+        ), patch.object(
+            adapter, "get_columns_in_schema", return_value={"ORDERS": [Column("id", "int")]}
+        ) as get_columns_in_schema:
+            adapter.set_relations_cache([], required_schemas={schema})
+
+        get_columns_in_schema.assert_called_once_with(schema)
+        assert adapter._cached_columns_in_relation(orders, get_columns) == [Column("id", "int")]
+        get_columns.assert_not_called()
+
+    def test_failed_prefetch_is_not_an_error(self, adapter, schema, orders):
+        get_columns = MagicMock(return_value=[Column("id", "int")])
+        with patch.object(
+            adapter, "list_relations_without_caching", return_value=[orders]
+        ), patch.object(adapter, "get_columns_in_schema", side_effect=DbtRuntimeError("boom")):
+            adapter.set_relations_cache([], required_schemas={schema})
+
+        assert ("dbt", "analytics") in adapter.cache
+        adapter._cached_columns_in_relation(orders, get_columns)
+        get_columns.assert_called_once()
+
+
+def test_column_cache_is_off_without_the_flag(adapter):
+    orders = adapter.Relation.create(database="dbt", schema="analytics", identifier="orders")
+    get_columns = MagicMock(return_value=[Column("id", "int")])
+
+    adapter._cached_columns_in_relation(orders, get_columns)
+    adapter._cached_columns_in_relation(orders, get_columns)
+
+    assert get_columns.call_count == 2
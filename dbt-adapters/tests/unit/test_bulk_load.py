@@ -0,0 +1,55 @@
+import datetime
+import io
+from decimal import Decimal
+
+import pytest
+
+from dbt.adapters import bulk_load
+from dbt.adapters.bulk_load import CsvRowsReader, csv_field, write_csv_rows
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (None, ""),
+        ("", '""'),
+        ('say "hi", then\nleave', '"say ""hi"", then\nleave"'),
+        (Decimal("1.50"), '"1.50"'),
+        (True, '"True"'),
+        (datetime.date(2020, 1, 2), '"2020-01-02"'),
+        (datetime.datetime(2020, 1, 2, 3, 4, 5), '"2020-01-02 03:04:05"'),
+        (datetime.timedelta(days=1, seconds=1), '"86401.0 seconds"'),
+    ],
+)
+def test_csv_field(value, expected):
+    assert csv_field(value) == expected
+
+
+ROWS = [(i, f"row {i}") for i in range(25)]
+EXPECTED = "".join(f'"{i}","row {i}"\n' for i in range(25))
+
+
+def test_write_csv_rows():
+    file = io.StringIO()
+    write_csv_rows(ROWS, file)
+    assert file.getvalue() == EXPECTED
+
+
+@pytest.mark.parametrize("size", [1, 7, 64, 100_000])
+def test_reader_read_in_chunks(monkeypatch, size):
+    monkeypatch.setattr(bulk_load, "CSV_CHUNK_ROWS", 4)
+    reader = CsvRowsReader(ROWS)
+    chunks = []
+    while chunk := reader.read(size):
+        assert len(chunk) <= size
+        chunks.append(chunk)
+    assert "".join(chunks) == EXPECTED
+
+
+def test_reader_readline_and_read_all(monkeypatch):
+    monkeypatch.setattr(bulk_load, "CSV_CHUNK_ROWS", 4)
+    reader = CsvRowsReader(ROWS)
+    assert reader.readline() == '"0","row 0"\n'
+    assert reader.read() == EXPECTED[len('"0","row 0"\n') :]
+    assert reader.read() == ""
+    assert reader.readline() == ""
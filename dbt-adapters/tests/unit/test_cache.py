@@ -525,3 +525,35 @@ class TestComplexCache(TestCase):
         self.assertEqual(len(self.cache.get_relations("dbt", "bar")), 1)
         self.assertEqual(len(self.cache.get_relations("dbt_2", "foo")), 1)
         self.assertEqual(len(self.cache.relations), 2)
+
+
+class TestDropSchema(TestComplexCache):
+    def test_drop_schema(self):
+        # dropping dbt.foo cascades to its dependents in dbt.bar and dbt_2.foo
+        self.cache.drop_schema("dbt", "foo")
+        self.assertEqual(len(self.cache.get_relations("dbt", "foo")), 0)
+        self.assertEqual(len(self.cache.get_relations("dbt", "bar")), 1)
+        self.assertEqual(len(self.cache.get_relations("dbt_2", "foo")), 1)
+        self.assertEqual(len(self.cache.relations), 2)
+        self.assertNotIn(("dbt", "foo"), self.cache.schemas)
+
+    def test_drop_schema_uppercase(self):
+        self.cache.drop_schema("DBT", "BAR")
+        self.assertEqual(len(self.cache.get_relations("dbt", "foo")), 3)
+        self.assertEqual(len(self.cache.get_relations("dbt", "bar")), 0)
+        self.assertEqual(len(self.cache.relations), 5)
+
+    def test_drop_schema_after_rename(self):
+        self.cache.rename(
+            make_relation("dbt", "foo", "table1"), make_relation("dbt", "baz", "table1")
+        )
+        self.cache.add_schema("dbt", "baz")
+        self.cache.drop_schema("dbt", "foo")
+        self.assertEqual(len(self.cache.get_relations("dbt", "baz")), 1)
+        self.assertEqual(len(self.cache.get_relations("dbt", "bar")), 1)
+        self.assertEqual(len(self.cache.get_relations("dbt_2", "foo")), 2)
+
+        # dependents of the renamed relation still cascade from its new name
+        self.cache.drop_schema("dbt", "baz")
+        self.assertEqual(len(self.cache.get_relations("dbt_2", "foo")), 1)
+        self.assertEqual(len(self.cache.relations), 2)
@@ -1,7 +1,7 @@
 from concurrent.futures import Future
 
 import agate
-from dbt_common.clients.agate_helper import DEFAULT_TYPE_TESTER
+from dbt_common.clients.agate_helper import DEFAULT_TYPE_TESTER, merge_tables
 
 from dbt.adapters.base.impl import catch_as_completed
 
@@ -103,3 +103,23 @@ class TestCatchAsCompleted:
         assert len(exceptions) == 1
         assert "connection failed" in str(exceptions[0])
         assert len(result) == 1
+
+    def test_matches_merge_tables(self):
+        """Appending shards as they complete gives the same table as merging
+        them all at the end, including when their column types differ."""
+        tables = [
+            _make_catalog_table([{"column_name": "id", "column_index": 1, "comment": None}]),
+            _make_catalog_table([{"column_name": "name", "column_index": 2, "comment": None}]),
+            _make_catalog_table([{"column_name": "ratio", "column_index": 2.5, "comment": None}]),
+        ]
+
+        result, exceptions = catch_as_completed([_resolved_future(t) for t in tables])
+        expected = merge_tables(tables)
+
+        assert len(exceptions) == 0
+        assert result.column_names == expected.column_names
+        assert [type(t) for t in result.column_types] == [type(t) for t in expected.column_types]
+        # as_completed yields finished futures in no particular order
+        assert sorted(tuple(row) for row in result.rows) == sorted(
+            tuple(row) for row in expected.rows
+        )
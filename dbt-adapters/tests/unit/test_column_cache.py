@@ -0,0 +1,143 @@
+from unittest import mock
+
+import pytest
+
+from dbt.adapters.base import BaseRelation
+from dbt.adapters.base.column import Column
+from dbt.adapters.column_cache import ColumnCache
+
+
+def make_relation(schema, identifier):
+    return BaseRelation.create(database="dbt", schema=schema, identifier=identifier)
+
+
+class TestColumnCache:
+    @pytest.fixture
+    def orders(self):
+        return make_relation("analytics", "orders")
+
+    @pytest.fixture
+    def customers(self):
+        return make_relation("analytics", "customers")
+
+    @pytest.fixture
+    def cache(self, orders, customers):
+        cache = ColumnCache()
+        cache.get_or_fetch(orders, lambda: [Column("id", "int")])
+        cache.get_or_fetch(customers, lambda: [Column("name", "text")])
+        return cache
+
+    def test_columns_are_fetched_once(self, cache, orders):
+        fetch = mock.Mock()
+
+        assert cache.get_or_fetch(orders, fetch) == [Column("id", "int")]
+        assert cache.get_or_fetch(make_relation("ANALYTICS", "ORDERS"), fetch) == [
+            Column("id", "int")
+        ]
+        fetch.assert_not_called()
+        assert (cache.stats.hits, cache.stats.misses) == (2, 2)
+
+    def test_callers_get_a_copy(self, cache, orders):
+        cache.get_or_fetch(orders, mock.Mock()).append(Column("extra", "int"))
+
+        assert cache.get_or_fetch(orders, mock.Mock()) == [Column("id", "int")]
+
+    def test_relations_without_columns_are_not_cached(self, cache):
+        missing = make_relation("analytics", "missing")
+        fetch = mock.Mock(return_value=[])
+
+        cache.get_or_fetch(missing, fetch)
+        cache.get_or_fetch(missing, fetch)
+
+        assert fetch.call_count == 2
+
+    def test_invalidate(self, cache, orders):
+        cache.invalidate(orders)
+
+        assert cache.get_or_fetch(orders, lambda: [Column("id", "bigint")]) == [
+            Column("id", "bigint")
+        ]
+        assert cache.stats.invalidations == 1
+
+    @pytest.mark.parametrize(
+        "sql",
+        [
+            "select * from dbt.analytics.orders",
+            "insert into dbt.analytics.orders select * from dbt.analytics.orders__dbt_tmp",
+            "select replace(name, 'a', 'b') from dbt.analytics.orders",
+        ],
+    )
+    def test_statements_that_keep_columns(self, cache, orders, sql):
+        cache.invalidate_statement(sql)
+
+        assert cache.get_or_fetch(orders, mock.Mock()) == [Column("id", "int")]
+
+    def test_ddl_forgets_the_relations_it_mentions(self, cache, orders, customers):
+        cache.invalidate_statement('alter table "dbt"."analytics"."ORDERS" add column x int')
+
+        fetch = mock.Mock(return_value=[Column("id", "int"), Column("x", "int")])
+        assert cache.get_or_fetch(orders, fetch) == fetch.return_value
+        assert cache.get_or_fetch(customers, mock.Mock()) == [Column("name", "text")]
+
+    def test_schema_ddl_forgets_every_relation(self, cache, orders, customers):
+        cache.invalidate_statement("drop schema if exists dbt.analytics cascade")
+
+        assert cache.stats.invalidations == 2
+
+    def test_columns_fetched_during_an_invalidation_are_not_cached(self, cache):
+        late = make_relation("analytics", "late")
+
+        def fetch():
+            cache.invalidate_statement("create table dbt.analytics.late as select 1 as id")
+            return [Column("id", "int")]
+
+        cache.get_or_fetch(late, fetch)
+
+        refetch = mock.Mock(return_value=[Column("id", "int")])
+        cache.get_or_fetch(late, refetch)
+        refetch.assert_called_once()
+
+    def test_prefetch_seeds_relations_with_columns(self, cache, orders):
+        cache.invalidate(orders)
+        payments = make_relation("analytics", "payments")
+        empty = make_relation("analytics", "empty")
+
+        count = cache.prefetch(
+            lambda: [
+                (orders, [Column("id", "bigint")]),
+                (payments, [Column("amount", "numeric")]),
+                (empty, []),
+            ]
+        )
+
+        assert count == 2
+        assert cache.stats.prefetched == 2
+        assert cache.get_or_fetch(orders, mock.Mock()) == [Column("id", "bigint")]
+        assert cache.get_or_fetch(payments, mock.Mock()) == [Column("amount", "numeric")]
+
+    def test_prefetch_keeps_cached_columns(self, cache, customers):
+        cache.prefetch(lambda: [(customers, [Column("name", "varchar")])])
+
+        assert cache.get_or_fetch(customers, mock.Mock()) == [Column("name", "text")]
+
+    def test_prefetch_skips_names_that_only_differ_by_case(self, cache):
+        fetch = mock.Mock(return_value=[Column("id", "int")])
+
+        cache.prefetch(
+            lambda: [
+                (make_relation("analytics", "Events"), [Column("id", "int")]),
+                (make_relation("analytics", "events"), [Column("id", "text")]),
+            ]
+        )
+
+        cache.get_or_fetch(make_relation("analytics", "events"), fetch)
+        fetch.assert_called_once()
+
+    def test_prefetch_during_an_invalidation_caches_nothing(self, cache):
+        late = make_relation("analytics", "late")
+
+        def fetch():
+            cache.invalidate_statement("create table dbt.analytics.late as select 1 as id")
+            return [(late, [Column("id", "int")])]
+
+        assert cache.prefetch(fetch) == 0
@@ -0,0 +1,197 @@
+from multiprocessing import get_context
+from types import SimpleNamespace
+from typing import Any, Dict
+from unittest import mock
+
+import pytest
+
+from dbt.adapters.base import BaseRelation
+from dbt.adapters.cache import RelationsCache
+from dbt.adapters.persistent_cache import PersistentRelationsCache
+
+
+def make_relation(database, schema, identifier, type="table"):
+    return BaseRelation.create(database=database, schema=schema, identifier=identifier, type=type)
+
+
+def make_schema(database, schema):
+    return BaseRelation.create(database=database, schema=schema).without_identifier()
+
+
+class TestPersistentRelationsCache:
+    @pytest.fixture
+    def path(self, tmp_path):
+        return str(tmp_path / "relations_cache.json")
+
+    def test_round_trip(self, path):
+        store = PersistentRelationsCache(path, "abc")
+        store.update("dbt", "analytics", [make_relation("dbt", "analytics", "orders")], "v1")
+        store.save(RelationsCache())
+
+        loaded = PersistentRelationsCache(path, "abc")
+        loaded.load()
+        signal, relations = loaded.get("DBT", "ANALYTICS")
+        assert signal == "v1"
+        assert BaseRelation.from_dict(relations[0]) == make_relation("dbt", "analytics", "orders")
+
+    def test_other_credentials_are_ignored(self, path):
+        store = PersistentRelationsCache(path, "abc")
+        store.update("dbt", "analytics", [], "v1")
+        store.save(RelationsCache())
+
+        loaded = PersistentRelationsCache(path, "xyz")
+        loaded.load()
+        assert loaded.get("dbt", "analytics") is None
+
+    def test_corrupt_file_is_ignored(self, path):
+        with open(path, "w") as fp:
+            fp.write("{not json")
+
+        store = PersistentRelationsCache(path, "abc")
+        store.load()
+        assert store.get("dbt", "analytics") is None
+
+    def test_invalidated_schema_is_saved_from_cache_without_signal(self, path):
+        store = PersistentRelationsCache(path, "abc")
+        store.update("dbt", "analytics", [make_relation("dbt", "analytics", "orders")], "v1")
+        store.invalidate("dbt", "analytics")
+
+        cache = RelationsCache()
+        cache.add(make_relation("dbt", "analytics", "customers"))
+        store.save(cache)
+
+        loaded = PersistentRelationsCache(path, "abc")
+        loaded.load()
+        signal, relations = loaded.get("dbt", "analytics")
+        assert signal is None
+        assert [r["path"]["identifier"] for r in relations] == ["customers"]
+
+
+class TestAdapterWarmStart:
+    @pytest.fixture
+    def flags(self) -> Dict[str, Any]:
+        return {"enable_persistent_relations_cache": True}
+
+    @pytest.fixture
+    def config(self, config, tmp_path):
+        config.target_path = str(tmp_path)
+        config.args = SimpleNamespace(single_threaded=True)
+        return config
+
+    @pytest.fixture
+    def schema(self):
+        return make_schema("test_database", "analytics")
+
+    @pytest.fixture
+    def orders(self):
+        return make_relation("test_database", "analytics", "orders")
+
+    def _populate(self, adapter, schema, listed, signals=None):
+        with mock.patch.object(
+            adapter, "list_relations_without_caching", return_value=listed
+        ) as list_relations, mock.patch.object(
+            adapter, "_get_relations_cache_signals", return_value=signals or {}
+        ):
+            adapter.set_relations_cache([], required_schemas={schema})
+            relations = adapter.list_relations(schema.database, schema.schema)
+            adapter.cleanup_connections()
+        return list_relations, relations
+
+    def _new_adapter(self, adapter):
+        return type(adapter)(adapter.config, get_context("spawn"))
+
+    def test_cold_start_lists_and_persists(self, adapter, schema, orders):
+        list_relations, relations = self._populate(adapter, schema, [orders])
+
+        list_relations.assert_called_once()
+        assert relations == [orders]
+        assert adapter._persistent_cache.stats.misses == 1
+
+    def test_unchanged_signal_skips_listing(self, adapter, schema, orders):
+        signals = {("test_database", "analytics"): "v1"}
+        self._populate(adapter, schema, [orders], signals)
+
+        warm = self._new_adapter(adapter)
+        list_relations, relations = self._populate(warm, schema, [], signals)
+
+        list_relations.assert_not_called()
+        assert relations == [orders]
+        assert warm._persistent_cache.stats.hits == 1
+
+    def test_changed_signal_relists(self, adapter, schema, orders):
+        self._populate(adapter, schema, [orders], {("test_database", "analytics"): "v1"})
+
+        customers = make_relation("test_database", "analytics", "customers")
+        warm = self._new_adapter(adapter)
+        list_relations, relations = self._populate(
+            warm, schema, [customers], {("test_database", "analytics"): "v2"}
+        )
+
+        list_relations.assert_called_once()
+        assert relations == [customers]
+        assert warm._persistent_cache.stats.stale == 1
+
+    def test_modified_schema_is_relisted_next_run(self, adapter, schema, orders):
+        signals = {("test_database", "analytics"): "v1"}
+        with mock.patch.object(adapter, "list_relations_without_caching", return_value=[orders]):
+            with mock.patch.object(adapter, "_get_relations_cache_signals", return_value=signals):
+                adapter.set_relations_cache([], required_schemas={schema})
+        adapter.cache_added(make_relation("test_database", "analytics", "customers"))
+        adapter.cleanup_connections()
+
+        warm = self._new_adapter(adapter)
+        list_relations, _ = self._populate(warm, schema, [orders], signals)
+
+        list_relations.assert_called_once()
+        assert warm._persistent_cache.stats.stale == 1
+
+    def test_failing_signals_are_optional(self, adapter, schema, orders):
+        with mock.patch.object(
+            adapter, "list_relations_without_caching", return_value=[orders]
+        ), mock.patch.object(
+            adapter, "_get_relations_cache_signals", side_effect=ValueError("boom")
+        ):
+            adapter.set_relations_cache([], required_schemas={schema})
+            assert adapter.list_relations(schema.database, schema.schema) == [orders]
+            adapter.cleanup_connections()
+
+        warm = self._new_adapter(adapter)
+        with mock.patch.object(
+            warm, "list_relations_without_caching", return_value=[orders]
+        ) as list_relations, mock.patch.object(
+            warm, "_get_relations_cache_signals", side_effect=ValueError("boom")
+        ):
+            warm.set_relations_cache([], required_schemas={schema})
+            assert warm.list_relations(schema.database, schema.schema) == [orders]
+
+        list_relations.assert_called_once()
+
+    def test_failed_refresh_lists_the_schema_again(self, adapter, schema, orders):
+        self._populate(adapter, schema, [orders])
+
+        customers = make_relation("test_database", "analytics", "customers")
+        warm = self._new_adapter(adapter)
+        warm.config.quoting = {"database": False, "schema": False, "identifier": False}
+        with mock.patch.object(
+            warm, "list_relations_without_caching", return_value=[customers]
+        ) as list_relations, mock.patch.object(
+            warm.cache, "replace_schema", side_effect=ValueError("boom")
+        ):
+            warm.set_relations_cache([], required_schemas={schema})
+            assert warm._pending_cache_schemas == {}
+            assert warm.list_relations(schema.database, schema.schema) == [customers]
+
+        # once in the background, and once more for the lookup
+        assert list_relations.call_count == 2
+
+    def test_clearing_the_cache_forgets_pending_schemas(self, adapter, schema, orders):
+        self._populate(adapter, schema, [orders])
+
+        warm = self._new_adapter(adapter)
+        with mock.patch.object(warm, "_revalidate_relations_cache"):
+            warm.set_relations_cache([], required_schemas={schema})
+        assert warm._pending_cache_schemas != {}
+
+        with mock.patch.object(warm, "list_relations_without_caching", return_value=[orders]):
+            warm.set_relations_cache([], clear=True, required_schemas=set())
+        assert warm._pending_cache_schemas == {}
@@ -0,0 +1,53 @@
+from unittest import mock
+
+from dbt.adapters.base.pool import HandlePool
+
+
+class TestHandlePool:
+    def test_reuses_released_handles(self):
+        close = mock.MagicMock()
+        pool = HandlePool("test", close=close)
+        handle = object()
+
+        assert pool.acquire("key", idle_timeout=60) is None
+        assert pool.release("key", handle, max_size=2)
+        assert pool.acquire("other", idle_timeout=60) is None
+        assert pool.acquire("key", idle_timeout=60) is handle
+        assert pool.acquire("key", idle_timeout=60) is None
+        assert (pool.hits, pool.misses) == (1, 3)
+        close.assert_not_called()
+
+    def test_release_refuses_handles_past_max_size(self):
+        pool = HandlePool("test", close=mock.MagicMock())
+
+        assert pool.release("key", "first", max_size=1)
+        assert not pool.release("key", "second", max_size=1)
+        assert pool.acquire("key", idle_timeout=60) == "first"
+
+    def test_closes_idle_and_failing_handles(self):
+        close = mock.MagicMock()
+        pool = HandlePool("test", close=close)
+        check = mock.MagicMock(side_effect=lambda handle, idle: handle != "broken")
+
+        with mock.patch("dbt.adapters.base.pool.time.monotonic") as monotonic:
+            monotonic.return_value = 0
+            pool.release("key", "idle", max_size=3)
+            monotonic.return_value = 100
+            pool.release("key", "broken", max_size=3)
+            monotonic.return_value = 120
+            assert pool.acquire("key", idle_timeout=60, check=check) is None
+
+        check.assert_called_once_with("broken", 20)
+        assert close.call_args_list == [mock.call("broken"), mock.call("idle")]
+        assert (pool.hits, pool.misses) == (0, 1)
+
+    def test_drain_closes_idle_handles(self):
+        close = mock.MagicMock()
+        pool = HandlePool("test", close=close)
+        pool.release("key", "a", max_size=2)
+        pool.release("key", "b", max_size=2)
+
+        pool.drain("key")
+
+        assert sorted(c.args[0] for c in close.call_args_list) == ["a", "b"]
+        assert pool.acquire("key", idle_timeout=60) is None
@@ -1,8 +1,50 @@
 import unittest
+from contextlib import contextmanager
+from multiprocessing import get_context
+from unittest import mock
 
+import agate
+import pyarrow
+
+from dbt.adapters.arrow import ArrowResultTable
+from dbt.adapters.contracts.connection import AdapterResponse
 from dbt.adapters.sql import SQLConnectionManager
 
 
+class FakeCursor:
+    def __init__(self, rows, description=(("id",), ("name",))):
+        self.rows = list(rows)
+        self.description = description
+        self.fetch_sizes = []
+
+    def fetchmany(self, size):
+        self.fetch_sizes.append(size)
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+    def fetchall(self):
+        return self.fetchmany(len(self.rows))
+
+
+class StubConnectionManager(SQLConnectionManager):
+    TYPE = "stub"
+
+    def cancel(self, connection):
+        pass
+
+    @classmethod
+    def get_response(cls, cursor):
+        return AdapterResponse(_message="OK")
+
+    @classmethod
+    def open(cls, connection):
+        return connection
+
+    @contextmanager
+    def exception_handler(self, sql):
+        yield
+
+
 class TestProcessSQLResult(unittest.TestCase):
     def test_duplicated_columns(self):
         cols_with_one_dupe = ["a", "b", "a", "d"]
@@ -18,3 +60,124 @@ class TestProcessSQLResult(unittest.TestCase):
             list(SQLConnectionManager.process_results(cols_with_more_dupes, rows)),
             [{"a": 1, "a_2": 2, "a_3": 3, "b": 4}],
         )
+
+
+class TestStreamSQLResult(unittest.TestCase):
+    def setUp(self):
+        self.connections = StubConnectionManager(mock.Mock(), get_context("spawn"))
+        self.rows = [(i, f"row_{i}") for i in range(5)]
+
+    def test_stream_fetches_in_batches(self):
+        cursor = FakeCursor(self.rows)
+        with mock.patch.object(self.connections, "add_query", return_value=(None, cursor)):
+            batches = list(self.connections.stream("select 1", batch_size=2))
+
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+        self.assertEqual(batches[0][0], {"id": 0, "name": "row_0"})
+        self.assertEqual(cursor.fetch_sizes, [2, 2, 2, 2])
+
+    def test_stream_without_results(self):
+        cursor = FakeCursor([], description=None)
+        with mock.patch.object(self.connections, "add_query", return_value=(None, cursor)):
+            self.assertEqual(list(self.connections.stream("create table x (id int)")), [])
+
+    def test_declared_stream_closes_cursor(self):
+        queries = []
+        results = [self.rows[:2], self.rows[2:3]]
+
+        def add_query(sql, auto_begin=True):
+            queries.append(sql)
+            if sql.startswith("fetch"):
+                return None, FakeCursor(results.pop(0))
+            return None, FakeCursor([], description=None)
+
+        with mock.patch.object(self.connections, "add_query", side_effect=add_query):
+            _, (column_names, batches) = self.connections._open_declared_result_stream(
+                "select 1", False, 2, begin=True
+            )
+            rows = [row for batch in batches for row in batch]
+
+        self.assertEqual(column_names, ["id", "name"])
+        self.assertEqual(rows, self.rows[:3])
+        name = queries[1].split()[1]
+        self.assertEqual(
+            queries,
+            [
+                "begin",
+                f"declare {name} cursor for select 1",
+                f"fetch forward 2 from {name}",
+                f"fetch forward 2 from {name}",
+                f"close {name}",
+                "commit",
+            ],
+        )
+
+    def test_spilled_result_matches_fetched_result(self):
+        with mock.patch.object(
+            self.connections, "add_query", side_effect=lambda *a: (None, FakeCursor(self.rows))
+        ):
+            _, fetched = self.connections.execute("select 1", fetch=True)
+            self.connections.set_spill_results_checker(lambda: True)
+            _, spilled = self.connections.execute("select 1", fetch=True)
+            _, limited = self.connections.execute("select 1", fetch=True, limit=3)
+
+        self.assertEqual(spilled.column_names, fetched.column_names)
+        self.assertEqual([tuple(r) for r in spilled.rows], [tuple(r) for r in fetched.rows])
+        self.assertEqual(len(limited.rows), 3)
+
+    def test_spilled_result_runs_the_statement_itself(self):
+        self.connections.set_spill_results_checker(lambda: True)
+        response = AdapterResponse(_message="INSERT 0 2", rows_affected=2)
+        with mock.patch.object(
+            self.connections, "add_query", return_value=(None, FakeCursor(self.rows[:2]))
+        ) as add_query, mock.patch.object(self.connections, "get_response", return_value=response):
+            result, table = self.connections.execute(
+                "insert into x select 1 returning id, name", fetch=True
+            )
+
+        add_query.assert_called_once_with("insert into x select 1 returning id, name", False)
+        self.assertIs(result, response)
+        self.assertEqual(len(table.rows), 2)
+
+
+class TestArrowSQLResult(unittest.TestCase):
+    def setUp(self):
+        self.connections = StubConnectionManager(mock.Mock(), get_context("spawn"))
+        self.connections.set_arrow_results_checker(lambda: True)
+        self.arrow_table = pyarrow.Table.from_arrays(
+            [pyarrow.array([1, 2, 3]), pyarrow.array(["a", "b", None]), pyarrow.array([4, 5, 6])],
+            names=["id", "name", "id"],
+        )
+
+    def test_pyarrow_is_only_looked_for_when_enabled(self):
+        self.connections.set_arrow_results_checker(lambda: False)
+        with mock.patch("dbt.adapters.base.connections.arrow_available") as arrow_available:
+            self.assertFalse(self.connections._should_fetch_arrow_results())
+
+        arrow_available.assert_not_called()
+
+    def test_agate_table_is_built_lazily(self):
+        cursor = FakeCursor([])
+        with mock.patch.object(
+            self.connections, "add_query", return_value=(None, cursor)
+        ), mock.patch.object(
+            StubConnectionManager, "get_arrow_result_from_cursor", return_value=self.arrow_table
+        ):
+            _, table = self.connections.execute("select 1", fetch=True)
+
+        self.assertIsInstance(table, ArrowResultTable)
+        self.assertEqual(len(table), 3)
+        self.assertEqual(table.column_names, ["id", "name", "id_2"])
+        self.assertIsNone(table._agate_table)
+
+        self.assertEqual(
+            [tuple(row) for row in table.rows], [(1, "a", 4), (2, "b", 5), (3, None, 6)]
+        )
+        self.assertIsInstance(table.agate_table, agate.Table)
+
+    def test_falls_back_without_native_arrow(self):
+        cursor = FakeCursor([(1, "a")])
+        with mock.patch.object(self.connections, "add_query", return_value=(None, cursor)):
+            _, table = self.connections.execute("select 1", fetch=True)
+
+        self.assertIsInstance(table, agate.Table)
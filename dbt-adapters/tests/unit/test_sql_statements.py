@@ -0,0 +1,52 @@
+import pytest
+
+from dbt.adapters.sql.statements import split_statements
+
+
+@pytest.mark.parametrize(
+    "sql,expected",
+    [
+        ("", []),
+        ("select 1", ["select 1"]),
+        ("begin; select 1; commit;", ["begin;", "select 1;", "commit;"]),
+        ("-- header\nselect 1; select 2", ["-- header\nselect 1;", "select 2"]),
+        ("select 'a;''b'; select 2", ["select 'a;''b';", "select 2"]),
+        ("select 'a\\';b'; select 2", ["select 'a\\';b';", "select 2"]),
+        ('select "a;b" from t; select 2', ['select "a;b" from t;', "select 2"]),
+        ("select $$a;b$$; select 2", ["select $$a;b$$;", "select 2"]),
+        (
+            "create function f() returns int as $body$ begin return 1; end; $body$; select 2",
+            [
+                "create function f() returns int as $body$ begin return 1; end; $body$;",
+                "select 2",
+            ],
+        ),
+        ("select a$b; select 2", ["select a$b;", "select 2"]),
+        ("select 1 /* a; b */; select 2", ["select 1 /* a; b */;", "select 2"]),
+        ("select 1 -- a; b\n; select 2", ["select 1 -- a; b\n;", "select 2"]),
+        ("select 1; -- trailing", ["select 1; -- trailing"]),
+        ("select 1;\n-- only a comment;\n/* and another; */", ["select 1;"]),
+        ("select 1;; ;select 2", ["select 1;", "select 2"]),
+        ("select 'unterminated; select 2", ["select 'unterminated; select 2"]),
+    ],
+)
+def test_split_statements(sql, expected):
+    assert split_statements(sql) == expected
+
+
+def test_split_statements_slash_comments():
+    sql = "put file:///tmp/data.csv @stage; // a comment; \nselect 1 // another; \n;"
+    assert split_statements(sql, slash_comments=True) == [
+        "put file:///tmp/data.csv @stage; // a comment;",
+        "select 1 // another; \n;",
+    ]
+    assert split_statements("select 1 // not a comment; select 2") == [
+        "select 1 // not a comment;",
+        "select 2",
+    ]
+
+
+def test_split_statements_returns_a_new_list():
+    statements = split_statements("select 1; select 2")
+    statements.append("select 3")
+    assert split_statements("select 1; select 2") == ["select 1;", "select 2"]
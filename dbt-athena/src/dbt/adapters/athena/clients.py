@@ -0,0 +1,90 @@
+import threading
+from typing import Any, Dict, Hashable, Tuple
+
+import boto3.session
+
+from dbt.adapters.athena.config import get_boto3_config
+
+
+def session_identity(credentials: Any, session: boto3.session.Session) -> Hashable:
+    """What a client made with the given session authenticates as. Clients of
+    sessions with the same identity are interchangeable.
+    """
+    if credentials.assume_role_arn:
+        # the session of an assumed role is shared until it is about to
+        # expire, then replaced by a session with new credentials
+        return session
+    return (
+        credentials.aws_profile_name,
+        credentials.aws_access_key_id,
+        credentials.aws_secret_access_key,
+        credentials.aws_session_token,
+    )
+
+
+class Boto3ClientRegistry:
+    """boto3 clients and resources, made once per thread and reused for the
+    rest of the run.
+
+    Making a client resolves its endpoint and credentials and sets up a new
+    HTTP connection pool, which takes tens of milliseconds, and has to be done
+    under a lock, as boto3 sessions are not thread safe. A reused client keeps
+    its connections alive between calls, and only the first call of a thread
+    for a service takes the lock.
+
+    Each thread gets its own clients and resources, as resources are not
+    thread safe. A thread's entry for a service is only ever read or replaced
+    by that thread, so looking it up needs no lock.
+
+    :param create_lock: Held while making a client or resource.
+    """
+
+    def __init__(self, create_lock: Any) -> None:
+        self._create_lock = create_lock
+        self._entries: Dict[Hashable, Tuple[Hashable, Any]] = {}
+
+    def client(
+        self,
+        session: boto3.session.Session,
+        identity: Hashable,
+        service_name: str,
+        region_name: str,
+        num_retries: int,
+    ) -> Any:
+        return self._get("client", session, identity, service_name, region_name, num_retries)
+
+    def resource(
+        self,
+        session: boto3.session.Session,
+        identity: Hashable,
+        service_name: str,
+        region_name: str,
+        num_retries: int,
+    ) -> Any:
+        return self._get("resource", session, identity, service_name, region_name, num_retries)
+
+    def _get(
+        self,
+        kind: str,
+        session: boto3.session.Session,
+        identity: Hashable,
+        service_name: str,
+        region_name: str,
+        num_retries: int,
+    ) -> Any:
+        key = (threading.get_ident(), kind, service_name, region_name, num_retries)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == identity:
+            return entry[1]
+
+        factory = session.client if kind == "client" else session.resource
+        with self._create_lock:
+            created = factory(
+                service_name,
+                region_name=region_name,
+                config=get_boto3_config(num_retries=num_retries),
+            )
+        # replaces the entry of an identity that is no longer used, like
+        # expired assumed role credentials
+        self._entries[key] = (identity, created)
+        return created
@@ -1,3 +1,4 @@
+import codecs
 import json
 import re
 from weakref import WeakSet
@@ -8,6 +9,7 @@ from dataclasses import dataclass
 from datetime import date, datetime, time, timezone, tzinfo
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from decimal import Decimal
+from itertools import islice
 from ipaddress import IPv4Address, IPv6Address, ip_address
 from time import sleep
 from typing import (
@@ -16,8 +18,11 @@ from typing import (
     cast,
     Deque,
     Dict,
+    Hashable,
+    Iterable,
     List,
     Optional,
+    Sequence,
     Tuple,
     TypeAlias,
     Union,
@@ -30,6 +35,7 @@ from botocore.config import Config as BotoConfig
 from mypy_boto3_athena.client import AthenaClient
 from mypy_boto3_athena.type_defs import (
     ColumnInfoTypeDef,
+    GetQueryExecutionOutputTypeDef,
     GetQueryResultsInputTypeDef,
     DatumTypeDef,
     QueryExecutionTypeDef,
@@ -53,6 +59,8 @@ from dbt.adapters.athena.exceptions import (
     AthenaQueryFailedError,
 )
 from dbt.adapters.athena.query_headers import AthenaMacroQueryStringSetter
+from dbt.adapters.athena.clients import session_identity
+from dbt.adapters.athena.query_poller import AthenaQueryPoller, AthenaQueryPollers, poll_delays
 from dbt.adapters.athena.session import get_boto3_session
 from dbt.adapters.athena.connections_legacy import (
     AthenaConnectionManager as PyAthenaConnectionManager,
@@ -96,6 +104,15 @@ class AthenaCredentials(Credentials):
     assume_role_session_name: str = "dbt-athena"
     assume_role_duration_seconds: int = 3600
     poll_interval: float = 1.0
+    # the first delay before polling a query's state again, doubling with
+    # every poll up to poll_interval
+    initial_poll_interval: float = 0.05
+    # poll the state of all running queries from one background thread, with
+    # batch_get_query_execution, instead of from each thread separately
+    batch_poll_queries: bool = False
+    # read results past their first page from the query's output file in S3,
+    # instead of from get_query_results 1000 rows at a time
+    fetch_results_from_s3: bool = False
     debug_query_state: bool = False
     _ALIASES = {"catalog": "database"}
     num_retries: int = 5
@@ -141,10 +158,13 @@ class AthenaCredentials(Credentials):
             "aws_profile_name",
             # aws_secret_access_key and aws_session_token are intentionally omitted: they are
             # secrets and _connection_keys controls what is surfaced (e.g. by `dbt debug`).
+            "batch_poll_queries",
             "connection_manager",
             "database",
             "debug_query_state",
             "endpoint_url",
+            "fetch_results_from_s3",
+            "initial_poll_interval",
             "lf_tags_database",
             "num_boto3_retries",
             "num_iceberg_retries",
@@ -247,10 +267,14 @@ class AthenaCursor:
         formatter: AthenaParameterFormatter = AthenaParameterFormatter(),
         poll_delay: Callable[[float], None] = sleep,
         retry_interval_multiplier: int = 1,
+        poller: Optional[AthenaQueryPoller] = None,
+        s3_client_factory: Optional[Callable[[], Any]] = None,
     ) -> None:
         self._client = athena_client
         self._credentials = credentials
         self._poll_delay = poll_delay
+        self._poller = poller
+        self._s3_client_factory = s3_client_factory
         self._formatter = formatter
         self._with_throttling_retries = Retrying(
             retry=retry_if_exception(_is_api_request_error),
@@ -317,43 +341,68 @@ class AthenaCursor:
     def _await_completion(self) -> None:
         if self._query_execution_id is None:
             return
+        if self._poller is not None:
+            status_response = self._poller.wait(self._query_execution_id)
+        else:
+            status_response = self._poll_until_done(self._query_execution_id)
+
+        query_execution = status_response.get("QueryExecution", {})
+        status = query_execution.get("Status", {})
+        self.state = status.get("State", None)
+        if self.state == AthenaCursor.STATE_SUCCEEDED:
+            statistics = query_execution.get("Statistics", {})
+            self.data_scanned_in_bytes = statistics.get("DataScannedInBytes", 0)
+            plain_text = self._is_plain_text_result(query_execution)
+            output_location = None
+            if self._credentials.fetch_results_from_s3:
+                output_location = query_execution.get("ResultConfiguration", {}).get(
+                    "OutputLocation"
+                )
+            self._result_set = AthenaResultSet(
+                self._client,
+                self._query_execution_id,
+                plain_text,
+                output_location=output_location,
+                s3_client_factory=self._s3_client_factory,
+            )
+        elif self.state == AthenaCursor.STATE_FAILED:
+            raise AthenaQueryFailedError(
+                status.get("AthenaError", {}), status.get("StateChangeReason")
+            )
+        elif self.state == AthenaCursor.STATE_CANCELLED:
+            raise AthenaQueryCancelledError(status.get("StateChangeReason", None))
+        else:
+            raise AthenaError(f"Athena query {self._query_execution_id} has state {self.state}")
+
+    def _poll_until_done(self, query_execution_id: str) -> GetQueryExecutionOutputTypeDef:
+        delays = poll_delays(
+            self._credentials.initial_poll_interval, self._credentials.poll_interval
+        )
         while True:
             try:
                 status_response = self._client.get_query_execution(
-                    QueryExecutionId=self._query_execution_id
+                    QueryExecutionId=query_execution_id
                 )
             except Exception as e:
                 if _is_api_request_error(e):
                     LOGGER.warning(
-                        f"Athena query {self._query_execution_id} got error while polling status, will retry: {e}"
+                        f"Athena query {query_execution_id} got error while polling status, will retry: {e}"
                     )
                     self._poll_delay(self._credentials.poll_interval)
                     continue
                 else:
                     raise e
-            query_execution = status_response.get("QueryExecution", {})
-            status = query_execution.get("Status", {})
-            self.state = status.get("State", None)
-            LOGGER.debug(f"Athena query {self._query_execution_id} has state {self.state}")
-            if self.state == AthenaCursor.STATE_SUCCEEDED:
-                statistics = status_response.get("QueryExecution", {}).get("Statistics", {})
-                self.data_scanned_in_bytes = statistics.get("DataScannedInBytes", 0)
-                if self._query_execution_id:
-                    plain_text = self._is_plain_text_result(query_execution)
-                    self._result_set = AthenaResultSet(
-                        self._client, self._query_execution_id, plain_text
-                    )
-                    break
-                else:
-                    raise AthenaError("Could not create result set, query execution ID lost")
-            elif self.state == AthenaCursor.STATE_FAILED:
-                raise AthenaQueryFailedError(
-                    status.get("AthenaError", {}), status.get("StateChangeReason")
-                )
-            elif self.state == AthenaCursor.STATE_CANCELLED:
-                raise AthenaQueryCancelledError(status.get("StateChangeReason", None))
+            state = status_response.get("QueryExecution", {}).get("Status", {}).get("State", None)
+            LOGGER.debug(f"Athena query {query_execution_id} has state {state}")
+            if state in (
+                AthenaCursor.STATE_SUCCEEDED,
+                AthenaCursor.STATE_FAILED,
+                AthenaCursor.STATE_CANCELLED,
+            ):
+                return status_response
             # Query is still queued or running; wait before polling again.
-            self._poll_delay(self._credentials.poll_interval)
+            self.state = state
+            self._poll_delay(next(delays))
 
     def cancel(self) -> None:
         if self._query_execution_id:
@@ -404,6 +453,42 @@ class AthenaCursor:
         return self.fetchmany()
 
 
+# a field of a CSV file written by Athena, and the delimiter after it. NULL is
+# the only value that is written without quotes, as an empty field.
+_CSV_FIELD = re.compile(r'(?:"((?:[^"]|"")*)"|([^,"\n]*))(,|\n)')
+
+
+def _read_csv_records(chunks: Iterable[str]) -> Iterator[List[Optional[str]]]:
+    """Parse the records of a CSV file written by Athena, as it is read in chunks.
+    Unlike the csv module, this tells NULL apart from empty strings.
+    """
+    buffer = ""
+    for chunk in chunks:
+        buffer += chunk
+        pos = record_start = 0
+        record: List[Optional[str]] = []
+        # a match never ends in an incomplete record: a quoted field needs its
+        # closing quote, and every field the delimiter after it
+        while match := _CSV_FIELD.match(buffer, pos):
+            quoted, unquoted, delimiter = match.groups()
+            if quoted is not None:
+                record.append(quoted.replace('""', '"') if '"' in quoted else quoted)
+            else:
+                record.append(unquoted or None)
+            pos = match.end()
+            if delimiter == "\n":
+                yield record
+                record = []
+                record_start = pos
+        buffer = buffer[record_start:]
+    if buffer and not buffer.endswith("\n"):
+        yield from _read_csv_records([buffer + "\n"])
+
+
+# rows read and converted at a time from a result file in S3
+S3_RESULT_BATCH_ROWS = 1000
+
+
 class AthenaResultSet(Iterator[Row]):
     def __init__(
         self,
@@ -411,15 +496,21 @@ class AthenaResultSet(Iterator[Row]):
         query_execution_id: str,
         is_plain_text: bool,
         limit: Optional[int] = None,
+        output_location: Optional[str] = None,
+        s3_client_factory: Optional[Callable[[], Any]] = None,
     ) -> None:
         self._client = athena_client
         self._query_execution_id = query_execution_id
         self._limit = limit
         self._headers_skipped = False
         self._is_plain_text = is_plain_text
+        self._output_location = output_location
+        self._s3_client_factory = s3_client_factory
         self._rows: Deque[Row] = deque()
         self._next_token: Optional[str] = None
+        self._s3_rows: Optional[Iterator[Row]] = None
         self._column_info: Optional[List[ColumnMetadata]] = None
+        self._converters: List[Optional[Callable[[str], Cell]]] = []
         self._update_count: Optional[int] = None
         self._items = 0
 
@@ -427,7 +518,9 @@ class AthenaResultSet(Iterator[Row]):
         return self
 
     def __next__(self) -> Row:
-        if not self._rows and (self._next_token is not None or not self._headers_skipped):
+        if not self._rows and (
+            self._s3_rows is not None or self._next_token is not None or not self._headers_skipped
+        ):
             self._load_page()
         if self._rows and (self._limit is None or self._items < self._limit):
             self._items += 1
@@ -454,6 +547,12 @@ class AthenaResultSet(Iterator[Row]):
             return -1
 
     def _load_page(self) -> None:
+        if self._s3_rows is not None:
+            self._rows += islice(self._s3_rows, S3_RESULT_BATCH_ROWS)
+            if not self._rows:
+                self._s3_rows = None
+            return
+
         request: GetQueryResultsInputTypeDef = {"QueryExecutionId": self._query_execution_id}
         if self._next_token:
             request["NextToken"] = self._next_token
@@ -461,35 +560,94 @@ class AthenaResultSet(Iterator[Row]):
         self._next_token = results_response.get("NextToken", None)
         result_set = results_response.get("ResultSet", {})
         page_rows = result_set.get("Rows", [])
-        if not self._headers_skipped:
+        first_page = not self._headers_skipped
+        if first_page:
             if not self._is_plain_text:
                 page_rows = page_rows[1:]
             self._column_info = self._convert_column_info(
                 result_set.get("ResultSetMetadata", {}).get("ColumnInfo", [])
             )
+            self._converters = [self._converter(info[1]) for info in self._column_info]
             self._update_count = results_response.get("UpdateCount", -1)
             self._headers_skipped = True
-        self._rows += [self._convert_row(row) for row in page_rows]
+        self._rows += self._convert_rows(
+            [[datum.get("VarCharValue") for datum in row.get("Data", [])] for row in page_rows]
+        )
+        if first_page and self._next_token is not None and self._can_read_from_s3():
+            try:
+                self._s3_rows = self._read_s3_rows(skip=len(page_rows))
+                self._next_token = None
+            except Exception as e:
+                LOGGER.debug(
+                    f"Could not read the results of Athena query {self._query_execution_id} "
+                    f"from S3, getting them from the API instead: {e}"
+                )
+
+    def _can_read_from_s3(self) -> bool:
+        # the output of other statements, like CTAS, isn't a CSV of the result
+        return (
+            self._s3_client_factory is not None
+            and self._output_location is not None
+            and self._output_location.startswith("s3://")
+            and self._output_location.endswith(".csv")
+            and not self._is_plain_text
+        )
+
+    def _read_s3_rows(self, skip: int) -> Iterator[Row]:
+        assert self._s3_client_factory is not None and self._output_location is not None
+        bucket, key = self._output_location[len("s3://") :].split("/", 1)
+        # get the object right away, so a missing permission falls back to the API
+        body = self._s3_client_factory().get_object(Bucket=bucket, Key=key)["Body"]
+
+        def rows() -> Iterator[Row]:
+            records = _read_csv_records(
+                codecs.iterdecode(body.iter_chunks(chunk_size=1024 * 1024), "utf-8")
+            )
+            # the header, and the rows already returned by the first page
+            for _ in islice(records, skip + 1):
+                pass
+            while batch := list(islice(records, S3_RESULT_BATCH_ROWS)):
+                yield from self._convert_rows(batch)
+
+        return rows()
 
     def _convert_column_info(self, column_info: List[ColumnInfoTypeDef]) -> List[ColumnMetadata]:
         return [(info["Name"], info["Type"], None, None, None, None, None) for info in column_info]
 
-    def _convert_row(self, row: RowTypeDef) -> Row:
-        if self._column_info:
-            return tuple(
-                self._convert_type(self._column_info[index], datum)
-                for index, datum in enumerate(row.get("Data", []))
-            )
-        elif self._is_plain_text:
-            return tuple(datum.get("VarCharValue") for datum in row.get("Data", []))
-        else:
+    def _convert_rows(self, rows: List[Sequence[Optional[str]]]) -> List[Row]:
+        """Convert rows of values as strings to their column's types, a column
+        at a time, so each column's converter is only looked up once.
+        """
+        if not rows:
+            return []
+        if not self._column_info:
+            if self._is_plain_text:
+                return [tuple(row) for row in rows]
             raise AthenaError("No column info found")
+        columns: List[Sequence[Cell]] = []
+        for convert, values in zip(self._converters, zip(*rows)):
+            if convert is None:
+                columns.append(values)
+            else:
+                columns.append([None if value is None else convert(value) for value in values])
+        return list(zip(*columns))
+
+    def _convert_row(self, row: RowTypeDef) -> Row:
+        return self._convert_rows([[datum.get("VarCharValue") for datum in row.get("Data", [])]])[
+            0
+        ]
 
     def _convert_type(self, column_info: ColumnMetadata, datum: DatumTypeDef) -> Cell:
         if "VarCharValue" not in datum:
             return None
+        convert = self._converter(column_info[1])
         value = datum["VarCharValue"]
-        type = column_info[1]
+        return value if convert is None else convert(value)
+
+    def _converter(self, type: str) -> Optional[Callable[[str], Cell]]:
+        """The function that converts values of a column type from their string
+        representation, or None if they are left as strings.
+        """
         if (
             type == "int"
             or type == "integer"
@@ -497,35 +655,35 @@ class AthenaResultSet(Iterator[Row]):
             or type == "tinyint"
             or type == "smallint"
         ):
-            return int(value)
+            return int
         elif type == "float" or type == "double":
-            return float(value)
+            return float
         elif type == "boolean":
-            return value.lower() != "false"
+            return lambda value: value.lower() != "false"
         elif type == "date":
-            return datetime.strptime(value, "%Y-%m-%d").date()
+            return lambda value: datetime.strptime(value, "%Y-%m-%d").date()
         elif type == "timestamp":
-            return self._parse_timestamp(value)
+            return self._parse_timestamp
         elif type == "timestamp with time zone":
-            return self._parse_timestamp_with_time_zone(value)
+            return self._parse_timestamp_with_time_zone
         elif type == "time":
-            return self._parse_time(value)
+            return self._parse_time
         elif type == "time with time zone":
-            return self._parse_time_with_time_zone(value)
+            return self._parse_time_with_time_zone
         elif type == "varbinary":
-            return bytes.fromhex(value)
+            return bytes.fromhex
         elif type == "json":
-            return json.loads(value)
+            return json.loads
         elif type == "uuid":
-            return UUID(value)
+            return UUID
         elif type == "ipaddress":
-            return ip_address(value)
+            return ip_address
         elif type == "array":
-            return self._parse_array(value)
+            return self._parse_array
         elif type == "map" or type == "row":
-            return self._parse_map_or_row(value)
+            return self._parse_map_or_row
         else:
-            return value
+            return None
 
     TIMESTAMP_FORMATS = [
         "%Y-%m-%d %H:%M:%S.%f",
@@ -652,6 +810,22 @@ class AthenaResultSet(Iterator[Row]):
             return value
 
 
+def query_poller_key(credentials: AthenaCredentials) -> Hashable:
+    """The key of the query poller shared by connections with the given
+    credentials. Any client that can see the queries of a connection can poll
+    them.
+    """
+    return (
+        credentials.region_name,
+        credentials.endpoint_url,
+        credentials.aws_profile_name,
+        credentials.aws_access_key_id,
+        credentials.assume_role_arn,
+        credentials.initial_poll_interval,
+        credentials.poll_interval,
+    )
+
+
 class AthenaConnection(Connection):
     session: BotoSession
     region_name: str
@@ -660,11 +834,15 @@ class AthenaConnection(Connection):
         self,
         credentials: AthenaCredentials,
         boto_session_factory: Callable[[Connection], BotoSession] = get_boto3_session,
+        query_pollers: Optional[AthenaQueryPollers] = None,
     ) -> None:
         self.credentials = self._athena_credentials = credentials
         self.session = boto_session_factory(self)
         self.region_name = self.credentials.region_name
         self._client = None
+        self._s3_client = None
+        self._query_pollers = query_pollers
+        self._poller: Optional[AthenaQueryPoller] = None
         self._cursors: WeakSet = WeakSet()
 
     def connect(self, boto_config_factory: Callable[..., BotoConfig] = get_boto3_config) -> Self:
@@ -678,16 +856,49 @@ class AthenaConnection(Connection):
         if self._athena_credentials.endpoint_url:
             client_kwargs["endpoint_url"] = self._athena_credentials.endpoint_url
         self._client = self.session.client("athena", **client_kwargs)
+        if self._athena_credentials.batch_poll_queries and self._query_pollers is not None:
+            self._poller = self._shared_poller(self._query_pollers, self._client)
         return self
 
+    def _shared_poller(
+        self, query_pollers: AthenaQueryPollers, client: AthenaClient
+    ) -> AthenaQueryPoller:
+        credentials = self._athena_credentials
+        return query_pollers.get(
+            query_poller_key(credentials),
+            session_identity(credentials, self.session),
+            lambda: AthenaQueryPoller(
+                client,
+                credentials.initial_poll_interval,
+                credentials.poll_interval,
+                is_retryable=_is_api_request_error,
+            ),
+        )
+
     def cursor(self) -> AthenaCursor:
         if self._client is not None:
-            cursor = AthenaCursor(self._client, self._athena_credentials)
+            cursor = AthenaCursor(
+                self._client,
+                self._athena_credentials,
+                poller=self._poller,
+                s3_client_factory=self._get_s3_client,
+            )
             self._cursors.add(cursor)
             return cursor
         else:
             raise ConnectionError("Not connected")
 
+    def _get_s3_client(self) -> Any:
+        if self._s3_client is None:
+            self._s3_client = self.session.client(
+                "s3",
+                region_name=self.region_name,
+                config=get_boto3_config(
+                    num_retries=self._athena_credentials.effective_num_retries
+                ),
+            )
+        return self._s3_client
+
     def cancel(self) -> None:
         for cursor in self._cursors:
             cursor.cancel()
@@ -695,6 +906,8 @@ class AthenaConnection(Connection):
 
 class AthenaConnectionManager(SQLConnectionManager):
     TYPE = "athena"
+    # polls the queries of the open connections, when batch_poll_queries is set
+    _query_pollers = AthenaQueryPollers()
 
     def set_query_header(self, query_header_context: Dict[str, Any]) -> None:
         self.query_header = AthenaMacroQueryStringSetter(self.profile, query_header_context)
@@ -731,7 +944,9 @@ class AthenaConnectionManager(SQLConnectionManager):
             ):
                 return PyAthenaConnectionManager.open(connection)
             else:
-                connection.handle = AthenaConnection(credentials).connect()
+                connection.handle = AthenaConnection(
+                    credentials, query_pollers=cls._query_pollers
+                ).connect()
                 connection.state = ConnectionState.OPEN  # type: ignore[assignment]
         except ConnectionError as exc:
             raise exc
@@ -783,6 +998,13 @@ class AthenaConnectionManager(SQLConnectionManager):
         if connection.handle:
             connection.handle.cancel()
 
+    def cleanup_all(self) -> None:
+        super().cleanup_all()
+        # the poller thread and its client must not outlive the adapter
+        credentials = cast(AthenaCredentials, self.profile.credentials)
+        if credentials.batch_poll_queries:
+            self._query_pollers.stop(query_poller_key(credentials))
+
     def add_begin_query(self) -> None:
         pass
 
@@ -0,0 +1,82 @@
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from mypy_boto3_glue.type_defs import TableTypeDef
+
+_SchemaKey = Tuple[str, str]
+
+
+def _schema_key(database: Optional[str], schema: Optional[str]) -> _SchemaKey:
+    return (database or "").lower(), (schema or "").lower()
+
+
+class GlueTableCache:
+    """Glue table definitions fetched during a run, so the same table is not
+    fetched again by every adapter method that needs it.
+
+    Tables are keyed by the Athena data catalog (the relation's database), the
+    Glue database (the relation's schema) and the table name. A schema whose
+    tables were all stored from one paginated `get_tables` listing is marked
+    as complete, and can be served as a whole until any of its tables is
+    invalidated.
+
+    Only tables that exist are cached: a lookup that misses always goes to
+    Glue.
+    """
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self._tables: Dict[_SchemaKey, Dict[str, TableTypeDef]] = {}
+        self._complete_schemas: Set[_SchemaKey] = set()
+
+    def get(
+        self, database: Optional[str], schema: Optional[str], name: Optional[str]
+    ) -> Optional[TableTypeDef]:
+        """Get the cached definition of a table, or None if it isn't cached."""
+        with self.lock:
+            return self._tables.get(_schema_key(database, schema), {}).get((name or "").lower())
+
+    def get_schema(
+        self, database: Optional[str], schema: Optional[str]
+    ) -> Optional[List[TableTypeDef]]:
+        """Get every table of a schema, or None if the schema has not been
+        listed in full since it last changed.
+        """
+        key = _schema_key(database, schema)
+        with self.lock:
+            if key not in self._complete_schemas:
+                return None
+            return list(self._tables.get(key, {}).values())
+
+    def add(self, database: Optional[str], schema: Optional[str], table: TableTypeDef) -> None:
+        """Cache the definition of a single table."""
+        with self.lock:
+            tables = self._tables.setdefault(_schema_key(database, schema), {})
+            tables[table["Name"].lower()] = table
+
+    def set_schema(
+        self, database: Optional[str], schema: Optional[str], tables: Iterable[TableTypeDef]
+    ) -> None:
+        """Replace the cached tables of a schema with a full listing of it."""
+        key = _schema_key(database, schema)
+        with self.lock:
+            self._tables[key] = {table["Name"].lower(): table for table in tables}
+            self._complete_schemas.add(key)
+
+    def invalidate(
+        self, database: Optional[str], schema: Optional[str], name: Optional[str]
+    ) -> None:
+        """Forget a table that was created, changed or dropped. Its schema is
+        no longer complete either, since it may have gained or lost a table.
+        """
+        key = _schema_key(database, schema)
+        with self.lock:
+            self._tables.get(key, {}).pop((name or "").lower(), None)
+            self._complete_schemas.discard(key)
+
+    def invalidate_schema(self, database: Optional[str], schema: Optional[str]) -> None:
+        """Forget every table of a schema."""
+        key = _schema_key(database, schema)
+        with self.lock:
+            self._tables.pop(key, None)
+            self._complete_schemas.discard(key)
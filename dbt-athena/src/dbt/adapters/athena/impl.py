@@ -49,6 +49,7 @@ from dbt.adapters.athena.catalogs import (
     GlueCatalogIntegration,
     S3TablesCatalogIntegration,
 )
+from dbt.adapters.athena.clients import Boto3ClientRegistry, session_identity
 from dbt.adapters.athena.column import AthenaColumn
 from dbt.adapters.athena.config import get_boto3_config
 from dbt.adapters.athena.connections import AthenaCursor, AthenaError
@@ -66,6 +67,7 @@ from dbt.adapters.athena.exceptions import (
     S3LocationException,
     SnapshotMigrationRequired,
 )
+from dbt.adapters.athena.glue_cache import GlueTableCache
 from dbt.adapters.athena.lakeformation import (
     LfGrantsConfig,
     LfPermissions,
@@ -100,7 +102,7 @@ from dbt.adapters.capability import (
     CapabilitySupport,
     Support,
 )
-from dbt.adapters.contracts.connection import AdapterResponse
+from dbt.adapters.contracts.connection import AdapterResponse, Connection
 from dbt.adapters.contracts.relation import RelationConfig
 from dbt.adapters.sql import SQLAdapter
 
@@ -116,6 +118,18 @@ boto3_client_lock = Lock()
 _CATALOGS_V2_CAPABILITY = getattr(Capability, "CatalogsV2", None)  # type: ignore[attr-defined]
 
 
+def _is_not_found_error(error: ClientError) -> bool:
+    """Whether an Athena API error says the resource asked for doesn't exist."""
+    response = error.response
+    code = response.get("Error", {}).get("Code")
+    message = response.get("Error", {}).get("Message", "")
+    return (
+        response.get("ResponseMetadata", {}).get("HTTPStatusCode") == 404
+        or code == "ResourceNotFoundException"
+        or (code == "InvalidRequestException" and "not found" in message.lower())
+    )
+
+
 @dataclass
 class AthenaConfig(AdapterConfig):
     """
@@ -229,6 +243,15 @@ class AthenaAdapter(SQLAdapter):
         # Resolved once via STS and reused (the identity is stable for the run) so we don't
         # call GetCallerIdentity on every _get_data_catalog / relation lookup.
         self._aws_account_id: Optional[str] = None
+        # Glue table definitions fetched during the run, shared by every method that
+        # reads them and invalidated whenever dbt creates, changes or drops a table.
+        self._glue_table_cache = GlueTableCache()
+        # boto3 clients made for each thread, reused instead of made on every call
+        self._boto3_clients = Boto3ClientRegistry(boto3_client_lock)
+        # Athena data catalogs by name, looked up once as they don't change during the
+        # run. A catalog that doesn't exist is kept as the error its lookup raised.
+        self._data_catalogs: Dict[str, Union[DataCatalogTypeDef, ClientError]] = {}
+        self._data_catalogs_lock = Lock()
         # Register the default catalogs so models can reference them by name and so
         # models without a catalog fall back to standard Hive behavior.
         # NOTE: "info_schema" and "glue" are therefore reserved names — a catalogs.yml
@@ -281,16 +304,9 @@ class AthenaAdapter(SQLAdapter):
     @available
     def add_lf_tags_to_database(self, relation: AthenaRelation) -> None:
         conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
         if lf_tags := conn.credentials.lf_tags_database:
             config = LfTagsConfig(enabled=True, tags=lf_tags)
-            with boto3_client_lock:
-                lf_client = client.session.client(
-                    "lakeformation",
-                    client.region_name,
-                    config=get_boto3_config(num_retries=creds.effective_num_retries),
-                )
+            lf_client = self._boto3_client(conn, "lakeformation")
             manager = LfTagsManager(lf_client, relation, config)
             manager.process_lf_tags_database()
         else:
@@ -301,14 +317,7 @@ class AthenaAdapter(SQLAdapter):
         config = LfTagsConfig(**lf_tags_config)
         if config.enabled:
             conn = self.connections.get_thread_connection()
-            creds = conn.credentials
-            client = conn.handle
-            with boto3_client_lock:
-                lf_client = client.session.client(
-                    "lakeformation",
-                    client.region_name,
-                    config=get_boto3_config(num_retries=creds.effective_num_retries),
-                )
+            lf_client = self._boto3_client(conn, "lakeformation")
             manager = LfTagsManager(lf_client, relation, config)
             manager.process_lf_tags()
             return
@@ -319,14 +328,7 @@ class AthenaAdapter(SQLAdapter):
         lf_config = LfGrantsConfig(**lf_grants_config)
         if lf_config.data_cell_filters.enabled:
             conn = self.connections.get_thread_connection()
-            creds = conn.credentials
-            client = conn.handle
-            with boto3_client_lock:
-                lf = client.session.client(
-                    "lakeformation",
-                    region_name=client.region_name,
-                    config=get_boto3_config(num_retries=creds.effective_num_retries),
-                )
+            lf = self._boto3_client(conn, "lakeformation")
             catalog = self._get_data_catalog(relation.database)  # type:ignore
             catalog_id = get_catalog_id(catalog)
             lf_permissions = LfPermissions(catalog_id, relation, lf)  # type: ignore
@@ -340,15 +342,8 @@ class AthenaAdapter(SQLAdapter):
         """
         LOGGER.debug("get_work_group for %s", work_group)
         conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
 
-        with boto3_client_lock:
-            athena_client = client.session.client(
-                "athena",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
+        athena_client = self._boto3_client(conn, "athena")
 
         return athena_client.get_work_group(WorkGroup=work_group)
 
@@ -451,19 +446,18 @@ class AthenaAdapter(SQLAdapter):
         """
         Helper function to get a relation via Glue
         """
+        cached_table = self._glue_table_cache.get(
+            relation.database, relation.schema, relation.identifier
+        )
+        if cached_table is not None:
+            return {"Table": cached_table}  # type:ignore
+
         conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
 
         data_catalog = self._get_data_catalog(relation.database)  # type:ignore
         catalog_id = get_catalog_id(data_catalog)
 
-        with boto3_client_lock:
-            glue_client = client.session.client(
-                "glue",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
+        glue_client = self._boto3_client(conn, "glue")
 
         try:
             table = glue_client.get_table(
@@ -474,8 +468,34 @@ class AthenaAdapter(SQLAdapter):
                 LOGGER.debug(f"Table {relation.render()} does not exists - Ignoring")
                 return None
             raise e
+        self._glue_table_cache.add(relation.database, relation.schema, table["Table"])
         return table
 
+    @available
+    def invalidate_glue_table(self, relation: AthenaRelation) -> None:
+        """
+        Forget the cached Glue definition of a relation, after running DDL that changes it
+        """
+        self._glue_table_cache.invalidate(relation.database, relation.schema, relation.identifier)
+
+    def cache_added(self, relation: Optional[BaseRelation]) -> str:
+        result = super().cache_added(relation)
+        self.invalidate_glue_table(relation)  # type:ignore
+        return result
+
+    def cache_dropped(self, relation: Optional[BaseRelation]) -> str:
+        result = super().cache_dropped(relation)
+        self.invalidate_glue_table(relation)  # type:ignore
+        return result
+
+    def cache_renamed(
+        self, from_relation: Optional[BaseRelation], to_relation: Optional[BaseRelation]
+    ) -> str:
+        result = super().cache_renamed(from_relation, to_relation)
+        self.invalidate_glue_table(from_relation)  # type:ignore
+        self.invalidate_glue_table(to_relation)  # type:ignore
+        return result
+
     @available
     def get_glue_table_type(self, relation: AthenaRelation) -> Optional[TableType]:
         """
@@ -516,18 +536,11 @@ class AthenaAdapter(SQLAdapter):
         self, relation: AthenaRelation, where_condition: Union[str, List[str]]
     ) -> None:
         conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
 
         data_catalog = self._get_data_catalog(relation.database)  # type:ignore
         catalog_id = get_catalog_id(data_catalog)
 
-        with boto3_client_lock:
-            glue_client = client.session.client(
-                "glue",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
+        glue_client = self._boto3_client(conn, "glue")
 
         where_conditions = (
             [where_condition] if isinstance(where_condition, str) else where_condition
@@ -641,8 +654,6 @@ class AthenaAdapter(SQLAdapter):
         seed_s3_upload_args: Optional[Dict[str, Any]] = None,
     ) -> str:
         conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
 
         # TODO: consider using the workgroup default location when configured
         s3_location = self.generate_s3_location(
@@ -653,17 +664,12 @@ class AthenaAdapter(SQLAdapter):
         file_name = f"{relation.identifier}.csv"
         object_name = path.join(prefix, file_name)
 
-        with boto3_client_lock:
-            s3_client = client.session.client(
-                "s3",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
-            # This ensures cross-platform support, tempfile.NamedTemporaryFile does not
-            tmpfile = os.path.join(tempfile.gettempdir(), os.urandom(24).hex())
-            table.to_csv(tmpfile, quoting=csv.QUOTE_NONNUMERIC)
-            s3_client.upload_file(tmpfile, bucket, object_name, ExtraArgs=seed_s3_upload_args)
-            os.remove(tmpfile)
+        s3_client = self._boto3_client(conn, "s3")
+        # This ensures cross-platform support, tempfile.NamedTemporaryFile does not
+        tmpfile = os.path.join(tempfile.gettempdir(), os.urandom(24).hex())
+        table.to_csv(tmpfile, quoting=csv.QUOTE_NONNUMERIC)
+        s3_client.upload_file(tmpfile, bucket, object_name, ExtraArgs=seed_s3_upload_args)
+        os.remove(tmpfile)
 
         return str(s3_location)
 
@@ -675,15 +681,9 @@ class AthenaAdapter(SQLAdapter):
         a DbtRuntimeError in case it included errors.
         """
         conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
         bucket_name, prefix = self._parse_s3_path(s3_path)
         if self._s3_path_exists(bucket_name, prefix):
-            s3_resource = client.session.resource(
-                "s3",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
+            s3_resource = self._boto3_resource(conn, "s3")
             s3_bucket = s3_resource.Bucket(bucket_name)
             LOGGER.debug(
                 f"Deleting table data: path='{s3_path}', bucket='{bucket_name}', prefix='{prefix}'"
@@ -712,13 +712,7 @@ class AthenaAdapter(SQLAdapter):
             return
 
         conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
-        s3_resource = client.session.resource(
-            "s3",
-            region_name=client.region_name,
-            config=get_boto3_config(num_retries=creds.effective_num_retries),
-        )
+        s3_resource = self._boto3_resource(conn, "s3")
 
         # Group paths by bucket to support partitions spread across multiple buckets
         paths_by_bucket: Dict[str, List[str]] = {}
@@ -783,14 +777,7 @@ class AthenaAdapter(SQLAdapter):
     def _s3_path_exists(self, s3_bucket: str, s3_prefix: str) -> bool:
         """Checks whether a given s3 path exists."""
         conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
-        with boto3_client_lock:
-            s3_client = client.session.client(
-                "s3",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
+        s3_client = self._boto3_client(conn, "s3")
         response = s3_client.list_objects_v2(Bucket=s3_bucket, Prefix=s3_prefix)
         return True if "Contents" in response else False
 
@@ -860,44 +847,42 @@ class AthenaAdapter(SQLAdapter):
         data_catalog_type = get_catalog_type(data_catalog)
 
         conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
         if data_catalog_type == AthenaCatalogType.GLUE:
-            with boto3_client_lock:
-                glue_client = client.session.client(
-                    "glue",
-                    region_name=client.region_name,
-                    config=get_boto3_config(num_retries=creds.effective_num_retries),
-                )
+            glue_client = self._boto3_client(conn, "glue")
 
             catalog = []
             paginator = glue_client.get_paginator("get_tables")
             for schema in schemas:
-                kwargs = {
-                    "DatabaseName": schema,
-                    "MaxResults": 100,
-                }
-                # If the catalog is `awsdatacatalog` we don't need to pass CatalogId as boto3
-                # infers it from the account Id.
-                catalog_id = get_catalog_id(data_catalog)
-                if catalog_id:
-                    kwargs["CatalogId"] = catalog_id
-
-                for page in paginator.paginate(**kwargs):
-                    for table in page["TableList"]:
-                        catalog.extend(
-                            self._get_one_table_for_catalog(
-                                table, information_schema.database  # type:ignore
-                            )
+                # the schema was most likely listed in full already, when the relations
+                # cache was populated
+                tables = self._glue_table_cache.get_schema(information_schema.database, schema)
+                if tables is None:
+                    kwargs = {
+                        "DatabaseName": schema,
+                        "MaxResults": 100,
+                    }
+                    # If the catalog is `awsdatacatalog` we don't need to pass CatalogId as
+                    # boto3 infers it from the account Id.
+                    catalog_id = get_catalog_id(data_catalog)
+                    if catalog_id:
+                        kwargs["CatalogId"] = catalog_id
+
+                    tables = [
+                        table
+                        for page in paginator.paginate(**kwargs)
+                        for table in page["TableList"]
+                    ]
+                    self._glue_table_cache.set_schema(information_schema.database, schema, tables)
+
+                for table in tables:
+                    catalog.extend(
+                        self._get_one_table_for_catalog(
+                            table, information_schema.database  # type:ignore
                         )
+                    )
             table = agate.Table.from_object(catalog)
         else:
-            with boto3_client_lock:
-                athena_client = client.session.client(
-                    "athena",
-                    region_name=client.region_name,
-                    config=get_boto3_config(num_retries=creds.effective_num_retries),
-                )
+            athena_client = self._boto3_client(conn, "athena")
 
             catalog = []
             for schema in schemas:
@@ -937,6 +922,32 @@ class AthenaAdapter(SQLAdapter):
             info_schema_name_map.add(relation)
         return info_schema_name_map
 
+    def _boto3_client(self, conn: Connection, service_name: str) -> Any:
+        """Get a boto3 client for the connection's credentials and region. The
+        thread reuses it for the rest of the run.
+        """
+        handle = conn.handle
+        return self._boto3_clients.client(
+            handle.session,
+            session_identity(conn.credentials, handle.session),
+            service_name,
+            handle.region_name,
+            conn.credentials.effective_num_retries,
+        )
+
+    def _boto3_resource(self, conn: Connection, service_name: str) -> Any:
+        """Get a boto3 resource for the connection's credentials and region.
+        The thread reuses it for the rest of the run.
+        """
+        handle = conn.handle
+        return self._boto3_clients.resource(
+            handle.session,
+            session_identity(conn.credentials, handle.session),
+            service_name,
+            handle.region_name,
+            conn.credentials.effective_num_retries,
+        )
+
     def _get_aws_account_id(self) -> str:
         """Return the AWS account id, resolved once via STS and cached for the adapter.
 
@@ -964,8 +975,6 @@ class AthenaAdapter(SQLAdapter):
     def _get_data_catalog(self, database: str) -> Optional[DataCatalogTypeDef]:
         if database:
             conn = self.connections.get_thread_connection()
-            creds = conn.credentials
-            client = conn.handle
             # awsdatacatalog is the default Glue catalog; S3 Tables buckets surface as
             # nested Glue federated catalogs named "s3tablescatalog/<bucket>". Both are
             # Glue-backed but are not registered as Athena DataCatalogs, so we build the
@@ -979,15 +988,32 @@ class AthenaAdapter(SQLAdapter):
                 else:
                     catalog_id = f"{account_id}:{database}"
                 return {"Name": database, "Type": "GLUE", "Parameters": {"catalog-id": catalog_id}}
-            with boto3_client_lock:
-                athena = client.session.client(
-                    "athena",
-                    region_name=client.region_name,
-                    config=get_boto3_config(num_retries=creds.effective_num_retries),
-                )
-            return athena.get_data_catalog(Name=database)["DataCatalog"]
+            return self._get_athena_data_catalog(conn, database)
         return None
 
+    def _get_athena_data_catalog(self, conn: Connection, database: str) -> DataCatalogTypeDef:
+        """Return a catalog registered in Athena, memoized for the run. A lookup of a
+        catalog that doesn't exist raises the same error every time, without calling
+        get_data_catalog again.
+        """
+        with self._data_catalogs_lock:
+            data_catalog = self._data_catalogs.get(database)
+        if data_catalog is None:
+            athena = self._boto3_client(conn, "athena")
+            try:
+                data_catalog = athena.get_data_catalog(Name=database)["DataCatalog"]
+            except ClientError as e:
+                if not _is_not_found_error(e):
+                    raise
+                data_catalog = e
+            with self._data_catalogs_lock:
+                data_catalog = self._data_catalogs.setdefault(database, data_catalog)
+        if isinstance(data_catalog, ClientError):
+            # a new error for every lookup, as threads raising one shared
+            # exception would all add to its traceback
+            raise ClientError(data_catalog.response, data_catalog.operation_name)
+        return data_catalog
+
     @available
     def list_relations_without_caching(
         self, schema_relation: AthenaRelation
@@ -998,14 +1024,7 @@ class AthenaAdapter(SQLAdapter):
             return super().list_relations_without_caching(schema_relation)
 
         conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
-        with boto3_client_lock:
-            glue_client = client.session.client(
-                "glue",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
+        glue_client = self._boto3_client(conn, "glue")
 
         kwargs = {
             "DatabaseName": schema_relation.schema,
@@ -1023,6 +1042,7 @@ class AthenaAdapter(SQLAdapter):
                 return []
             else:
                 raise e
+        self._glue_table_cache.set_schema(schema_relation.database, schema_relation.schema, tables)
 
         relations: List[BaseRelation] = []
         quote_policy = {"database": True, "schema": True, "identifier": True}
@@ -1078,18 +1098,11 @@ class AthenaAdapter(SQLAdapter):
     @available
     def swap_table(self, src_relation: AthenaRelation, target_relation: AthenaRelation) -> None:
         conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
 
         data_catalog = self._get_data_catalog(src_relation.database)  # type:ignore
         src_catalog_id = get_catalog_id(data_catalog)
 
-        with boto3_client_lock:
-            glue_client = client.session.client(
-                "glue",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
+        glue_client = self._boto3_client(conn, "glue")
 
         src_table = glue_client.get_table(
             CatalogId=src_catalog_id,
@@ -1137,6 +1150,7 @@ class AthenaAdapter(SQLAdapter):
             DatabaseName=target_relation.schema,
             TableInput=target_table_version,
         )
+        self.invalidate_glue_table(target_relation)
         LOGGER.debug(
             f"Table {target_relation.render()} swapped with the content of {src_relation.render()}"
         )
@@ -1182,15 +1196,8 @@ class AthenaAdapter(SQLAdapter):
         Given a table and the amount of its version to keep, it returns the versions to delete
         """
         conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
 
-        with boto3_client_lock:
-            glue_client = client.session.client(
-                "glue",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
+        glue_client = self._boto3_client(conn, "glue")
 
         paginator = glue_client.get_paginator("get_table_versions")
         response_iterator = paginator.paginate(
@@ -1211,18 +1218,11 @@ class AthenaAdapter(SQLAdapter):
         self, relation: AthenaRelation, to_keep: int, delete_s3: bool
     ) -> List[str]:
         conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
 
         data_catalog = self._get_data_catalog(relation.database)  # type:ignore
         catalog_id = get_catalog_id(data_catalog)
 
-        with boto3_client_lock:
-            glue_client = client.session.client(
-                "glue",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
+        glue_client = self._boto3_client(conn, "glue")
 
         versions_to_delete = self._get_glue_table_versions_to_expire(relation, to_keep)
         LOGGER.debug(f"Versions to delete: {[v['VersionId'] for v in versions_to_delete]}")
@@ -1272,18 +1272,11 @@ class AthenaAdapter(SQLAdapter):
             Every dbt run should create not more than one table version.
         """
         conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
 
         data_catalog = self._get_data_catalog(relation.database)  # type:ignore
         catalog_id = get_catalog_id(data_catalog)
 
-        with boto3_client_lock:
-            glue_client = client.session.client(
-                "glue",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
+        glue_client = self._boto3_client(conn, "glue")
 
         # By default, there is no need to update Glue Table
         need_to_update_table = False
@@ -1399,6 +1392,7 @@ class AthenaAdapter(SQLAdapter):
                 TableInput=table_input,
                 SkipArchive=skip_archive_table_version,
             )
+            self.invalidate_glue_table(relation)
 
     def generate_python_submission_response(self, submission_result: Any) -> AdapterResponse:
         if not submission_result:
@@ -1416,15 +1410,8 @@ class AthenaAdapter(SQLAdapter):
     @available
     def list_schemas(self, database: str) -> List[str]:
         conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
 
-        with boto3_client_lock:
-            glue_client = client.session.client(
-                "glue",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
+        glue_client = self._boto3_client(conn, "glue")
 
         paginator = glue_client.get_paginator("get_databases")
         result = []
@@ -1446,16 +1433,9 @@ class AthenaAdapter(SQLAdapter):
             return super().check_schema_exists(database, schema)
 
         conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
         catalog_id = get_catalog_id(data_catalog)
 
-        with boto3_client_lock:
-            glue_client = client.session.client(
-                "glue",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
+        glue_client = self._boto3_client(conn, "glue")
 
         try:
             kwargs: Dict[str, str] = {"Name": schema}
@@ -1478,36 +1458,32 @@ class AthenaAdapter(SQLAdapter):
 
     @available
     def get_columns_in_relation(self, relation: AthenaRelation) -> List[AthenaColumn]:
-        conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
+        table = self._glue_table_cache.get(relation.database, relation.schema, relation.identifier)
+        if table is None:
+            conn = self.connections.get_thread_connection()
 
-        data_catalog = self._get_data_catalog(relation.database)  # type:ignore
-        catalog_id = get_catalog_id(data_catalog)
+            data_catalog = self._get_data_catalog(relation.database)  # type:ignore
+            catalog_id = get_catalog_id(data_catalog)
 
-        with boto3_client_lock:
-            glue_client = client.session.client(
-                "glue",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
+            glue_client = self._boto3_client(conn, "glue")
 
-        get_table_kwargs = dict(
-            DatabaseName=relation.schema,
-            Name=relation.identifier,
-        )
-        if catalog_id:
-            get_table_kwargs["CatalogId"] = catalog_id
+            get_table_kwargs = dict(
+                DatabaseName=relation.schema,
+                Name=relation.identifier,
+            )
+            if catalog_id:
+                get_table_kwargs["CatalogId"] = catalog_id
 
-        try:
-            table = glue_client.get_table(**get_table_kwargs)["Table"]
-        except ClientError as e:
-            if e.response["Error"]["Code"] == "EntityNotFoundException":
-                LOGGER.debug("table not exist, catching the error")
-                return []
-            else:
-                LOGGER.error(e)
-                raise e
+            try:
+                table = glue_client.get_table(**get_table_kwargs)["Table"]
+            except ClientError as e:
+                if e.response["Error"]["Code"] == "EntityNotFoundException":
+                    LOGGER.debug("table not exist, catching the error")
+                    return []
+                else:
+                    LOGGER.error(e)
+                    raise e
+            self._glue_table_cache.add(relation.database, relation.schema, table)
 
         table_type = get_table_type(table)
 
@@ -1527,23 +1503,17 @@ class AthenaAdapter(SQLAdapter):
         table_name = relation.identifier
 
         conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
 
         data_catalog = self._get_data_catalog(relation.database)  # type:ignore
         catalog_id = get_catalog_id(data_catalog)
 
-        with boto3_client_lock:
-            glue_client = client.session.client(
-                "glue",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
+        glue_client = self._boto3_client(conn, "glue")
 
         try:
             glue_client.delete_table(
                 CatalogId=catalog_id, DatabaseName=schema_name, Name=table_name
             )
+            self.invalidate_glue_table(relation)
             LOGGER.debug(f"Deleted table from glue catalog: {relation.render()}")
         except ClientError as e:
             if e.response["Error"]["Code"] == "EntityNotFoundException":
@@ -1557,19 +1527,13 @@ class AthenaAdapter(SQLAdapter):
     @available
     def drop_glue_database(self, database_name: str, catalog_name: str = "awsdatacatalog") -> None:
         conn = self.connections.get_thread_connection()
-        creds = conn.credentials
-        client = conn.handle
         catalog = self._get_data_catalog(catalog_name)
         catalog_id = get_catalog_id(catalog)
 
-        with boto3_client_lock:
-            glue_client: GlueClient = client.session.client(
-                "glue",
-                region_name=client.region_name,
-                config=get_boto3_config(num_retries=creds.effective_num_retries),
-            )
-            glue_client.delete_database(Name=database_name, CatalogId=catalog_id)
-            LOGGER.debug(f"Glue database successfully deleted: {catalog_name}.{database_name}")
+        glue_client: GlueClient = self._boto3_client(conn, "glue")
+        glue_client.delete_database(Name=database_name, CatalogId=catalog_id)
+        self._glue_table_cache.invalidate_schema(catalog_name, database_name)
+        LOGGER.debug(f"Glue database successfully deleted: {catalog_name}.{database_name}")
 
     @available.parse_none
     def valid_snapshot_target(self, relation: BaseRelation) -> None:
@@ -0,0 +1,191 @@
+from dataclasses import dataclass, field
+from threading import Condition, Event, Lock, Thread
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from mypy_boto3_athena.client import AthenaClient
+from mypy_boto3_athena.type_defs import GetQueryExecutionOutputTypeDef
+
+from dbt.adapters.athena.constants import LOGGER
+from dbt.adapters.athena.exceptions import AthenaError
+
+# the most query execution ids batch_get_query_execution accepts
+MAX_BATCH_SIZE = 50
+
+TERMINAL_STATES = ("SUCCEEDED", "FAILED", "CANCELLED")
+
+
+def poll_delays(initial_interval: float, max_interval: float) -> Iterator[float]:
+    """The delays between polls of a query's state: initial_interval at first,
+    doubling after every poll, up to max_interval.
+
+    Metadata queries usually finish within the first few short delays, while
+    a long running query ends up being polled every max_interval.
+    """
+    delay = min(initial_interval, max_interval)
+    while True:
+        yield delay
+        delay = min(delay * 2, max_interval)
+
+
+@dataclass
+class _PendingQuery:
+    query_execution_id: str
+    delays: Iterator[float]
+    next_poll_at: float
+    done: Event = field(default_factory=Event)
+    response: Optional[GetQueryExecutionOutputTypeDef] = None
+    error: Optional[BaseException] = None
+
+
+class AthenaQueryPoller:
+    """Polls the state of the queries that all threads are waiting on from a
+    single background thread, checking up to MAX_BATCH_SIZE of them with each
+    batch_get_query_execution call.
+
+    Each query still follows its own poll_delays schedule, but whenever one of
+    them is due, all queries in flight are checked with it. A run with many
+    threads waiting on long queries makes a fraction of the API calls that
+    polling every query separately would.
+
+    The background thread runs while there are queries to poll. Once stopped,
+    it exits as soon as the queries in flight have finished.
+    """
+
+    def __init__(
+        self,
+        client: AthenaClient,
+        initial_interval: float,
+        max_interval: float,
+        is_retryable: Callable[[BaseException], bool] = lambda _: False,
+    ) -> None:
+        self._client = client
+        self._initial_interval = initial_interval
+        self._max_interval = max_interval
+        self._is_retryable = is_retryable
+        self._condition = Condition()
+        self._pending: Dict[str, _PendingQuery] = {}
+        self._thread: Optional[Thread] = None
+        self._stopped = False
+
+    def stop(self) -> None:
+        """Let the background thread exit once no query is in flight."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+
+    def wait(self, query_execution_id: str) -> GetQueryExecutionOutputTypeDef:
+        """Block until a query has finished, and return its final state in the
+        shape get_query_execution returns it.
+        """
+        delays = poll_delays(self._initial_interval, self._max_interval)
+        pending = _PendingQuery(query_execution_id, delays, monotonic() + next(delays))
+        with self._condition:
+            self._pending[query_execution_id] = pending
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = Thread(
+                    target=self._run, name="dbt-athena-query-poller", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+        pending.done.wait()
+        if pending.error is not None:
+            raise pending.error
+        assert pending.response is not None
+        return pending.response
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending:
+                    if self._stopped:
+                        self._thread = None
+                        return
+                    self._condition.wait()
+                due_at = min(pending.next_poll_at for pending in self._pending.values())
+                delay = due_at - monotonic()
+                if delay > 0:
+                    # woken early when a new query is added, which may be due sooner
+                    self._condition.wait(delay)
+                    continue
+                in_flight = list(self._pending.values())
+
+            for start in range(0, len(in_flight), MAX_BATCH_SIZE):
+                self._poll(in_flight[start : start + MAX_BATCH_SIZE])
+
+            now = monotonic()
+            with self._condition:
+                for pending in in_flight:
+                    if pending.done.is_set():
+                        self._pending.pop(pending.query_execution_id, None)
+                    elif pending.next_poll_at <= now:
+                        pending.next_poll_at = now + next(pending.delays)
+
+    def _poll(self, batch: List[_PendingQuery]) -> None:
+        by_id = {pending.query_execution_id: pending for pending in batch}
+        try:
+            response = self._client.batch_get_query_execution(QueryExecutionIds=list(by_id))
+        except Exception as e:
+            if self._is_retryable(e):
+                LOGGER.warning(
+                    f"Got error while polling the state of Athena queries, will retry: {e}"
+                )
+                return
+            for pending in batch:
+                self._finish(pending, error=e)
+            return
+
+        for query_execution in response.get("QueryExecutions", []):
+            pending = by_id.get(query_execution.get("QueryExecutionId", ""))
+            state = query_execution.get("Status", {}).get("State")
+            if pending is None:
+                continue
+            LOGGER.debug(f"Athena query {pending.query_execution_id} has state {state}")
+            if state in TERMINAL_STATES:
+                self._finish(pending, response={"QueryExecution": query_execution})
+        for unprocessed in response.get("UnprocessedQueryExecutionIds", []):
+            pending = by_id.get(unprocessed.get("QueryExecutionId", ""))
+            if pending is not None:
+                message = unprocessed.get("ErrorMessage") or unprocessed.get("ErrorCode")
+                self._finish(pending, error=AthenaError(f"Could not get query state: {message}"))
+
+    @staticmethod
+    def _finish(pending: _PendingQuery, response: Any = None, error: Any = None) -> None:
+        pending.response = response
+        pending.error = error
+        pending.done.set()
+
+
+class AthenaQueryPollers:
+    """The pollers shared by the connections with the same credentials, made
+    on first use.
+
+    A poller polls with the client of the connection that made it, so it is
+    only shared while connections authenticate as the same identity. A
+    connection with a new identity, like renewed assumed role credentials,
+    replaces the poller, and the old one stops once its queries have finished.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._pollers: Dict[Hashable, Tuple[Hashable, AthenaQueryPoller]] = {}
+
+    def get(
+        self, key: Hashable, identity: Hashable, create: Callable[[], AthenaQueryPoller]
+    ) -> AthenaQueryPoller:
+        with self._lock:
+            entry = self._pollers.get(key)
+            if entry is not None and entry[0] == identity:
+                return entry[1]
+            poller = create()
+            self._pollers[key] = (identity, poller)
+        if entry is not None:
+            entry[1].stop()
+        return poller
+
+    def stop(self, key: Hashable) -> None:
+        """Stop the poller for the key, if there is one."""
+        with self._lock:
+            entry = self._pollers.pop(key, None)
+        if entry is not None:
+            entry[1].stop()
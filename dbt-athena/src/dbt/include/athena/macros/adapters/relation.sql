@@ -39,6 +39,7 @@
       drop {{ relation.type }} if exists {{ relation.render_hive() }}
     {% endif %}
   {%- endcall %}
+  {% do adapter.invalidate_glue_table(relation) %}
 {% endmacro %}
 
 {% macro set_table_classification(relation) -%}
@@ -46,6 +47,7 @@
   {% call statement('set_table_classification', auto_begin=False) -%}
     alter table {{ relation.render_hive() }} set tblproperties ('classification' = '{{ format }}')
   {%- endcall %}
+  {% do adapter.invalidate_glue_table(relation) %}
 {%- endmacro %}
 
 {% macro make_temp_relation(base_relation, suffix='__dbt_tmp', temp_schema=none) %}
@@ -67,4 +69,6 @@
   {% call statement('rename_relation') -%}
     alter table {{ from_relation.render_hive() }} rename to `{{ to_relation.schema }}`.`{{ to_relation.identifier }}`
   {%- endcall %}
+  {% do adapter.invalidate_glue_table(from_relation) %}
+  {% do adapter.invalidate_glue_table(to_relation) %}
 {%- endmacro %}
@@ -13,7 +13,9 @@
   {%- endset -%}
 
   {% if (add_columns | length) > 0 %}
-    {{ return(run_query(sql)) }}
+    {% set result = run_query(sql) %}
+    {% do adapter.invalidate_glue_table(relation) %}
+    {{ return(result) }}
   {% endif %}
 {% endmacro %}
 
@@ -28,6 +30,7 @@
     {% endset %}
     {% do run_query(sql) %}
   {%- endfor -%}
+  {% do adapter.invalidate_glue_table(relation) %}
 {% endmacro %}
 
 
@@ -46,7 +49,9 @@
   {%- endset -%}
 
   {% if (replace_columns | length) > 0 %}
-    {{ return(run_query(sql)) }}
+    {% set result = run_query(sql) %}
+    {% do adapter.invalidate_glue_table(relation) %}
+    {{ return(result) }}
   {% endif %}
 {% endmacro %}
 
@@ -55,5 +60,7 @@
       alter {{ relation.type }} {{ relation.render_pure() }}
           change column {{ source_column }} {{ target_column }} {{ ddl_data_type(target_column_type, table_type) }}
   {%- endset -%}
-  {{ return(run_query(sql)) }}
+  {% set result = run_query(sql) %}
+  {% do adapter.invalidate_glue_table(relation) %}
+  {{ return(result) }}
 {% endmacro %}
@@ -72,6 +72,7 @@
     alter {{ relation.type }} {{ relation.render_pure() }} add columns({{ tmp_column }} {{ new_ddl_data_type }});
   {%- endset -%}
   {%- do run_query(add_column_query) -%}
+  {%- do adapter.invalidate_glue_table(relation) -%}
 
   {%- set update_query -%}
     update {{ relation.render_pure() }} set {{ tmp_column }} = cast({{ column_name }} as {{ new_column_type }});
@@ -83,6 +84,7 @@
     alter {{ relation.type }} {{ relation.render_pure() }} drop column {{ column_name }};
   {%- endset -%}
   {%- do run_query(drop_column_query) -%}
+  {%- do adapter.invalidate_glue_table(relation) -%}
 
   {%- do alter_relation_rename_column(relation, tmp_column, column_name, new_column_type, table_type) -%}
 
@@ -31,6 +31,7 @@
   {% call statement('main') -%}
     {{ create_view_as(target_relation, compiled_code) }}
   {%- endcall %}
+  {% do adapter.invalidate_glue_table(target_relation) %}
 
   {% if lf_tags_config is not none %}
     {{ adapter.add_lf_tags(target_relation, lf_tags_config) }}
@@ -116,7 +116,7 @@ class TestAthenaAdapter:
 
     @mock.patch("dbt.adapters.athena.connections.AthenaConnection")
     def test_acquire_connection_exc(self, connection_cls, dbt_error_caplog):
-        connection_cls.side_effect = lambda *_: (_ for _ in ()).throw(Exception("foobar"))
+        connection_cls.side_effect = lambda *_, **__: (_ for _ in ()).throw(Exception("foobar"))
         connection = self.adapter.acquire_connection("dummy")
         conn_res = None
         with pytest.raises(ConnectionError) as exc:
@@ -912,6 +912,42 @@ class TestAthenaAdapter:
             "Parameters": {"catalog-id": DEFAULT_ACCOUNT_ID},
         } == res
 
+    def test__get_data_catalog_is_memoized(self):
+        athena = mock.Mock()
+        athena.get_data_catalog.return_value = {
+            "DataCatalog": {"Name": "federated", "Type": "LAMBDA"}
+        }
+        self.adapter.acquire_connection("dummy")
+        with mock.patch.object(self.adapter, "_boto3_client", return_value=athena):
+            for _ in range(2):
+                res = self.adapter._get_data_catalog("federated")
+                assert res == {"Name": "federated", "Type": "LAMBDA"}
+
+        athena.get_data_catalog.assert_called_once_with(Name="federated")
+
+    def test__get_data_catalog_remembers_missing_catalogs(self):
+        athena = mock.Mock()
+        athena.get_data_catalog.side_effect = botocore.exceptions.ClientError(
+            {
+                "Error": {"Code": "InvalidRequestException", "Message": "Catalog not found"},
+                "ResponseMetadata": {"HTTPStatusCode": 400},
+            },
+            "GetDataCatalog",
+        )
+        self.adapter.acquire_connection("dummy")
+        errors = []
+        with mock.patch.object(self.adapter, "_boto3_client", return_value=athena):
+            for _ in range(2):
+                with pytest.raises(botocore.exceptions.ClientError) as exc_info:
+                    self.adapter._get_data_catalog("missing")
+                errors.append(exc_info.value)
+
+        athena.get_data_catalog.assert_called_once()
+        # each lookup raises its own error, with the response of the first
+        assert errors[0] is not errors[1]
+        assert errors[1].response["Error"]["Message"] == "Catalog not found"
+        assert errors[1].operation_name == "GetDataCatalog"
+
     def _test_list_relations_without_caching(self, schema_relation):
         self.adapter.acquire_connection("dummy")
         relations = self.adapter.list_relations_without_caching(schema_relation)
@@ -1449,6 +1485,50 @@ class TestAthenaAdapter:
         )
         assert columns == []
 
+    @mock_aws
+    def test_get_columns_in_relation_uses_listed_glue_tables(self, mock_aws_service):
+        mock_aws_service.create_data_catalog()
+        mock_aws_service.create_database()
+        mock_aws_service.create_table("tbl_name")
+        self.adapter.acquire_connection("dummy")
+        schema_relation = self.adapter.Relation.create(
+            database=DATA_CATALOG_NAME, schema=DATABASE_NAME
+        )
+        relation = self.adapter.Relation.create(
+            database=DATA_CATALOG_NAME, schema=DATABASE_NAME, identifier="tbl_name"
+        )
+        self.adapter.list_relations_without_caching(schema_relation)
+
+        # the listing is served from the cache, without asking Glue again
+        glue = boto3.client("glue", region_name=AWS_REGION)
+        glue.delete_table(DatabaseName=DATABASE_NAME, Name="tbl_name")
+        assert len(self.adapter.get_columns_in_relation(relation)) == 3
+        assert self.adapter.get_glue_table(relation)["Table"]["Name"] == "tbl_name"
+
+        # until dbt changes the relation
+        self.adapter.cache_dropped(relation)
+        assert self.adapter.get_columns_in_relation(relation) == []
+        assert self.adapter.get_glue_table(relation) is None
+
+    @mock_aws
+    def test_get_glue_table_cache_invalidated_by_rename(self, mock_aws_service):
+        mock_aws_service.create_data_catalog()
+        mock_aws_service.create_database()
+        mock_aws_service.create_table("tbl_name")
+        self.adapter.acquire_connection("dummy")
+        from_relation = self.adapter.Relation.create(
+            database=DATA_CATALOG_NAME, schema=DATABASE_NAME, identifier="tbl_name"
+        )
+        to_relation = self.adapter.Relation.create(
+            database=DATA_CATALOG_NAME, schema=DATABASE_NAME, identifier="other_name"
+        )
+        assert self.adapter.get_glue_table(from_relation) is not None
+
+        glue = boto3.client("glue", region_name=AWS_REGION)
+        glue.delete_table(DatabaseName=DATABASE_NAME, Name="tbl_name")
+        self.adapter.cache_renamed(from_relation, to_relation)
+        assert self.adapter.get_glue_table(from_relation) is None
+
     @mock_aws
     def test_delete_from_glue_catalog(self, mock_aws_service):
         mock_aws_service.create_data_catalog()
@@ -0,0 +1,55 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from unittest import mock
+
+from dbt.adapters.athena.clients import Boto3ClientRegistry, session_identity
+
+
+def _session():
+    session = mock.Mock()
+    session.client = mock.Mock(side_effect=lambda *args, **kwargs: mock.Mock())
+    session.resource = mock.Mock(side_effect=lambda *args, **kwargs: mock.Mock())
+    return session
+
+
+class TestBoto3ClientRegistry:
+    def test_clients_are_made_once_per_thread(self):
+        registry = Boto3ClientRegistry(Lock())
+        session = _session()
+
+        first = registry.client(session, "identity", "glue", "eu-west-1", 5)
+        assert registry.client(_session(), "identity", "glue", "eu-west-1", 5) is first
+        assert registry.client(session, "identity", "s3", "eu-west-1", 5) is not first
+        assert registry.resource(session, "identity", "glue", "eu-west-1", 5) is not first
+        session.client.assert_any_call("glue", region_name="eu-west-1", config=mock.ANY)
+
+        with ThreadPoolExecutor(1) as executor:
+            other = executor.submit(
+                registry.client, session, "identity", "glue", "eu-west-1", 5
+            ).result()
+        assert other is not first
+
+    def test_a_new_identity_replaces_the_client(self):
+        registry = Boto3ClientRegistry(Lock())
+        session = _session()
+
+        first = registry.client(session, "expired", "glue", "eu-west-1", 5)
+        second = registry.client(session, "renewed", "glue", "eu-west-1", 5)
+
+        assert second is not first
+        assert registry.client(session, "renewed", "glue", "eu-west-1", 5) is second
+
+
+def test_session_identity():
+    credentials = mock.Mock(
+        assume_role_arn=None,
+        aws_profile_name="dev",
+        aws_access_key_id=None,
+        aws_secret_access_key=None,
+        aws_session_token=None,
+    )
+    assert session_identity(credentials, _session()) == session_identity(credentials, _session())
+
+    credentials.assume_role_arn = "arn:aws:iam::123456789012:role/dbt"
+    session = _session()
+    assert session_identity(credentials, session) is session
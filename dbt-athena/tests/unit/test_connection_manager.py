@@ -4,7 +4,11 @@ from unittest import mock
 import pytest
 
 from dbt.adapters.athena import AthenaConnectionManager
-from dbt.adapters.athena.connections import AthenaAdapterResponse, AthenaCursor
+from dbt.adapters.athena.connections import (
+    AthenaAdapterResponse,
+    AthenaCursor,
+    query_poller_key,
+)
 
 
 class TestAthenaConnectionManager:
@@ -39,3 +43,11 @@ class TestAthenaConnectionManager:
         cm = AthenaConnectionManager(mock.MagicMock(), get_context("spawn"))
         cm.cancel(connection)
         connection.handle.cancel.assert_called_once()
+
+    def test_cleanup_all_stops_the_query_poller(self):
+        cm = AthenaConnectionManager(mock.MagicMock(), get_context("spawn"))
+        cm.profile.credentials.batch_poll_queries = True
+        with mock.patch.object(AthenaConnectionManager, "_query_pollers") as query_pollers:
+            cm.cleanup_all()
+
+        query_pollers.stop.assert_called_once_with(query_poller_key(cm.profile.credentials))
@@ -20,6 +20,7 @@ from dbt.adapters.athena.connections import (
     AthenaQueryCancelledError,
     AthenaQueryFailedError,
 )
+from dbt.adapters.athena.query_poller import AthenaQueryPollers
 
 from .constants import ATHENA_WORKGROUP, AWS_REGION
 
@@ -163,6 +164,27 @@ class TestAthenaConnection:
         with pytest.raises(ConnectionError):
             connection.cursor()
 
+    def test_rotated_session_gets_its_own_poller(self, credentials, config_factory):
+        credentials.batch_poll_queries = True
+        credentials.assume_role_arn = "arn:aws:iam::123456789012:role/dbt"
+        pollers = AthenaQueryPollers()
+
+        def connect(session):
+            session.client = mock.Mock(side_effect=lambda *args, **kwargs: mock.Mock())
+            return AthenaConnection(
+                credentials, boto_session_factory=lambda _: session, query_pollers=pollers
+            ).connect(boto_config_factory=config_factory)
+
+        session = mock.Mock()
+        first, second = connect(session), connect(session)
+        assert first._poller is second._poller
+        assert first._poller._client is first._client
+
+        # the assumed role session is replaced before its credentials expire
+        rotated = connect(mock.Mock())
+        assert rotated._poller is not first._poller
+        assert rotated._poller._client is rotated._client
+
     def test_cancel_tells_the_cursor_to_cancel(self, connection):
         cursor = connection.cursor()
         cursor.cancel = mock.MagicMock()
@@ -359,7 +381,7 @@ class TestAthenaCursor:
             ]
         )
 
-    def test_execute_delays_between_polls(self, cursor, athena_client, poll_delay, credentials):
+    def test_execute_delays_between_polls(self, cursor, athena_client, poll_delay):
         state_sequence = [
             STATE_EVENT_QUEUED,
             STATE_EVENT_RUNNING,
@@ -370,9 +392,29 @@ class TestAthenaCursor:
         ]
         athena_client.get_query_execution = mock.Mock(side_effect=state_sequence)
         cursor.execute("SELECT NOW()")
-        non_terminal_polls = len(state_sequence) - 1
-        poll_delay.assert_has_calls([mock.call(credentials.poll_interval)] * non_terminal_polls)
-        assert poll_delay.call_count == non_terminal_polls
+        assert poll_delay.call_args_list == [
+            mock.call(0.05),
+            mock.call(0.1),
+            mock.call(0.2),
+            mock.call(0.4),
+            mock.call(0.8),
+        ]
+
+    def test_execute_caps_delays_at_poll_interval(self, cursor, athena_client, poll_delay):
+        state_sequence = [STATE_EVENT_RUNNING] * 8 + [STATE_EVENT_SUCCEEDED]
+        athena_client.get_query_execution = mock.Mock(side_effect=state_sequence)
+        cursor.execute("SELECT NOW()")
+        assert [c.args[0] for c in poll_delay.call_args_list][-3:] == [1.0, 1.0, 1.0]
+
+    def test_execute_waits_on_the_poller(self, athena_client, credentials, poll_delay, formatter):
+        poller = mock.Mock()
+        poller.wait = mock.Mock(return_value=STATE_EVENT_SUCCEEDED)
+        cursor = AthenaCursor(athena_client, credentials, formatter=formatter, poller=poller)
+        cursor.execute("SELECT NOW()")
+        poller.wait.assert_called_once_with("1234-abcd")
+        athena_client.get_query_execution.assert_not_called()
+        assert cursor.state == AthenaCursor.STATE_SUCCEEDED
+        assert cursor.data_scanned_in_bytes == 123
 
     def test_execute_does_not_delay_when_query_completes_immediately(self, cursor, poll_delay):
         cursor.execute("SELECT NOW()")
@@ -1293,3 +1335,68 @@ class TestAthenaCursor:
         cursor.execute("SELECT * FROM table")
         rows = list(cursor.fetchall())
         assert rows == [(None,) * len(types)]
+
+    def _s3_result(self, athena_client, credentials, formatter, csv_chunks):
+        athena_client.get_query_execution = mock.Mock(
+            return_value={
+                "QueryExecution": {
+                    **STATE_EVENT_SUCCEEDED["QueryExecution"],
+                    "ResultConfiguration": {
+                        "OutputLocation": "s3://test-bucket/staging-location/1234-abcd.csv"
+                    },
+                }
+            }
+        )
+        s3_client = mock.Mock()
+        s3_client.get_object.return_value = {"Body": mock.Mock()}
+        s3_client.get_object.return_value["Body"].iter_chunks.return_value = [
+            chunk.encode("utf-8") for chunk in csv_chunks
+        ]
+        cursor = AthenaCursor(
+            athena_client,
+            dataclasses.replace(credentials, fetch_results_from_s3=True),
+            poll_delay=mock.Mock(),
+            formatter=formatter,
+            s3_client_factory=lambda: s3_client,
+        )
+        return cursor, s3_client
+
+    def test_fetch_reads_pages_after_the_first_from_s3(
+        self, athena_client, credentials, formatter
+    ):
+        column_info = [("n", "int"), ("s", "varchar")]
+        page = self._create_page(athena_client, column_info, [["1", "a"]], next_token="p2")
+        athena_client.get_query_results = mock.Mock(return_value=page)
+        csv_chunks = ['"n","s"\n"1","a"\n"2",', '""\n"3",\n"4","x, ""y""\nz"\n"5","', 'b"']
+        cursor, s3_client = self._s3_result(athena_client, credentials, formatter, csv_chunks)
+        cursor.execute("SELECT * FROM table")
+        rows = cursor.fetchall()
+        assert rows == [(1, "a"), (2, ""), (3, None), (4, 'x, "y"\nz'), (5, "b")]
+        athena_client.get_query_results.assert_called_once_with(QueryExecutionId="1234-abcd")
+        s3_client.get_object.assert_called_once_with(
+            Bucket="test-bucket", Key="staging-location/1234-abcd.csv"
+        )
+
+    def test_fetch_does_not_read_a_single_page_result_from_s3(
+        self, athena_client, credentials, formatter
+    ):
+        page = self._create_page(athena_client, [("n", "int")], [["1"]])
+        athena_client.get_query_results = mock.Mock(return_value=page)
+        cursor, s3_client = self._s3_result(athena_client, credentials, formatter, [])
+        cursor.execute("SELECT * FROM table")
+        assert cursor.fetchall() == [(1,)]
+        s3_client.get_object.assert_not_called()
+
+    def test_fetch_falls_back_to_the_api_when_the_result_cannot_be_read_from_s3(
+        self, athena_client, credentials, formatter
+    ):
+        page1 = self._create_page(athena_client, [("n", "int")], [["1"]], next_token="p2")
+        page2 = self._create_page(athena_client, [("n", "int")], [["2"]], include_header=False)
+        athena_client.get_query_results = mock.Mock(side_effect=[page1, page2])
+        cursor, s3_client = self._s3_result(athena_client, credentials, formatter, [])
+        s3_client.get_object.side_effect = ClientError(
+            {"Error": {"Code": "AccessDenied"}}, "GetObject"
+        )
+        cursor.execute("SELECT * FROM table")
+        assert cursor.fetchall() == [(1,), (2,)]
+        assert athena_client.get_query_results.call_count == 2
@@ -0,0 +1,118 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from unittest import mock
+
+import pytest
+
+from dbt.adapters.athena.exceptions import AthenaError
+from dbt.adapters.athena.query_poller import AthenaQueryPoller, AthenaQueryPollers, poll_delays
+
+
+def _query_execution(query_execution_id, state):
+    return {"QueryExecutionId": query_execution_id, "Status": {"State": state}}
+
+
+class TestPollDelays:
+    def test_doubles_up_to_max_interval(self):
+        assert list(islice(poll_delays(0.25, 1.5), 5)) == [0.25, 0.5, 1.0, 1.5, 1.5]
+
+    def test_initial_interval_is_capped_too(self):
+        assert next(poll_delays(2, 1)) == 1
+
+
+class TestAthenaQueryPoller:
+    def test_polls_queries_of_all_threads_together(self):
+        polls = []
+
+        def batch_get_query_execution(QueryExecutionIds):
+            polls.append(sorted(QueryExecutionIds))
+            # every query finishes on its third poll
+            state = "SUCCEEDED" if len(polls) >= 3 else "RUNNING"
+            return {
+                "QueryExecutions": [_query_execution(id, state) for id in QueryExecutionIds],
+                "UnprocessedQueryExecutionIds": [],
+            }
+
+        client = mock.Mock()
+        client.batch_get_query_execution = mock.Mock(side_effect=batch_get_query_execution)
+        poller = AthenaQueryPoller(client, 0.01, 0.02)
+
+        with ThreadPoolExecutor(4) as executor:
+            responses = list(executor.map(poller.wait, ["a", "b", "c", "d"]))
+
+        assert [r["QueryExecution"]["Status"]["State"] for r in responses] == ["SUCCEEDED"] * 4
+        # at least some of the polls checked several queries at once
+        assert len(polls) < 3 * 4
+        assert any(len(ids) > 1 for ids in polls)
+
+    def test_raises_for_unprocessed_queries(self):
+        client = mock.Mock()
+        client.batch_get_query_execution = mock.Mock(
+            return_value={
+                "QueryExecutions": [],
+                "UnprocessedQueryExecutionIds": [
+                    {"QueryExecutionId": "a", "ErrorMessage": "no such query"}
+                ],
+            }
+        )
+        poller = AthenaQueryPoller(client, 0.01, 0.02)
+
+        with pytest.raises(AthenaError, match="no such query"):
+            poller.wait("a")
+
+    def test_retries_retryable_errors(self):
+        client = mock.Mock()
+        client.batch_get_query_execution = mock.Mock(
+            side_effect=[
+                Exception("ThrottlingException"),
+                {"QueryExecutions": [_query_execution("a", "FAILED")]},
+            ]
+        )
+        poller = AthenaQueryPoller(client, 0.01, 0.02, is_retryable=lambda e: True)
+
+        response = poller.wait("a")
+
+        assert response["QueryExecution"]["Status"]["State"] == "FAILED"
+        assert client.batch_get_query_execution.call_count == 2
+
+    def test_stopped_poller_exits_once_idle(self):
+        client = mock.Mock()
+        client.batch_get_query_execution = mock.Mock(
+            return_value={"QueryExecutions": [_query_execution("a", "SUCCEEDED")]}
+        )
+        poller = AthenaQueryPoller(client, 0.01, 0.02)
+        poller.wait("a")
+        thread = poller._thread
+
+        poller.stop()
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        # a query waited on after stopping is still polled
+        assert poller.wait("a")["QueryExecution"]["Status"]["State"] == "SUCCEEDED"
+
+
+class TestAthenaQueryPollers:
+    def test_a_new_identity_replaces_the_poller(self):
+        pollers = AthenaQueryPollers()
+        create = mock.Mock(side_effect=lambda: mock.Mock(spec=AthenaQueryPoller))
+
+        first = pollers.get("key", "session", create)
+        assert pollers.get("key", "session", create) is first
+
+        # renewed assumed role credentials come with a new session
+        renewed = pollers.get("key", "renewed session", create)
+
+        assert renewed is not first
+        first.stop.assert_called_once()
+        assert pollers.get("key", "renewed session", create) is renewed
+
+    def test_stop(self):
+        pollers = AthenaQueryPollers()
+        poller = pollers.get("key", "session", lambda: mock.Mock(spec=AthenaQueryPoller))
+
+        pollers.stop("key")
+        pollers.stop("other key")
+
+        poller.stop.assert_called_once()
+        assert pollers.get("key", "session", mock.Mock()) is not poller
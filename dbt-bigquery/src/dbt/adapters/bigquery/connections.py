@@ -28,6 +28,7 @@ from dbt_common.events.contextvars import get_node_info
 from dbt_common.events.functions import fire_event
 from dbt_common.exceptions import DbtDatabaseError, DbtRuntimeError
 from dbt_common.invocation import get_invocation_id
+from dbt.adapters.arrow import ArrowResultTable
 from dbt.adapters.base import BaseConnectionManager
 from dbt.adapters.contracts.connection import (
     AdapterRequiredConfig,
@@ -40,6 +41,7 @@ from dbt.adapters.exceptions.connection import FailedToConnectError
 from dbt.adapters.bigquery.clients import create_bigquery_client
 from dbt.adapters.bigquery.credentials import Priority
 from dbt.adapters.bigquery.retry import RetryFactory
+from dbt.adapters.bigquery.table_cache import TableCache
 
 if TYPE_CHECKING:
     # Indirectly imported via agate_helper, which is lazy loaded further downfile.
@@ -70,6 +72,27 @@ class BigQueryConnectionManager(BaseConnectionManager):
         super().__init__(profile, mp_context)
         self.jobs_by_thread: Dict[Hashable, List[str]] = defaultdict(list)
         self._retry = RetryFactory(profile.credentials)
+        self.table_cache = TableCache()
+        # Set by the adapter after initialization via set_table_cache_checker
+        self._table_cache_checker: Optional[Callable[[], bool]] = None
+
+    def set_table_cache_checker(self, checker: Callable[[], bool]) -> None:
+        self._table_cache_checker = checker
+
+    def _should_cache_tables(self) -> bool:
+        """Whether get_bq_table serves tables from the table cache. Writes
+        invalidate it either way.
+        """
+        return self._table_cache_checker is not None and self._table_cache_checker()
+
+    def cleanup_all(self) -> None:
+        stats = self.table_cache.stats
+        if stats.hits or stats.misses:
+            logger.debug(
+                f"Table cache: {stats.hits} hits (tables.get calls saved), {stats.misses} misses"
+            )
+        self.table_cache = TableCache()
+        super().cleanup_all()
 
     @classmethod
     def handle_error(cls, error, message):
@@ -307,7 +330,28 @@ class BigQueryConnectionManager(BaseConnectionManager):
                 )
 
             retry = self._retry.create_reopen_with_deadline(conn)
-            return retry(_execute_with_retry)()
+            try:
+                query_job, iterator = retry(_execute_with_retry)()
+            except Exception:
+                # a failed script may still have changed some tables
+                if not dry_run:
+                    self.table_cache.clear()
+                raise
+
+        if not dry_run:
+            self._invalidate_query_target(query_job)
+        return query_job, iterator
+
+    def _invalidate_query_target(self, query_job) -> None:
+        statement_type = query_job.statement_type
+        if statement_type == "SELECT":
+            return
+        target = query_job.ddl_target_table
+        if target is not None:
+            self.table_cache.invalidate(target.project, target.dataset_id, target.table_id)
+        else:
+            # DML, scripts, and DDL on datasets or routines
+            self.table_cache.clear()
 
     def raw_execute_with_comment(
         self,
@@ -338,7 +382,11 @@ class BigQueryConnectionManager(BaseConnectionManager):
         # auto_begin is ignored on bigquery, and only included for consistency
         query_job, iterator = self.raw_execute(sql, limit=limit)
 
-        if fetch:
+        if fetch and self._should_fetch_arrow_results():
+            # skip the storage API, which needs an extra permission
+            arrow_table = iterator.to_arrow(create_bqstorage_client=False)
+            table = ArrowResultTable(arrow_table)  # type: ignore[assignment]
+        elif fetch:
             table = self.get_table_from_response(iterator)
         else:
             from dbt_common.clients import agate_helper
@@ -518,6 +566,9 @@ class BigQueryConnectionManager(BaseConnectionManager):
             model_timeout = getattr(conn, "_bq_model_timeout", None)
             copy_timeout = model_timeout or self._retry.create_job_execution_timeout(fallback=300)
             copy_job.result(timeout=copy_timeout)
+        self.table_cache.invalidate(
+            destination_ref.project, destination_ref.dataset_id, destination_ref.table_id
+        )
 
     def write_dataframe_to_table(
         self,
@@ -569,6 +620,7 @@ class BigQueryConnectionManager(BaseConnectionManager):
                 job = client.load_table_from_file(f, table, rewind=True, job_config=config)
 
         response = job.result(retry=self._retry.create_retry(fallback=fallback_timeout))
+        self.table_cache.invalidate(table.project, table.dataset_id, table.table_id)
 
         if response.state != "DONE":
             raise DbtDatabaseError("BigQuery Timeout Exceeded")
@@ -593,7 +645,20 @@ class BigQueryConnectionManager(BaseConnectionManager):
         # backwards compatibility: fill in with defaults if not specified
         database = database or conn.credentials.database
         schema = schema or conn.credentials.schema
-        return client.get_table(self.table_ref(database, schema, identifier))
+        table_ref = self.table_ref(database, schema, identifier)
+        if not self._should_cache_tables():
+            return client.get_table(table_ref)
+        return self.table_cache.get(
+            database, schema, identifier, lambda: client.get_table(table_ref)
+        )
+
+    def invalidate_bq_table(self, database, schema, identifier=None) -> None:
+        """Forget the cached table, or every table of a dataset if no
+        identifier is given, after writing to it.
+        """
+        database = database or self.profile.credentials.database
+        schema = schema or self.profile.credentials.schema
+        self.table_cache.invalidate(database, schema, identifier)
 
     def drop_dataset(self, database, schema) -> None:
         conn = self.get_thread_connection()
@@ -605,6 +670,7 @@ class BigQueryConnectionManager(BaseConnectionManager):
                 not_found_ok=True,
                 retry=self._retry.create_reopen_with_deadline(conn),
             )
+        self.table_cache.invalidate(database, schema)
 
     def create_dataset(self, database, schema) -> Dataset:
         conn = self.get_thread_connection()
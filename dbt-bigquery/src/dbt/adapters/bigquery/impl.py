@@ -154,6 +154,16 @@ BIGQUERY_USE_STANDARD_SQL_FOR_PARTITIONS = BehaviorFlag(
     ),
 )
 
+BIGQUERY_CACHE_TABLE_METADATA = BehaviorFlag(
+    name="bigquery_cache_table_metadata",
+    default=False,
+    description=(
+        "Keep the table metadata fetched with tables.get for the rest of the run, so the "
+        "methods that look up the same table, like get_columns_in_relation and "
+        "is_replaceable, share one API call. Tables are refetched after dbt writes to them."
+    ),
+)
+
 _dataset_lock = threading.Lock()
 
 # Guard against older dbt-adapters that don't have Capability.CatalogsV2 yet.
@@ -238,6 +248,9 @@ class BigQueryAdapter(BaseAdapter):
     def __init__(self, config, mp_context: SpawnContext) -> None:
         super().__init__(config, mp_context)
         self.connections: BigQueryConnectionManager = self.connections
+        self.connections.set_table_cache_checker(
+            lambda: self.behavior.bigquery_cache_table_metadata.no_warn
+        )
         self.add_catalog_integration(constants.DEFAULT_INFO_SCHEMA_CATALOG)
         self.add_catalog_integration(constants.DEFAULT_ICEBERG_CATALOG)
 
@@ -255,6 +268,7 @@ class BigQueryAdapter(BaseAdapter):
             BIGQUERY_NOOP_ALTER_RELATION_COMMENT,
             BIGQUERY_REJECT_WILDCARD_METADATA_SOURCE_FRESHNESS,
             BIGQUERY_USE_STANDARD_SQL_FOR_PARTITIONS,
+            BIGQUERY_CACHE_TABLE_METADATA,
         ]
 
     def get_partitions_metadata(self, table):
@@ -282,6 +296,7 @@ class BigQueryAdapter(BaseAdapter):
 
         # mimic "drop if exists" functionality that's ubiquitous in most sql implementations
         conn.handle.delete_table(table_ref, not_found_ok=True)
+        self._invalidate_table(relation)
 
     def truncate_relation(self, relation: BigQueryRelation) -> None:
         raise dbt_common.exceptions.base.NotImplementedError(
@@ -295,7 +310,9 @@ class BigQueryAdapter(BaseAdapter):
         client = conn.handle
 
         from_table_ref = self.get_table_ref_from_relation(from_relation)
-        from_table = client.get_table(from_table_ref)
+        from_table = self.connections.get_bq_table(
+            from_relation.database, from_relation.schema, from_relation.identifier
+        )
         if (
             from_table.table_type == "VIEW"
             or from_relation.type == RelationType.View
@@ -310,6 +327,15 @@ class BigQueryAdapter(BaseAdapter):
         self.cache_renamed(from_relation, to_relation)
         client.copy_table(from_table_ref, to_table_ref)
         client.delete_table(from_table_ref)
+        self._invalidate_table(from_relation)
+        self._invalidate_table(to_relation)
+
+    def _invalidate_table(self, relation: BigQueryRelation) -> None:
+        """Forget the cached table and columns of a relation changed through the API."""
+        self.connections.invalidate_bq_table(
+            relation.database, relation.schema, relation.identifier
+        )
+        self.invalidate_cached_columns(relation)
 
     def pre_model_hook(self, config: Mapping[str, Any]) -> Optional[float]:
         """Override the connection's query execution timeout and reservation based on the model config"""
@@ -362,6 +388,11 @@ class BigQueryAdapter(BaseAdapter):
         return get_nested_column_data_types(columns, constraints)
 
     def get_columns_in_relation(self, relation: BigQueryRelation) -> List[BigQueryColumn]:
+        return self._cached_columns_in_relation(  # type: ignore[return-value]
+            relation, lambda: self._get_columns_in_relation(relation)
+        )
+
+    def _get_columns_in_relation(self, relation: BigQueryRelation) -> List[BigQueryColumn]:
         try:
             table = self.connections.get_bq_table(
                 database=relation.database, schema=relation.schema, identifier=relation.identifier
@@ -598,6 +629,9 @@ class BigQueryAdapter(BaseAdapter):
             )
 
         self.connections.copy_bq_table(source, destination, write_disposition)
+        # the destination can be given as a table id rather than a relation,
+        # so its columns can't be forgotten on their own
+        self._column_cache.clear()
 
         return "COPY TABLE with materialization: {}".format(materialization)
 
@@ -820,7 +854,9 @@ class BigQueryAdapter(BaseAdapter):
 
         conn = self.connections.get_thread_connection()
         table_ref = self.get_table_ref_from_relation(relation)
-        table = conn.handle.get_table(table_ref)
+        table = self.connections.get_bq_table(
+            relation.database, relation.schema, relation.identifier
+        )
 
         new_schema = []
         for bq_column in table.schema:
@@ -830,6 +866,7 @@ class BigQueryAdapter(BaseAdapter):
 
         new_table = google.cloud.bigquery.Table(table_ref, schema=new_schema)
         conn.handle.update_table(new_table, ["schema"])
+        self._invalidate_table(relation)
 
     @auto_record_function("AdapterUpdateTableDescription", group="Available")
     @available.parse_none
@@ -839,10 +876,10 @@ class BigQueryAdapter(BaseAdapter):
         conn = self.connections.get_thread_connection()
         client = conn.handle
 
-        table_ref = self.connections.table_ref(database, schema, identifier)
-        table = client.get_table(table_ref)
+        table = self.connections.get_bq_table(database, schema, identifier)
         table.description = description
         client.update_table(table, ["description"])
+        self.connections.invalidate_bq_table(database, schema, identifier)
 
     @available.parse_none
     @record_function(
@@ -867,7 +904,9 @@ class BigQueryAdapter(BaseAdapter):
         client = conn.handle
 
         table_ref = self.get_table_ref_from_relation(relation)
-        table = client.get_table(table_ref)
+        table = self.connections.get_bq_table(
+            relation.database, relation.schema, relation.identifier
+        )
 
         schema_as_dicts = [field.to_api_repr() for field in table.schema]
 
@@ -901,8 +940,11 @@ class BigQueryAdapter(BaseAdapter):
             )
             self.execute(drop_sql, fetch=False)
 
-            # Refresh schema after drops so additions operate on the latest definition
-            table = client.get_table(table_ref)
+            # Refresh schema after drops so additions operate on the latest definition,
+            # the drop was a query job targeting the table, so it isn't cached anymore
+            table = self.connections.get_bq_table(
+                relation.database, relation.schema, relation.identifier
+            )
             schema_as_dicts = [field.to_api_repr() for field in table.schema]
 
         if add_columns:
@@ -912,6 +954,8 @@ class BigQueryAdapter(BaseAdapter):
             new_table = google.cloud.bigquery.Table(table_ref, schema=new_schema)
             client.update_table(new_table, ["schema"])
 
+        self._invalidate_table(relation)
+
     @available.parse(lambda *a, **k: {})
     @record_function(
         BigQueryAdapterSyncStructColumnsRecord,
@@ -938,8 +982,12 @@ class BigQueryAdapter(BaseAdapter):
         conn = self.connections.get_thread_connection()
         client = conn.handle
 
-        source_table = client.get_table(self.get_table_ref_from_relation(source_relation))
-        target_table = client.get_table(self.get_table_ref_from_relation(target_relation))
+        source_table = self.connections.get_bq_table(
+            source_relation.database, source_relation.schema, source_relation.identifier
+        )
+        target_table = self.connections.get_bq_table(
+            target_relation.database, target_relation.schema, target_relation.identifier
+        )
 
         source_schema = [field.to_api_repr() for field in source_table.schema]
         target_schema = [field.to_api_repr() for field in target_table.schema]
@@ -1010,6 +1058,7 @@ class BigQueryAdapter(BaseAdapter):
             new_schema = [SchemaField.from_api_repr(field) for field in updated_schema]
             target_table.schema = new_schema
             client.update_table(target_table, ["schema"])
+            self._invalidate_table(target_relation)
             logger.debug(
                 "BigQuery STRUCT sync applied for %s columns=%s",
                 target_relation.render(),
@@ -1081,6 +1130,9 @@ class BigQueryAdapter(BaseAdapter):
             field_delimiter,
             fallback_timeout=300,
         )
+        self.invalidate_cached_columns(
+            self.Relation.create(database=database, schema=schema, identifier=table_name)
+        )
 
     @available.parse_none
     def upload_file(
@@ -1103,6 +1155,9 @@ class BigQueryAdapter(BaseAdapter):
             fallback_timeout=300,
             **kwargs,
         )
+        self.invalidate_cached_columns(
+            self.Relation.create(database=database, schema=table_schema, identifier=table_name)
+        )
 
     @classmethod
     def _catalog_filter_table(
@@ -1461,6 +1516,12 @@ class BigQueryAdapter(BaseAdapter):
         else:
             return list(res)
 
+    def submit_python_job(self, parsed_model: dict, compiled_code: str) -> AdapterResponse:
+        response = super().submit_python_job(parsed_model, compiled_code)
+        # the job writes the model from Spark, outside of any query job dbt runs
+        self.connections.table_cache.clear()
+        return response
+
     def generate_python_submission_response(
         self, submission_result: PythonSubmissionResult
     ) -> BigQueryAdapterResponse:
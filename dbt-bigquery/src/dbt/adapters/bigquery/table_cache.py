@@ -0,0 +1,85 @@
+import copy
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from google.cloud.bigquery import Table
+
+
+_TableKey = Tuple[str, str, str]
+
+
+@dataclass
+class TableCacheStats:
+    """How get_bq_table used the table cache.
+
+    :attr int hits: Tables served from the cache, each a tables.get call that
+        was not made.
+    :attr int misses: Tables that had to be fetched.
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+
+class TableCache:
+    """Table metadata fetched with tables.get, kept for the rest of the run.
+
+    An entry is dropped when dbt writes to the table: through the API, or
+    with a query job that targets it. Query jobs that don't report a single
+    target table, like DML and scripts, drop every entry.
+
+    Each caller gets its own copy of a Table, which keeps the etag it was
+    fetched with. An update_table made from a cached copy is therefore
+    rejected by BigQuery if the table changed since, rather than overwriting
+    the change.
+    """
+
+    def __init__(self) -> None:
+        self.stats = TableCacheStats()
+        self._lock = threading.Lock()
+        self._tables: Dict[_TableKey, Table] = {}
+        # bumped by every invalidation, so tables fetched while one happened
+        # are not cached
+        self._generation = 0
+
+    def get(
+        self, database: str, schema: str, identifier: str, fetch: Callable[[], Table]
+    ) -> Table:
+        """Get a cached table, or fetch and cache it. Fetch errors, like
+        NotFound, are raised and nothing is cached.
+        """
+        key = (database, schema, identifier)
+        with self._lock:
+            table = self._tables.get(key)
+            if table is not None:
+                self.stats.hits += 1
+                return copy.deepcopy(table)
+            self.stats.misses += 1
+            generation = self._generation
+
+        table = fetch()
+        with self._lock:
+            if generation == self._generation:
+                self._tables[key] = copy.deepcopy(table)
+        return table
+
+    def invalidate(
+        self, database: Optional[str], schema: Optional[str], identifier: Optional[str] = None
+    ) -> None:
+        """Drop a table, or every table of a dataset if no identifier is
+        given. Names are compared ignoring case, which may drop too many, but
+        never too few.
+        """
+        match = tuple(part.lower() for part in (database or "", schema or "", identifier or ""))
+        with self._lock:
+            self._generation += 1
+            for key in list(self._tables):
+                lowered = tuple(part.lower() for part in key)
+                if lowered[:2] == match[:2] and (identifier is None or lowered[2] == match[2]):
+                    del self._tables[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._tables.clear()
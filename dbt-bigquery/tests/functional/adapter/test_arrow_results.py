@@ -0,0 +1,17 @@
+import pytest
+
+from dbt.tests.adapter.fetch_results.test_arrow_results import BaseArrowFetchResults
+
+
+class TestArrowFetchResultsBigQuery(BaseArrowFetchResults):
+    @pytest.fixture(scope="class")
+    def rows_sql(self):
+        return f"""
+        select
+            id,
+            mod(id * 7919, 1000) as amount,
+            concat('row_', cast(id as string)) as name,
+            timestamp_add(timestamp '2024-01-01', interval id second) as created_at
+        from unnest(generate_array(0, {self.ROW_COUNT - 1})) as id
+        order by id
+        """
@@ -829,3 +829,85 @@ class TestRetryFactoryPollingRetry(unittest.TestCase):
             maximum=60.0,
             multiplier=2.0,
         )
+
+
+class TestTableCache(unittest.TestCase):
+    def setUp(self):
+        self.credentials = Mock(BigQueryCredentials)
+        self.credentials.database = "project"
+        self.credentials.schema = "dataset"
+        self.credentials.job_retries = 1
+        self.credentials.job_retry_deadline_seconds = 1
+        self.credentials.job_execution_timeout_seconds = 1
+
+        self.mock_client = Mock(google.cloud.bigquery.Client)
+        self.mock_client.get_table.side_effect = lambda ref: google.cloud.bigquery.Table(ref)
+
+        self.mock_connection = MagicMock()
+        self.mock_connection.name = "test_connection"
+        self.mock_connection.handle = self.mock_client
+        self.mock_connection.credentials = self.credentials
+
+        self.connections = BigQueryConnectionManager(
+            profile=Mock(credentials=self.credentials, query_comment=None),
+            mp_context=Mock(),
+        )
+        self.connections.get_thread_connection = lambda: self.mock_connection
+        self.connections.set_table_cache_checker(lambda: True)
+
+    def _run_query(self, statement_type, ddl_target_table=None):
+        query_job = Mock(statement_type=statement_type, ddl_target_table=ddl_target_table)
+        with patch.object(self.connections, "_query_and_results", return_value=(query_job, [])):
+            self.connections.raw_execute("sql")
+
+    def test_tables_are_fetched_once(self):
+        first = self.connections.get_bq_table("project", "dataset", "table")
+        first.description = "changed"
+        second = self.connections.get_bq_table("project", "dataset", "table")
+
+        self.mock_client.get_table.assert_called_once()
+        assert second.description is None
+        assert self.connections.table_cache.stats.hits == 1
+
+    def test_tables_are_fetched_every_time_without_the_flag(self):
+        self.connections.set_table_cache_checker(lambda: False)
+
+        self.connections.get_bq_table("project", "dataset", "table")
+        self.connections.get_bq_table("project", "dataset", "table")
+
+        assert self.mock_client.get_table.call_count == 2
+
+    def test_selects_keep_the_cache(self):
+        self.connections.get_bq_table("project", "dataset", "table")
+        self._run_query("SELECT")
+        self.connections.get_bq_table("project", "dataset", "table")
+
+        self.mock_client.get_table.assert_called_once()
+
+    def test_ddl_invalidates_its_target_table(self):
+        self.connections.get_bq_table("project", "dataset", "table")
+        self.connections.get_bq_table("project", "dataset", "other")
+        target = google.cloud.bigquery.TableReference.from_string("project.dataset.table")
+        self._run_query("ALTER_TABLE", ddl_target_table=target)
+        self.connections.get_bq_table("project", "dataset", "table")
+        self.connections.get_bq_table("project", "dataset", "other")
+
+        assert self.mock_client.get_table.call_count == 3
+
+    def test_dml_invalidates_every_table(self):
+        self.connections.get_bq_table("project", "dataset", "table")
+        self._run_query("MERGE")
+        self.connections.get_bq_table("project", "dataset", "table")
+
+        assert self.mock_client.get_table.call_count == 2
+
+    def test_copy_invalidates_the_destination(self):
+        self.connections.get_bq_table(None, None, "table")
+        self.connections.copy_bq_table(
+            BigQueryRelation.create(database="project", schema="dataset", identifier="source"),
+            BigQueryRelation.create(database="project", schema="dataset", identifier="table"),
+            "WRITE_TRUNCATE",
+        )
+        self.connections.get_bq_table("project", "dataset", "table")
+
+        assert self.mock_client.get_table.call_count == 2
@@ -1,16 +1,27 @@
 from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Callable, Optional, Union
-
-from dbt.adapters.contracts.connection import AdapterResponse, Credentials
+import re
+import time
+from typing import Any, Callable, IO, Optional, Tuple, Union
+import uuid
+
+from dbt.adapters.base.pool import HandlePool, pool_key
+from dbt.adapters.contracts.connection import (
+    AdapterResponse,
+    Connection,
+    ConnectionState,
+    Credentials,
+)
 from dbt.adapters.events.logging import AdapterLogger
-from dbt.adapters.events.types import TypeCodeNotFound
+from dbt.adapters.events.types import SQLQuery, SQLQueryStatus, TypeCodeNotFound
 from dbt.adapters.postgres.record import PostgresRecordReplayHandle
 from dbt.adapters.sql import SQLConnectionManager
 from dbt_common.exceptions import DbtDatabaseError, DbtRuntimeError
-from dbt_common.events.functions import warn_or_error
+from dbt_common.events.contextvars import get_node_info
+from dbt_common.events.functions import fire_event, warn_or_error
 from dbt_common.helper_types import Port
 from dbt_common.record import get_record_mode_from_env, RecorderMode
+from dbt_common.utils import cast_to_str
 from mashumaro.jsonschema.annotations import Maximum, Minimum
 import psycopg2
 from typing_extensions import Annotated
@@ -37,6 +48,14 @@ class PostgresCredentials(Credentials):
     application_name: Optional[str] = "dbt"
     autocommit: Optional[bool] = False
     retries: int = 1
+    # keep up to this many connections open between nodes, for reuse by the
+    # next node on any thread. 0 closes every connection once its node is done.
+    pool_size: int = 0
+    # close pooled connections that have been idle for longer than this
+    pool_idle_timeout: int = 300
+    # run a `select 1` on pooled connections idle for longer than this, before
+    # reusing them
+    pool_liveness_check_after: int = 60
 
     _ALIASES = {"dbname": "database", "pass": "password"}
 
@@ -66,11 +85,64 @@ class PostgresCredentials(Credentials):
             "application_name",
             "autocommit",
             "retries",
+            "pool_size",
+            "pool_idle_timeout",
+            "pool_liveness_check_after",
         )
 
 
+# comments and whitespace in front of a statement, like the query comment
+_LEADING_COMMENTS = re.compile(r"(?:\s+|--[^\n]*|/\*.*?\*/)*", re.DOTALL)
+_MODIFYING_KEYWORDS = re.compile(r"\b(?:into|insert|update|delete|merge)\b", re.IGNORECASE)
+
+
+def _is_single_select(sql: str) -> bool:
+    """Check if the sql is a single SELECT statement, the only kind of
+    statement a cursor can be declared for. Anything that might not be one,
+    like a data modifying CTE, is reported as not being one.
+    """
+    statement = _LEADING_COMMENTS.sub("", sql, count=1).rstrip().rstrip(";")
+    first_word = statement.split(None, 1)[0].lower() if statement else ""
+    return (
+        first_word in ("select", "with", "values")
+        and ";" not in statement
+        and _MODIFYING_KEYWORDS.search(statement) is None
+    )
+
+
+def _is_reusable(
+    handle, idle_seconds: float = 0, liveness_check_after: Optional[float] = None
+) -> bool:
+    # both only look at the client side state, no round trip needed
+    if (
+        handle.closed != 0
+        or handle.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_IDLE
+    ):
+        return False
+    if liveness_check_after is not None and idle_seconds >= liveness_check_after:
+        # the server, or anything in between, may have dropped the connection
+        # while it sat idle. Raises if it did.
+        with _autocommit(handle), handle.cursor() as cursor:
+            cursor.execute("select 1")
+            cursor.fetchone()
+    return True
+
+
+@contextmanager
+def _autocommit(handle):
+    # so statements on an idle handle don't leave a transaction open behind them
+    autocommit = handle.autocommit
+    handle.autocommit = True
+    try:
+        yield
+    finally:
+        handle.autocommit = autocommit
+
+
 class PostgresConnectionManager(SQLConnectionManager):
     TYPE = "postgres"
+    # connections kept open between nodes, when the profile sets pool_size
+    _handle_pool = HandlePool(TYPE, close=lambda handle: handle.close())
 
     def __init__(self, profile, mp_context):
         super().__init__(profile, mp_context)
@@ -123,6 +195,98 @@ class PostgresConnectionManager(SQLConnectionManager):
             super().rollback_if_open()
         connection.transaction_open = False
 
+    def _open_result_stream(self, sql, auto_begin, batch_size):
+        # psycopg2 reads the whole result of an ordinary cursor on execute, so
+        # stream through a declared cursor instead. With autocommit there may
+        # be no transaction block to declare it in, so it must be held.
+        return self._open_declared_result_stream(
+            sql, auto_begin, batch_size, with_hold=self._is_autocommit_enabled()
+        )
+
+    def _open_spilled_result_stream(self, sql, auto_begin, batch_size):
+        # psycopg2 reads the whole result of an ordinary cursor on execute.
+        # A single SELECT is read through a named cursor instead, which
+        # psycopg2 declares on execute and fetches from on fetchmany. Any other
+        # statement runs as is, on an ordinary cursor.
+        connection = self.get_thread_connection()
+        if isinstance(connection.handle, PostgresRecordReplayHandle) or not _is_single_select(sql):
+            return super()._open_spilled_result_stream(sql, auto_begin, batch_size)
+
+        if auto_begin and connection.transaction_open is False:
+            self.begin()
+
+        with self.exception_handler(sql):
+            fire_event(
+                SQLQuery(
+                    conn_name=cast_to_str(connection.name), sql=sql, node_info=get_node_info()
+                )
+            )
+            pre = time.perf_counter()
+            # with autocommit there is no transaction block to declare the
+            # cursor in, so it must be held
+            cursor = connection.handle.cursor(
+                name=f"dbt_cursor_{uuid.uuid4().hex}", withhold=self._is_autocommit_enabled()
+            )
+            cursor.execute(sql)
+            # a named cursor has no description until the first fetch
+            rows = cursor.fetchmany(batch_size)
+        column_names = [col[0] for col in cursor.description or []]
+
+        def batches():
+            nonlocal rows
+            try:
+                while rows:
+                    yield rows
+                    if len(rows) < batch_size:
+                        return
+                    with self.exception_handler(sql):
+                        rows = cursor.fetchmany(batch_size)
+            finally:
+                cursor.close()
+
+        def get_response(fetched: int) -> AdapterResponse:
+            # the status of the cursor is the one of its last FETCH
+            response = AdapterResponse(
+                _message=f"SELECT {fetched}", code="SELECT", rows_affected=fetched
+            )
+            fire_event(
+                SQLQueryStatus(
+                    status=str(response),
+                    elapsed=time.perf_counter() - pre,
+                    node_info=get_node_info(),
+                )
+            )
+            return response
+
+        return get_response, (column_names, batches())
+
+    def copy_from(self, sql: str, file: IO[str]) -> Tuple[Connection, Any]:
+        """Run a COPY ... FROM STDIN statement, streaming the file to it."""
+        connection = self.get_thread_connection()
+        if connection.transaction_open is False:
+            self.begin()
+
+        with self.exception_handler(sql):
+            fire_event(
+                SQLQuery(
+                    conn_name=cast_to_str(connection.name), sql=sql, node_info=get_node_info()
+                )
+            )
+            pre = time.perf_counter()
+            cursor = connection.handle.cursor()
+            cursor.copy_expert(sql, file)
+            result = self.get_response(cursor)
+            fire_event(
+                SQLQueryStatus(
+                    status=str(result),
+                    elapsed=time.perf_counter() - pre,
+                    node_info=get_node_info(),
+                    query_id=result.query_id,
+                )
+            )
+
+        return connection, cursor
+
     @contextmanager
     def exception_handler(self, sql):
         try:
@@ -158,6 +322,19 @@ class PostgresConnectionManager(SQLConnectionManager):
             return connection
 
         credentials = cls.get_credentials(connection.credentials)
+        if credentials.pool_size:
+            handle = cls._handle_pool.acquire(
+                pool_key(credentials),
+                credentials.pool_idle_timeout,
+                check=lambda handle, idle_seconds: _is_reusable(
+                    handle, idle_seconds, credentials.pool_liveness_check_after
+                ),
+            )
+            if handle is not None:
+                connection.handle = handle
+                connection.state = ConnectionState.OPEN
+                return connection
+
         kwargs = {}
         # we don't want to pass 0 along to connect() as postgres will try to
         # call an invalid setsockopt() call (contrary to the docs).
@@ -238,6 +415,64 @@ class PostgresConnectionManager(SQLConnectionManager):
             retryable_exceptions=retryable_exceptions,
         )
 
+    def release(self):
+        credentials = self.profile.credentials
+        if not credentials.pool_size:
+            return super().release()
+
+        with self.lock:
+            conn = self.get_if_exists()
+            if conn is None:
+                return
+
+        try:
+            if not self._return_to_pool(conn, credentials):
+                self.close(conn)
+        except Exception:
+            # if rollback or close failed, remove our busted connection
+            self.clear_thread_connection()
+            raise
+
+    def _return_to_pool(self, connection, credentials) -> bool:
+        """Roll back anything still in progress on the connection's handle and
+        put the handle in the pool, leaving the connection closed.
+
+        :return: False if the handle can't be pooled, and should be closed.
+        """
+        if connection.state != ConnectionState.OPEN:
+            return False
+        handle = connection.handle
+        if isinstance(handle, PostgresRecordReplayHandle) or handle.closed:
+            return False
+
+        # also roll back the transactions psycopg2 opens by itself, for
+        # queries that run without dbt's begin
+        if connection.transaction_open or not _is_reusable(handle):
+            self._rollback_handle(connection)
+            connection.transaction_open = False
+        if not _is_reusable(handle):
+            return False
+        # drop the session state the node left behind, like settings, temp
+        # tables and prepared statements, so the next node starts clean
+        try:
+            with _autocommit(handle), handle.cursor() as cursor:
+                cursor.execute("discard all")
+                if credentials.role:
+                    cursor.execute("set role {}".format(credentials.role))
+        except psycopg2.Error:
+            return False
+        if not self._handle_pool.release(pool_key(credentials), handle, credentials.pool_size):
+            return False
+
+        connection.handle = None
+        connection.state = ConnectionState.CLOSED
+        return True
+
+    def cleanup_all(self):
+        super().cleanup_all()
+        if self.profile.credentials.pool_size:
+            self._handle_pool.drain(pool_key(self.profile.credentials))
+
     def cancel(self, connection):
         connection_name = connection.name
         try:
@@ -1,9 +1,11 @@
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from multiprocessing.context import SpawnContext
-from typing import Any, List, Optional, Set
+import threading
+from typing import Any, List, Optional, Set, TYPE_CHECKING
 
-from dbt.adapters.base import AdapterConfig, ConstraintSupport, available
+from dbt.adapters.base import AdapterConfig, BaseRelation, ConstraintSupport, available
+from dbt.adapters.bulk_load import CsvRowsReader
 from dbt.adapters.capability import (
     Capability,
     CapabilityDict,
@@ -25,8 +27,12 @@ from dbt_common.utils import encoding as dbt_encoding
 
 from dbt.adapters.postgres.column import PostgresColumn
 from dbt.adapters.postgres.connections import PostgresConnectionManager
+from dbt.adapters.postgres.record import PostgresRecordReplayHandle
 from dbt.adapters.postgres.relation import PostgresRelation
 
+if TYPE_CHECKING:
+    import agate
+
 
 GET_RELATIONS_MACRO_NAME = "postgres__get_relations"
 
@@ -105,6 +111,10 @@ class PostgresAdapter(SQLAdapter):
         self.connections.set_skip_transactions_checker(
             lambda: self.behavior.postgres_skip_autocommit_transaction_statements.no_warn
         )
+        # dependencies between all relations, fetched once when the relations
+        # cache is populated lazily
+        self._relation_links: Optional[List[Any]] = None
+        self._relation_links_lock = threading.Lock()
 
     @property
     def _behavior_flags(self) -> List[BehaviorFlag]:
@@ -169,6 +179,41 @@ class PostgresAdapter(SQLAdapter):
         super()._relations_cache_for_schemas(manifest, cache_schemas)
         self._link_cached_relations(manifest)
 
+    def _link_lazily_cached_schema(self, schema_relation) -> None:
+        with self._relation_links_lock:
+            if self._relation_links is None:
+                self._relation_links = list(self.execute_macro(GET_RELATIONS_MACRO_NAME))
+
+        database = self.config.credentials.database
+        schema = schema_relation.schema.lower()
+        for dep_schema, dep_name, refed_schema, refed_name in self._relation_links:
+            if schema not in (dep_schema.lower(), refed_schema.lower()):
+                continue
+            # link once both schemas are cached, whichever of them is listed
+            # last. Adding a link to an uncached schema would mark it cached.
+            if (database, dep_schema) not in self.cache:
+                continue
+            if (database, refed_schema) not in self.cache:
+                continue
+            dependent = self.Relation.create(
+                database=database, schema=dep_schema, identifier=dep_name
+            )
+            referenced = self.Relation.create(
+                database=database, schema=refed_schema, identifier=refed_name
+            )
+            self.cache.add_link(referenced, dependent)
+
+    @available.parse_none
+    def bulk_load_csv_rows(
+        self, relation: BaseRelation, agate_table: "agate.Table", column_names_csv: str
+    ) -> Optional[str]:
+        if isinstance(self.connections.get_thread_connection().handle, PostgresRecordReplayHandle):
+            # the record/replay cursor doesn't record COPY
+            return None
+        sql = f"copy {relation.render()} ({column_names_csv}) from stdin with (format csv)"
+        self.connections.copy_from(sql, CsvRowsReader(agate_table.rows))
+        return sql
+
     def timestamp_add_sql(self, add_to: str, number: int = 1, interval: str = "hour") -> str:
         return f"{add_to} + interval '{number} {interval}'"
 
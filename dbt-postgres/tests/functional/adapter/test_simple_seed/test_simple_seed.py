@@ -16,6 +16,7 @@ from dbt.tests.adapter.simple_seed.test_seed import (
     BaseSimpleSeedWithBOM,
     BaseSeedSpecificFormats,
     BaseTestEmptySeed,
+    BaseSeedBulkLoad,
 )
 from dbt.tests.adapter.simple_seed.test_seed_type_override import (
     BaseSimpleSeedColumnOverride,
@@ -70,5 +71,9 @@ class TestEmptySeed(BaseTestEmptySeed):
     pass
 
 
+class TestSeedBulkLoad(BaseSeedBulkLoad):
+    pass
+
+
 class TestSimpleSeedColumnOverride(BaseSimpleSeedColumnOverride):
     pass
@@ -308,6 +308,25 @@ class TestPostgresAdapter(TestCase):
             application_name="dbt",
         )
 
+    @mock.patch("dbt.adapters.postgres.connections.psycopg2")
+    def test_bulk_load_csv_rows(self, psycopg2):
+        copied = []
+        cursor = psycopg2.connect.return_value.cursor.return_value
+        cursor.copy_expert.side_effect = lambda sql, file: copied.append((sql, file.read()))
+        self.adapter.acquire_connection("dummy")
+
+        relation = self.adapter.Relation.create(
+            database="postgres", schema="public", identifier="seed"
+        )
+        table = agate.Table([(2, 'a "b"'), (None, "c")], ["id", "name"])
+        sql = self.adapter.bulk_load_csv_rows(relation, table, '"id", "name"')
+
+        expected_sql = (
+            'copy "postgres"."public"."seed" ("id", "name") from stdin with (format csv)'
+        )
+        self.assertEqual(sql, expected_sql)
+        self.assertEqual(copied, [(expected_sql, '"2","a ""b"""\n,"c"\n')])
+
     @mock.patch.object(PostgresAdapter, "execute_macro")
     @mock.patch.object(PostgresAdapter, "_get_catalog_relations")
     def test_get_catalog_various_schemas(self, mock_get_relations, mock_execute):
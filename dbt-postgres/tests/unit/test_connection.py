@@ -9,10 +9,10 @@ from dbt.contracts.files import FileHash
 from dbt.contracts.graph.manifest import ManifestStateCheck
 from dbt.task.debug import DebugTask
 from dbt_common.exceptions import DbtConfigError
-from psycopg2 import DatabaseError, extensions as psycopg2_extensions
+from psycopg2 import DatabaseError, Error as Psycopg2Error, extensions as psycopg2_extensions
 
 from dbt.adapters.postgres import Plugin as PostgresPlugin, PostgresAdapter
-from dbt.adapters.postgres.connections import PostgresCredentials
+from dbt.adapters.postgres.connections import PostgresCredentials, _is_single_select
 from tests.unit.utils import (
     clear_plugin,
     config_from_parts_or_dicts,
@@ -429,3 +429,185 @@ class TestAutocommitBehavior(TestCase):
             }
         )
         assert credentials.autocommit is False
+
+
+class TestConnectionPool(TestCase):
+    def setUp(self):
+        profile_cfg = {
+            "outputs": {
+                "test": {
+                    "type": "postgres",
+                    "dbname": "postgres",
+                    "user": "root",
+                    "host": "thishostshouldnotexist",
+                    "pass": "password",
+                    "port": 5432,
+                    "schema": "public",
+                    "pool_size": 2,
+                }
+            },
+            "target": "test",
+        }
+        project_cfg = {
+            "name": "X",
+            "version": "0.1",
+            "profile": "test",
+            "project-root": "/tmp/dbt/does-not-exist",
+            "quoting": {
+                "identifier": False,
+                "schema": True,
+            },
+            "config-version": 2,
+        }
+        self.config = config_from_parts_or_dicts(project_cfg, profile_cfg)
+        self.patcher = mock.patch("dbt.adapters.postgres.connections.psycopg2")
+        self.psycopg2 = self.patcher.start()
+        self.psycopg2.extensions.TRANSACTION_STATUS_IDLE = (
+            psycopg2_extensions.TRANSACTION_STATUS_IDLE
+        )
+        self.handle = mock.MagicMock(spec=psycopg2_extensions.connection)
+        self.handle.closed = 0
+        self.handle.get_transaction_status.return_value = (
+            psycopg2_extensions.TRANSACTION_STATUS_IDLE
+        )
+        self.psycopg2.connect.return_value = self.handle
+        self.psycopg2.Error = Psycopg2Error
+        self.adapter = PostgresAdapter(self.config, get_context("spawn"))
+
+    def tearDown(self):
+        self.adapter.cleanup_connections()
+        self.patcher.stop()
+
+    def test_released_handle_is_reused(self):
+        for name in ("first", "second"):
+            with self.adapter.connection_named(name):
+                self.adapter.connections.get_thread_connection().handle.cursor()
+
+        self.psycopg2.connect.assert_called_once()
+        self.handle.close.assert_not_called()
+
+        self.adapter.cleanup_connections()
+        self.handle.close.assert_called_once()
+
+    def test_handle_in_transaction_is_rolled_back(self):
+        with self.adapter.connection_named("first"):
+            connection = self.adapter.connections.get_thread_connection()
+            connection.handle.cursor()
+            self.adapter.connections.begin()
+
+        self.handle.rollback.assert_called_once()
+        self.handle.close.assert_not_called()
+
+    def test_broken_handle_is_closed(self):
+        with self.adapter.connection_named("first"):
+            self.adapter.connections.get_thread_connection().handle.cursor()
+            self.handle.closed = 2
+
+        with self.adapter.connection_named("second"):
+            self.adapter.connections.get_thread_connection().handle.cursor()
+
+        self.assertEqual(self.psycopg2.connect.call_count, 2)
+
+    def test_released_handle_session_is_reset(self):
+        self.config.credentials.role = "transformer"
+        with self.adapter.connection_named("first"):
+            self.adapter.connections.get_thread_connection().handle.cursor()
+
+        cursor = self.handle.cursor.return_value.__enter__.return_value
+        cursor.execute.assert_has_calls(
+            [mock.call("discard all"), mock.call("set role transformer")]
+        )
+
+    def test_handle_failing_liveness_check_is_closed(self):
+        self.config.credentials.pool_liveness_check_after = 0
+        with self.adapter.connection_named("first"):
+            self.adapter.connections.get_thread_connection().handle.cursor()
+
+        cursor = self.handle.cursor.return_value.__enter__.return_value
+        cursor.execute.side_effect = DatabaseError("server closed the connection")
+        with self.adapter.connection_named("second"):
+            self.adapter.connections.get_thread_connection().handle.cursor()
+
+        self.assertEqual(self.psycopg2.connect.call_count, 2)
+
+
+class TestSpilledResults(TestCase):
+    def setUp(self):
+        profile_cfg = {
+            "outputs": {
+                "test": {
+                    "type": "postgres",
+                    "dbname": "postgres",
+                    "user": "root",
+                    "host": "thishostshouldnotexist",
+                    "pass": "password",
+                    "port": 5432,
+                    "schema": "public",
+                    "autocommit": True,
+                }
+            },
+            "target": "test",
+        }
+        project_cfg = {
+            "name": "X",
+            "version": "0.1",
+            "profile": "test",
+            "project-root": "/tmp/dbt/does-not-exist",
+            "quoting": {
+                "identifier": False,
+                "schema": True,
+            },
+            "config-version": 2,
+        }
+        self.config = config_from_parts_or_dicts(project_cfg, profile_cfg)
+        self.patcher = mock.patch("dbt.adapters.postgres.connections.psycopg2")
+        self.psycopg2 = self.patcher.start()
+        self.handle = mock.MagicMock(spec=psycopg2_extensions.connection)
+        self.cursor = self.handle.cursor.return_value
+        self.cursor.description = [("id",)]
+        self.psycopg2.connect.return_value = self.handle
+        self.adapter = PostgresAdapter(self.config, get_context("spawn"))
+        self.adapter.connections.set_spill_results_checker(lambda: True)
+
+    def tearDown(self):
+        self.adapter.cleanup_connections()
+        self.patcher.stop()
+
+    def test_select_is_read_through_a_named_cursor(self):
+        self.cursor.fetchmany.return_value = [(1,), (2,)]
+        with self.adapter.connection_named("spill"):
+            response, table = self.adapter.connections.execute("select id from x", fetch=True)
+
+        self.handle.cursor.assert_called_once_with(name=mock.ANY, withhold=True)
+        self.cursor.close.assert_called_once()
+        self.assertEqual(response.rows_affected, 2)
+        self.assertEqual([tuple(row) for row in table.rows], [(1,), (2,)])
+
+    def test_other_statements_run_as_is(self):
+        self.cursor.fetchmany.side_effect = [[(1,)], []]
+        self.cursor.statusmessage = "INSERT 0 1"
+        self.cursor.rowcount = 1
+        sql = "insert into x (id) values (1) returning id"
+        with self.adapter.connection_named("spill"):
+            response, table = self.adapter.connections.execute(sql, fetch=True)
+
+        self.handle.cursor.assert_called_once_with()
+        self.cursor.execute.assert_called_once_with(sql, None)
+        self.assertEqual(response.code, "INSERT")
+        self.assertEqual(len(table.rows), 1)
+
+
+@pytest.mark.parametrize(
+    "sql,expected",
+    [
+        ('/* {"app": "dbt"} */\nselect 1;', True),
+        ("-- list\nwith x as (select 1) select * from x", True),
+        ("insert into x select 1 returning *", False),
+        ("with x as (delete from y returning *) select * from x", False),
+        ("select 1 into y", False),
+        ("select 1; select 2", False),
+        ("show search_path", False),
+    ],
+)
+def test_is_single_select(sql, expected):
+    assert _is_single_select(sql) is expected
@@ -1,7 +1,11 @@
+import json
+import threading
+import time
+
 import requests
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
 from dbt.adapters.exceptions import FailedToConnectError
 from dbt_common.exceptions import DbtRuntimeError
@@ -85,3 +89,39 @@ def create_token_service_client(token_endpoint: Dict[str, Any]) -> TokenServiceB
         raise ValueError(
             f"Unsupported identity provider type: {service_type}. Select 'okta' or 'entra.'"
         )
+
+
+# request a new token this long before the identity provider says the last one expires
+TOKEN_EXPIRY_MARGIN_SECONDS = 60
+
+# token_endpoint (as json) -> (token response, monotonic time it is used until)
+_token_cache: Dict[str, Tuple[Dict[str, Any], float]] = {}
+_token_cache_lock = threading.Lock()
+
+
+def request_token(token_endpoint: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Request a token from the identity provider of a token_endpoint, and return the
+    response's json.
+
+    A response with an `expires_in` is reused for the same token_endpoint until shortly
+    before it expires, so opening a connection doesn't go to the identity provider each time.
+    """
+    key = json.dumps(token_endpoint, sort_keys=True)
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+    if cached is not None and time.monotonic() < cached[1]:
+        return cached[0]
+
+    payload = create_token_service_client(token_endpoint).handle_request().json()
+    try:
+        expires_in = float(payload.get("expires_in"))
+    except (TypeError, ValueError):
+        return payload
+    if expires_in > TOKEN_EXPIRY_MARGIN_SECONDS:
+        with _token_cache_lock:
+            _token_cache[key] = (
+                payload,
+                time.monotonic() + expires_in - TOKEN_EXPIRY_MARGIN_SECONDS,
+            )
+    return payload
@@ -1,22 +1,40 @@
-import re
 import os
+import re
 
 import time
 
 import redshift_connector
-import sqlparse
 
 from contextlib import contextmanager
-from typing import Any, Callable, Dict, Generator, Tuple, Union, Optional, List, TYPE_CHECKING
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    NamedTuple,
+    Tuple,
+    Union,
+    Optional,
+    List,
+    TYPE_CHECKING,
+)
 from dataclasses import dataclass, field
 
 from dbt.adapters.exceptions import FailedToConnectError
 from redshift_connector.utils.oids import get_datatype_name
 
+from dbt.adapters.base.pool import HandlePool, pool_key
 from dbt.adapters.sql import SQLConnectionManager
-from dbt.adapters.contracts.connection import AdapterResponse, Connection, Credentials
+from dbt.adapters.sql.statements import split_statements
+from dbt.adapters.contracts.connection import (
+    AdapterResponse,
+    Connection,
+    ConnectionState,
+    Credentials,
+)
 from dbt.adapters.events.logging import AdapterLogger
-from dbt.adapters.redshift.auth_providers import create_token_service_client
+from dbt.adapters.redshift.auth_providers import request_token
+from dbt.adapters.redshift.iam_credentials import TemporaryCredentials, TemporaryCredentialsCache
 from dbt_common.contracts.util import Replaceable
 from dbt_common.dataclass_schema import dbtClassMixin, StrEnum, ValidationError
 from dbt_common.helper_types import Port
@@ -27,7 +45,6 @@ if TYPE_CHECKING:
     # Used by mypy for earlier type hints.
     import agate
 
-COMMENT_REGEX = re.compile(r"(\".*?\"|\'.*?\')|(/\*.*?\*/|--[^\r\n]*$)", re.MULTILINE)
 
 logger = AdapterLogger("Redshift")
 
@@ -198,6 +215,27 @@ class RedshiftCredentials(Credentials):
     # statements. Safe only for projects with no downstream dependents.
     drop_without_cascade: bool = False
 
+    # Seeds: when set (s3://bucket/prefix), seed rows are uploaded there and
+    # loaded with COPY, instead of batches of inserts. COPY authenticates with
+    # seed_copy_iam_role, or the cluster's default IAM role if that isn't set.
+    seed_s3_staging_path: Optional[str] = None
+    seed_copy_iam_role: Optional[str] = None
+
+    # Connection pool: keep up to pool_size connections open once their node
+    # is done, for reuse by the next node on any thread. A pooled connection
+    # that has been idle for pool_liveness_check_after seconds runs a
+    # `select 1` before reuse, and one idle for pool_idle_timeout is closed.
+    pool_size: int = 0
+    pool_idle_timeout: int = 300
+    pool_liveness_check_after: int = 60
+
+    # IAM methods: when set, dbt requests the temporary database credentials
+    # itself, shares them between connections with the same cluster, user,
+    # IAM identity and database, and requests new ones in the background once
+    # iam_credentials_refresh_fraction of their lifetime has passed.
+    cache_iam_credentials: bool = False
+    iam_credentials_refresh_fraction: float = 0.75
+
     _ALIASES = {"dbname": "database", "pass": "password"}
 
     @property
@@ -238,6 +276,11 @@ class RedshiftCredentials(Credentials):
             "query_group",
             "allow_concurrent_drops",
             "drop_without_cascade",
+            "seed_s3_staging_path",
+            "pool_size",
+            "pool_idle_timeout",
+            "pool_liveness_check_after",
+            "cache_iam_credentials",
         )
 
     @property
@@ -249,6 +292,85 @@ def is_serverless(credentials: RedshiftCredentials) -> bool:
     return "serverless" in credentials.host or credentials.is_serverless is True
 
 
+# the region of a provisioned or serverless endpoint, and the workgroup of a serverless one
+_HOST_REGEX = re.compile(
+    r"(?P<name>[^.]+)\.[^.]+\.(?P<region>[a-z0-9-]+)\.redshift(?P<serverless>-serverless)?\.amazonaws\.com",
+    re.IGNORECASE,
+)
+
+_temporary_credentials = TemporaryCredentialsCache()
+
+
+def _temporary_credentials_request(
+    credentials: RedshiftCredentials,
+) -> Optional[Tuple[Tuple[Optional[str], ...], Callable[[], TemporaryCredentials]]]:
+    """The cache key and fetch function for the temporary database credentials
+    of an IAM method, or None if they are left to redshift_connector.
+
+    That is the case when cache_iam_credentials isn't set, and for endpoints
+    that the region or serverless workgroup can't be found for without a
+    lookup, like custom domain names.
+    """
+    if not credentials.cache_iam_credentials or credentials.method not in (
+        RedshiftConnectionMethod.IAM,
+        RedshiftConnectionMethod.IAM_ROLE,
+    ):
+        return None
+
+    host_match = _HOST_REGEX.fullmatch(credentials.host)
+    region = credentials.region or (host_match and host_match["region"])
+    serverless = is_serverless(credentials)
+    if serverless:
+        cluster = credentials.serverless_work_group or (
+            host_match and host_match["serverless"] and host_match["name"]
+        )
+    else:
+        cluster = credentials.cluster_id
+    if not region or not cluster:
+        return None
+
+    db_user = credentials.user if credentials.method == RedshiftConnectionMethod.IAM else None
+    iam_identity = credentials.access_key_id or credentials.iam_profile
+
+    def fetch() -> TemporaryCredentials:
+        # boto3 is a dependency of redshift_connector
+        import boto3
+
+        session = boto3.Session(
+            aws_access_key_id=credentials.access_key_id,
+            aws_secret_access_key=credentials.secret_access_key,
+            profile_name=credentials.iam_profile,
+            region_name=region,
+        )
+        if serverless:
+            response = session.client("redshift-serverless").get_credentials(
+                workgroupName=cluster, dbName=credentials.database
+            )
+            return TemporaryCredentials(
+                response["dbUser"], response["dbPassword"], response["expiration"]
+            )
+
+        client = session.client("redshift")
+        if db_user is None:
+            # the iam_role method, which redshift_connector connects to with group federation
+            response = client.get_cluster_credentials_with_iam(
+                DbName=credentials.database, ClusterIdentifier=cluster
+            )
+        else:
+            response = client.get_cluster_credentials(
+                DbUser=db_user,
+                DbName=credentials.database,
+                ClusterIdentifier=cluster,
+                DbGroups=credentials.db_groups,
+                AutoCreate=credentials.autocreate,
+            )
+        return TemporaryCredentials(
+            response["DbUser"], response["DbPassword"], response["Expiration"]
+        )
+
+    return (cluster, db_user, iam_identity, credentials.database), fetch
+
+
 def get_connection_method(
     credentials: RedshiftCredentials,
 ) -> Callable[[], redshift_connector.Connection]:
@@ -421,10 +543,8 @@ def get_connection_method(
 
         __validate_required_fields("oauth_token_identity_center", ("token_endpoint",))
 
-        token_service = create_token_service_client(credentials.token_endpoint)
-        response = token_service.handle_request()
         try:
-            access_token = response.json()["access_token"]
+            access_token = request_token(credentials.token_endpoint)["access_token"]
         except KeyError:
             raise FailedToConnectError(
                 "access_token missing from Idp token request. Please confirm correct configuration of the token_endpoint field in profiles.yml and that your Idp can use a refresh token to obtain an OIDC-compliant access token."
@@ -458,8 +578,24 @@ def get_connection_method(
 
     kwargs: Dict[str, Any] = kwargs_function(credentials)
 
+    temporary_credentials_request = _temporary_credentials_request(credentials)
+    if temporary_credentials_request is not None:
+        # connect with the cached credentials, as an ordinary database user
+        temporary_credentials_kwargs = __base_kwargs(credentials)
+
     def connect() -> redshift_connector.Connection:
-        c = redshift_connector.connect(**kwargs)
+        if temporary_credentials_request is None:
+            c = redshift_connector.connect(**kwargs)
+        else:
+            key, fetch = temporary_credentials_request
+            db_credentials = _temporary_credentials.get(
+                key, fetch, credentials.iam_credentials_refresh_fraction
+            )
+            c = redshift_connector.connect(
+                **temporary_credentials_kwargs,
+                user=db_credentials.user,
+                password=db_credentials.password,
+            )
         if credentials.autocommit:
             c.autocommit = True
         if credentials.role:
@@ -472,8 +608,32 @@ def get_connection_method(
     return connect
 
 
+class _PooledHandle(NamedTuple):
+    handle: redshift_connector.Connection
+    backend_pid: Optional[int]
+
+
+def _is_reusable(
+    handle: redshift_connector.Connection,
+    idle_seconds: float = 0,
+    liveness_check_after: Optional[float] = None,
+) -> bool:
+    # redshift_connector drops its socket when the connection is closed
+    if handle._sock is None or handle.in_transaction:
+        return False
+    if liveness_check_after is not None and idle_seconds >= liveness_check_after:
+        # the server, or anything in between, may have dropped the connection
+        # while it sat idle. Raises if it did.
+        with handle.cursor() as cursor:
+            cursor.execute("select 1")
+            cursor.fetchone()
+    return True
+
+
 class RedshiftConnectionManager(SQLConnectionManager):
     TYPE = "redshift"
+    # connections kept open between nodes, when the profile sets pool_size
+    _handle_pool = HandlePool(TYPE, close=lambda pooled: pooled.handle.close())
 
     def __init__(self, profile, mp_context):
         super().__init__(profile, mp_context)
@@ -587,6 +747,25 @@ class RedshiftConnectionManager(SQLConnectionManager):
             super().rollback_if_open()
         connection.transaction_open = False
 
+    def _open_result_stream(
+        self, sql: str, auto_begin: bool, batch_size: int
+    ) -> Tuple[AdapterResponse, Any]:
+        """redshift_connector reads the whole result of an ordinary cursor on
+        execute, so stream through a declared cursor instead. Redshift only
+        allows cursors inside a transaction block, so with autocommit one is
+        opened around the cursor unless dbt already sent a BEGIN.
+        """
+        connection = self.get_thread_connection()
+        in_transaction = (
+            connection.transaction_open and not self._should_skip_transaction_statements()
+        )
+        return self._open_declared_result_stream(
+            sql,
+            auto_begin,
+            batch_size,
+            begin=self._is_autocommit_enabled() and not in_transaction,
+        )
+
     @contextmanager
     def exception_handler(self, sql):
         try:
@@ -664,6 +843,21 @@ class RedshiftConnectionManager(SQLConnectionManager):
 
         credentials = connection.credentials
 
+        if credentials.pool_size:
+            pooled = cls._handle_pool.acquire(
+                pool_key(credentials),
+                credentials.pool_idle_timeout,
+                check=lambda pooled, idle_seconds: _is_reusable(
+                    pooled.handle, idle_seconds, credentials.pool_liveness_check_after
+                ),
+            )
+            if pooled is not None:
+                connection.handle = pooled.handle
+                if pooled.backend_pid is not None:
+                    connection.backend_pid = pooled.backend_pid
+                connection.state = ConnectionState.OPEN
+                return connection
+
         if credentials.retry_all:
             retryable_exceptions = (redshift_connector.Error,)
         else:
@@ -685,6 +879,54 @@ class RedshiftConnectionManager(SQLConnectionManager):
             open_connection.backend_pid = backend_pid
         return open_connection
 
+    def release(self) -> None:
+        credentials = self.profile.credentials
+        if not credentials.pool_size:
+            return super().release()
+
+        with self.lock:
+            conn = self.get_if_exists()
+            if conn is None:
+                return
+
+        try:
+            if not self._return_to_pool(conn, credentials):
+                self.close(conn)
+        except Exception:
+            # if rollback or close failed, remove our busted connection
+            self.clear_thread_connection()
+            raise
+
+    def _return_to_pool(self, connection: Connection, credentials: RedshiftCredentials) -> bool:
+        """Roll back anything still in progress on the connection's handle and
+        put the handle in the pool, leaving the connection closed.
+
+        :return: False if the handle can't be pooled, and should be closed.
+        """
+        if connection.state != ConnectionState.OPEN:
+            return False
+        handle = connection.handle
+        if handle._sock is None:
+            return False
+
+        if connection.transaction_open or handle.in_transaction:
+            self._rollback_handle(connection)
+            connection.transaction_open = False
+        if not _is_reusable(handle):
+            return False
+        pooled = _PooledHandle(handle, getattr(connection, "backend_pid", None))
+        if not self._handle_pool.release(pool_key(credentials), pooled, credentials.pool_size):
+            return False
+
+        connection.handle = None
+        connection.state = ConnectionState.CLOSED
+        return True
+
+    def cleanup_all(self) -> None:
+        super().cleanup_all()
+        if self.profile.credentials.pool_size:
+            self._handle_pool.drain(pool_key(self.profile.credentials))
+
     def execute(
         self,
         sql: str,
@@ -765,9 +1007,9 @@ class RedshiftConnectionManager(SQLConnectionManager):
     def add_query(self, sql, auto_begin=True, bindings=None, abridge_sql_log=False):  # type: ignore
         connection = None
         cursor = None
-        self._initialize_sqlparse_lexer()
 
-        queries = sqlparse.split(sql)
+        # statements that are only comments are left out
+        queries = split_statements(sql)
 
         redshift_retryable_exceptions = (
             redshift_connector.InterfaceError,
@@ -775,16 +1017,6 @@ class RedshiftConnectionManager(SQLConnectionManager):
         )
 
         for query in queries:
-            # Strip off comments from the current query
-            without_comments = re.sub(
-                COMMENT_REGEX,
-                "",
-                query,
-            ).strip()
-
-            if without_comments == "":
-                continue
-
             connection, cursor = super().add_query(
                 query,
                 auto_begin,
@@ -808,14 +1040,3 @@ class RedshiftConnectionManager(SQLConnectionManager):
     @classmethod
     def data_type_code_to_name(cls, type_code: Union[int, str]) -> str:
         return get_datatype_name(type_code)
-
-    @staticmethod
-    def _initialize_sqlparse_lexer():
-        """
-        Resolves: https://github.com/dbt-labs/dbt-redshift/issues/710
-        Implementation of this fix: https://github.com/dbt-labs/dbt-core/pull/8215
-        """
-        from sqlparse.lexer import Lexer
-
-        if hasattr(Lexer, "get_default_instance"):
-            Lexer.get_default_instance()
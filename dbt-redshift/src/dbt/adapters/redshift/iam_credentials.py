@@ -0,0 +1,124 @@
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Hashable, Optional
+
+from dbt.adapters.events.logging import AdapterLogger
+
+
+logger = AdapterLogger("Redshift")
+
+# never hand out credentials this close to expiring, a connection opened with
+# them could still be authenticating when they expire
+EXPIRY_MARGIN = timedelta(seconds=30)
+
+
+@dataclass(frozen=True)
+class TemporaryCredentials:
+    """Database credentials from GetClusterCredentials and its variants."""
+
+    user: str
+    password: str
+    expiration: datetime
+
+
+@dataclass
+class _Entry:
+    credentials: TemporaryCredentials
+    refresh_at: datetime
+    refreshing: bool = False
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class TemporaryCredentialsCache:
+    """Temporary database credentials, shared by every connection that would
+    request the same ones.
+
+    Only the first get for a key waits for the credentials to be fetched.
+    Once refresh_fraction of their lifetime has passed, the next get starts a
+    background thread that fetches new ones, and keeps returning the current
+    ones meanwhile. A get only waits again if the credentials expired anyway,
+    for example because the refresh failed.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, _Entry] = {}
+        # one fetch at a time per key
+        self._fetch_locks: Dict[Hashable, threading.Lock] = {}
+
+    def get(
+        self,
+        key: Hashable,
+        fetch: Callable[[], TemporaryCredentials],
+        refresh_fraction: float,
+    ) -> TemporaryCredentials:
+        with self._lock:
+            entry = self._usable_entry(key)
+            if entry is not None:
+                if not entry.refreshing and _now() >= entry.refresh_at:
+                    entry.refreshing = True
+                    threading.Thread(
+                        target=self._refresh,
+                        args=(key, fetch, refresh_fraction, entry),
+                        name="dbt-redshift-credentials-refresh",
+                        daemon=True,
+                    ).start()
+                return entry.credentials
+            fetch_lock = self._fetch_locks.setdefault(key, threading.Lock())
+
+        with fetch_lock:
+            # another thread may have fetched them while this one waited
+            with self._lock:
+                entry = self._usable_entry(key)
+            if entry is not None:
+                return entry.credentials
+            return self._fetch(key, fetch, refresh_fraction)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _usable_entry(self, key: Hashable) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is None or _now() >= entry.credentials.expiration - EXPIRY_MARGIN:
+            return None
+        return entry
+
+    def _fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], TemporaryCredentials],
+        refresh_fraction: float,
+    ) -> TemporaryCredentials:
+        fetched_at = _now()
+        credentials = fetch()
+        refresh_at = fetched_at + (credentials.expiration - fetched_at) * refresh_fraction
+        with self._lock:
+            self._entries[key] = _Entry(credentials, refresh_at)
+        logger.debug(
+            f"Fetched temporary credentials for {key}, expiring at "
+            f"{credentials.expiration.isoformat()}, refreshing after {refresh_at.isoformat()}"
+        )
+        return credentials
+
+    def _refresh(
+        self,
+        key: Hashable,
+        fetch: Callable[[], TemporaryCredentials],
+        refresh_fraction: float,
+        entry: _Entry,
+    ) -> None:
+        logger.debug(f"Refreshing temporary credentials for {key} in the background")
+        try:
+            with self._fetch_locks[key]:
+                self._fetch(key, fetch, refresh_fraction)
+        except Exception as exc:
+            # the current credentials are used until they expire, and the
+            # next get after that fetches them again, raising on failure
+            logger.debug(f"Failed to refresh temporary credentials for {key}: {exc}")
+            with self._lock:
+                entry.refreshing = False
@@ -1,7 +1,11 @@
+import gzip
 import os
 from contextlib import contextmanager
 from dataclasses import dataclass
 from multiprocessing.context import SpawnContext
+import tempfile
+import threading
+from uuid import uuid4
 
 import agate
 from dbt_common.behavior_flags import BehaviorFlag
@@ -14,6 +18,7 @@ from dbt.adapters.base.impl import AdapterConfig, ConstraintSupport, FreshnessRe
 from dbt.adapters.base.column import Column as BaseColumn
 from dbt.adapters.base.meta import available
 from dbt.adapters.base.relation import BaseRelation
+from dbt.adapters.bulk_load import write_csv_rows
 from dbt.adapters.capability import (
     Capability,
     CapabilityDict,
@@ -180,6 +185,10 @@ class RedshiftAdapter(SQLAdapter):
         self.connections.set_skip_transactions_checker(
             lambda: self.behavior.redshift_skip_autocommit_transaction_statements.no_warn
         )
+        # dependencies between all relations, fetched once when the relations
+        # cache is populated lazily
+        self._relation_links: Optional[List[Any]] = None
+        self._relation_links_lock = threading.Lock()
 
     @property
     def _behavior_flags(self) -> List[BehaviorFlag]:
@@ -372,6 +381,57 @@ class RedshiftAdapter(SQLAdapter):
         """
         return bool(self.config.credentials.drop_without_cascade)
 
+    @available.parse_none
+    def bulk_load_csv_rows(
+        self, relation: BaseRelation, agate_table: "agate.Table", column_names_csv: str
+    ) -> Optional[str]:
+        credentials = self.config.credentials
+        if not credentials.seed_s3_staging_path:
+            return None
+        if not credentials.seed_s3_staging_path.startswith("s3://"):
+            raise dbt_common.exceptions.DbtRuntimeError(
+                f"seed_s3_staging_path must be an s3:// path, got "
+                f"'{credentials.seed_s3_staging_path}'"
+            )
+
+        bucket, _, prefix = credentials.seed_s3_staging_path[len("s3://") :].partition("/")
+        key = "/".join(part for part in (prefix.strip("/"), f"{uuid4().hex}.csv.gz") if part)
+        iam_role = (
+            f"'{credentials.seed_copy_iam_role}'" if credentials.seed_copy_iam_role else "default"
+        )
+        # no emptyasnull: it would load the quoted empty strings csv_field
+        # writes as NULL too, while an unquoted empty field is NULL without it
+        sql = (
+            f"copy {relation.render()} ({column_names_csv}) from 's3://{bucket}/{key}' "
+            f"iam_role {iam_role} format as csv gzip "
+            f"dateformat 'auto' timeformat 'auto'"
+        )
+
+        s3 = self._seed_staging_session().client("s3")
+        with tempfile.TemporaryFile() as file:
+            # closing the gzip file doesn't close the file it writes to
+            with gzip.open(file, "wt", encoding="utf-8", newline="") as csv_file:
+                write_csv_rows(agate_table.rows, csv_file)
+            file.seek(0)
+            s3.upload_fileobj(file, bucket, key)
+        try:
+            self.execute(sql)
+        finally:
+            s3.delete_object(Bucket=bucket, Key=key)
+        return sql
+
+    def _seed_staging_session(self):
+        # boto3 is a dependency of redshift_connector
+        import boto3
+
+        credentials = self.config.credentials
+        return boto3.Session(
+            aws_access_key_id=credentials.access_key_id,
+            aws_secret_access_key=credentials.secret_access_key,
+            profile_name=credentials.iam_profile,
+            region_name=credentials.region,
+        )
+
     @available
     def verify_database(self, database):
         if database.startswith('"'):
@@ -702,6 +762,30 @@ class RedshiftAdapter(SQLAdapter):
         super()._relations_cache_for_schemas(manifest, cache_schemas)
         self._link_cached_relations(manifest)
 
+    def _link_lazily_cached_schema(self, schema_relation: BaseRelation) -> None:
+        with self._relation_links_lock:
+            if self._relation_links is None:
+                self._relation_links = list(self.execute_macro(GET_RELATIONS_MACRO_NAME))
+
+        database = self.config.credentials.database
+        schema = schema_relation.schema.lower()
+        _Relation = namedtuple("_Relation", "database schema identifier")
+        for dep_schema, dep_identifier, ref_schema, ref_identifier in self._relation_links:
+            if schema not in (dep_schema.lower(), ref_schema.lower()):
+                continue
+            # link once both schemas are cached, whichever of them is listed
+            # last. Adding a link to an uncached schema would mark it cached.
+            if (database, dep_schema) not in self.cache:
+                continue
+            if (database, ref_schema) not in self.cache:
+                continue
+            dependent = _Relation(database, dep_schema, dep_identifier)
+            referenced = _Relation(database, ref_schema, ref_identifier)
+            self.cache.add_link(
+                referenced=self.Relation.create(**referenced._asdict()),
+                dependent=self.Relation.create(**dependent._asdict()),
+            )
+
     # avoid non-implemented abstract methods warning
     # make it clear what needs to be implemented while still raising the error in super()
     # we can update these with Redshift-specific messages if needed
@@ -186,6 +186,30 @@
 {% endmacro %}
 
 
+{% macro redshift__get_columns_in_schema(schema_relation) -%}
+  {# SHOW COLUMNS lists one table at a time, so there is nothing to prefetch with it. #}
+  {# Late-binding and external views are not in information_schema, and are looked #}
+  {# up with get_columns_in_relation when they are needed. #}
+  {% if redshift__use_show_apis() %}
+    {{ return(none) }}
+  {% endif %}
+  {% call statement('get_columns_in_schema', fetch_result=True) %}
+      select
+        table_name,
+        column_name,
+        data_type,
+        character_maximum_length,
+        numeric_precision,
+        numeric_scale
+
+      from information_schema."columns"
+      where table_schema = '{{ schema_relation.schema }}'
+      order by table_name, ordinal_position
+  {% endcall %}
+  {{ return(load_result('get_columns_in_schema').table) }}
+{% endmacro %}
+
+
 {% macro redshift__get_columns_in_relation_legacy(relation) -%}
   {% call statement('get_columns_in_relation', fetch_result=True) %}
       with bound_views as (
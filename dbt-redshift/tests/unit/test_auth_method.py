@@ -915,3 +915,32 @@ class TestIAMIdcToken(AuthMethod):
             connection = self.adapter.acquire_connection("dummy")
             connection.handle
         assert "Missing required key in token_endpoint: 'type'" in context.exception.msg
+
+    @mock.patch("redshift_connector.connect", MagicMock())
+    def test_idc_token_is_reused_until_it_expires(self):
+        token_endpoint = {
+            "type": "entra",
+            "request_url": "https://login.microsoftonline.com/my_tenant/oauth2/v2.0/token",
+            "request_data": "grant_type=refresh_token&refresh_token=reused_token",
+        }
+        self.config.credentials = self.config.credentials.replace(
+            method="oauth_token_identity_center", token_endpoint=token_endpoint
+        )
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = {"access_token": "my_token", "expires_in": 3600}
+
+        with (
+            mock.patch("requests.post", return_value=response) as post,
+            mock.patch("dbt.adapters.redshift.auth_providers.time.monotonic") as monotonic,
+        ):
+            monotonic.return_value = 0
+            get_connection_method(self.config.credentials)
+            monotonic.return_value = 3000
+            get_connection_method(self.config.credentials)
+            assert post.call_count == 1
+
+            # within TOKEN_EXPIRY_MARGIN_SECONDS of expiring
+            monotonic.return_value = 3550
+            get_connection_method(self.config.credentials)
+            assert post.call_count == 2
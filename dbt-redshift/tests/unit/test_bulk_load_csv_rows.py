@@ -0,0 +1,83 @@
+import gzip
+
+import agate
+import pytest
+
+from dbt.adapters.redshift.impl import RedshiftAdapter
+from dbt.adapters.redshift.relation import RedshiftRelation
+
+
+@pytest.fixture
+def adapter(mocker):
+    mock_config = mocker.MagicMock()
+    mock_config.credentials.seed_s3_staging_path = "s3://bucket/seeds/"
+    mock_config.credentials.seed_copy_iam_role = None
+    mock_config.flags = {}
+    mock_mp_context = mocker.MagicMock()
+    adapter = RedshiftAdapter(mock_config, mock_mp_context)
+    mocker.patch.object(adapter, "execute")
+    return adapter
+
+
+@pytest.fixture
+def s3(mocker, adapter):
+    session = mocker.patch.object(adapter, "_seed_staging_session")
+    s3 = session.return_value.client.return_value
+    s3.uploaded = []
+    s3.upload_fileobj.side_effect = lambda file, bucket, key: s3.uploaded.append(
+        (bucket, key, gzip.decompress(file.read()).decode())
+    )
+    return s3
+
+
+@pytest.fixture
+def relation():
+    return RedshiftRelation.create(database="dev", schema="public", identifier="seed")
+
+
+@pytest.fixture
+def table():
+    return agate.Table([(2, "a"), (None, 'b "c"')], ["id", "name"])
+
+
+class TestBulkLoadCsvRows:
+    def test_not_configured(self, adapter, relation, table):
+        adapter.config.credentials.seed_s3_staging_path = None
+        assert adapter.bulk_load_csv_rows(relation, table, '"id", "name"') is None
+        adapter.execute.assert_not_called()
+
+    def test_copies_from_staging_path(self, adapter, s3, relation, table):
+        sql = adapter.bulk_load_csv_rows(relation, table, '"id", "name"')
+
+        [(bucket, key, csv)] = s3.uploaded
+        assert bucket == "bucket"
+        assert key.startswith("seeds/") and key.endswith(".csv.gz")
+        assert csv == '"2","a"\n,"b ""c"""\n'
+        assert sql == (
+            f'copy "dev"."public"."seed" ("id", "name") from \'s3://bucket/{key}\' '
+            "iam_role default format as csv gzip "
+            "dateformat 'auto' timeformat 'auto'"
+        )
+        adapter.execute.assert_called_once_with(sql)
+        s3.delete_object.assert_called_once_with(Bucket="bucket", Key=key)
+
+    def test_empty_string_is_not_null(self, adapter, s3, relation):
+        table = agate.Table(
+            [(1, ""), (2, None)], ["id", "name"], [agate.Number(), agate.Text(cast_nulls=False)]
+        )
+        sql = adapter.bulk_load_csv_rows(relation, table, '"id", "name"')
+
+        [(_, _, csv)] = s3.uploaded
+        assert csv == '"1",""\n"2",\n'
+        assert "emptyasnull" not in sql
+
+    def test_copy_iam_role(self, adapter, s3, relation, table):
+        adapter.config.credentials.seed_copy_iam_role = "arn:aws:iam::123:role/copy"
+        sql = adapter.bulk_load_csv_rows(relation, table, '"id", "name"')
+        assert "iam_role 'arn:aws:iam::123:role/copy' " in sql
+
+    def test_staged_file_removed_when_copy_fails(self, adapter, s3, relation, table):
+        adapter.execute.side_effect = RuntimeError("copy failed")
+        with pytest.raises(RuntimeError):
+            adapter.bulk_load_csv_rows(relation, table, '"id", "name"')
+        s3.delete_object.assert_called_once()
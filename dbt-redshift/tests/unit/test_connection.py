@@ -701,3 +701,91 @@ class TestExecuteRetryTransientErrors(TestCase):
             "could not complete because of conflict with concurrent transaction",
             always_fail=True,
         )
+
+
+class TestConnectionPool(TestCase):
+    def setUp(self):
+        profile_cfg = {
+            "outputs": {
+                "test": {
+                    "type": "redshift",
+                    "dbname": "redshift",
+                    "user": "root",
+                    "host": "thishostshouldnotexist.test.us-east-1",
+                    "pass": "password",
+                    "port": 5439,
+                    "schema": "public",
+                    "pool_size": 2,
+                    "pool_liveness_check_after": 60,
+                }
+            },
+            "target": "test",
+        }
+        project_cfg = {
+            "name": "X",
+            "version": "0.1",
+            "profile": "test",
+            "project-root": "/tmp/dbt/does-not-exist",
+            "quoting": {"identifier": False, "schema": True},
+            "config-version": 2,
+        }
+        self.config = config_from_parts_or_dicts(project_cfg, profile_cfg)
+        self.adapter = RedshiftAdapter(self.config, get_context("spawn"))
+
+        self.handle = MagicMock()
+        self.handle.in_transaction = False
+        self.cursor = MagicMock()
+        self.cursor.execute.return_value.fetchone.return_value = (42,)
+        self.handle.cursor.return_value.__enter__.return_value = self.cursor
+        self.connect = MagicMock(return_value=self.handle)
+        self.patcher = mock.patch("redshift_connector.connect", self.connect)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.adapter.cleanup_connections()
+        self.patcher.stop()
+
+    def test_released_handle_is_reused(self):
+        for name in ("first", "second"):
+            with self.adapter.connection_named(name):
+                connection = self.adapter.connections.get_thread_connection()
+                connection.handle
+                assert connection.backend_pid == 42
+
+        self.connect.assert_called_once()
+        self.handle.close.assert_not_called()
+
+        self.adapter.cleanup_connections()
+        self.handle.close.assert_called_once()
+
+    def test_liveness_is_checked_after_idle_threshold(self):
+        with mock.patch("dbt.adapters.base.pool.time.monotonic") as monotonic:
+            monotonic.return_value = 0
+            with self.adapter.connection_named("first"):
+                self.adapter.connections.get_thread_connection().handle
+            self.cursor.execute.reset_mock()
+
+            # idle for longer than pool_liveness_check_after, not pool_idle_timeout
+            monotonic.return_value = 120
+            with self.adapter.connection_named("second"):
+                self.adapter.connections.get_thread_connection().handle
+
+        self.cursor.execute.assert_called_once_with("select 1")
+        self.connect.assert_called_once()
+
+    def test_dead_handle_is_replaced(self):
+        with mock.patch("dbt.adapters.base.pool.time.monotonic") as monotonic:
+            monotonic.return_value = 0
+            with self.adapter.connection_named("first"):
+                self.adapter.connections.get_thread_connection().handle
+
+            monotonic.return_value = 120
+            self.cursor.execute.side_effect = [
+                redshift_connector.InterfaceError("connection is closed"),
+                MagicMock(),
+            ]
+            with self.adapter.connection_named("second"):
+                self.adapter.connections.get_thread_connection().handle
+
+        assert self.connect.call_count == 2
+        self.handle.close.assert_called_once()
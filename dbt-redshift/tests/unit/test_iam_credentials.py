@@ -0,0 +1,107 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import pytest
+
+from dbt.adapters.redshift import RedshiftCredentials
+from dbt.adapters.redshift.connections import get_connection_method, _temporary_credentials
+from dbt.adapters.redshift.iam_credentials import TemporaryCredentials, TemporaryCredentialsCache
+
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _credentials(password: str, expires_in: timedelta = timedelta(minutes=15)):
+    return TemporaryCredentials("IAM:dbt", password, NOW + expires_in)
+
+
+@pytest.fixture
+def now():
+    with mock.patch("dbt.adapters.redshift.iam_credentials._now", return_value=NOW) as now:
+        yield now
+
+
+class TestTemporaryCredentialsCache:
+    def test_fetches_once_per_key(self, now):
+        cache = TemporaryCredentialsCache()
+        fetch = mock.MagicMock(return_value=_credentials("first"))
+
+        assert cache.get("key", fetch, 0.75).password == "first"
+        assert cache.get("key", fetch, 0.75).password == "first"
+        fetch.assert_called_once()
+
+        cache.get("other", fetch, 0.75)
+        assert fetch.call_count == 2
+
+    def test_refreshes_in_the_background(self, now):
+        cache = TemporaryCredentialsCache()
+        fetch = mock.MagicMock(return_value=_credentials("first"))
+        cache.get("key", fetch, 0.75)
+
+        fetch.return_value = _credentials("second", timedelta(minutes=30))
+        # past 75% of their lifetime, the current credentials are still returned
+        now.return_value = NOW + timedelta(minutes=12)
+        assert cache.get("key", fetch, 0.75).password == "first"
+        for thread in threading.enumerate():
+            if thread.name == "dbt-redshift-credentials-refresh":
+                thread.join(5)
+
+        assert cache.get("key", fetch, 0.75).password == "second"
+        assert fetch.call_count == 2
+
+    def test_fetches_expired_credentials_before_returning(self, now):
+        cache = TemporaryCredentialsCache()
+        cache.get("key", mock.MagicMock(return_value=_credentials("first")), 0.75)
+
+        now.return_value = NOW + timedelta(minutes=15)
+        fetch = mock.MagicMock(return_value=_credentials("second", timedelta(minutes=30)))
+        assert cache.get("key", fetch, 0.75).password == "second"
+        fetch.assert_called_once()
+
+
+class TestCacheIamCredentials:
+    def teardown_method(self):
+        _temporary_credentials.clear()
+
+    @mock.patch("redshift_connector.connect")
+    @mock.patch("boto3.Session")
+    def test_connections_share_temporary_credentials(self, session, connect):
+        client = session.return_value.client.return_value
+        client.get_cluster_credentials.return_value = {
+            "DbUser": "IAM:dbt",
+            "DbPassword": "secret",
+            "Expiration": datetime.now(timezone.utc) + timedelta(minutes=15),
+        }
+        credentials = RedshiftCredentials(
+            host="my-cluster.abc123.us-east-1.redshift.amazonaws.com",
+            port=5439,
+            database="dev",
+            schema="public",
+            method="iam",
+            user="dbt",
+            cluster_id="my-cluster",
+            iam_profile="default",
+            cache_iam_credentials=True,
+        )
+
+        get_connection_method(credentials)()
+        get_connection_method(credentials)()
+
+        session.assert_called_once_with(
+            aws_access_key_id=None,
+            aws_secret_access_key=None,
+            profile_name="default",
+            region_name="us-east-1",
+        )
+        client.get_cluster_credentials.assert_called_once_with(
+            DbUser="dbt",
+            DbName="dev",
+            ClusterIdentifier="my-cluster",
+            DbGroups=[],
+            AutoCreate=False,
+        )
+        assert connect.call_count == 2
+        kwargs = connect.call_args.kwargs
+        assert (kwargs["user"], kwargs["password"]) == ("IAM:dbt", "secret")
+        assert "iam" not in kwargs
@@ -99,8 +99,7 @@ class TestQuery(TestCase):
         with mock.patch.object(
             self.adapter.connections, "get_thread_connection", return_value=mock_connection
         ):
-            with mock.patch.object(self.adapter.connections, "_initialize_sqlparse_lexer"):
-                with self.assertRaisesRegex(
-                    DbtRuntimeError, "Tried to run invalid SQL:  on test_connection"
-                ):
-                    self.adapter.connections.add_query(sql="")
+            with self.assertRaisesRegex(
+                DbtRuntimeError, "Tried to run invalid SQL:  on test_connection"
+            ):
+                self.adapter.connections.add_query(sql="")
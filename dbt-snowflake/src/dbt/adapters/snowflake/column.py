@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+import json
 import re
 from typing import Optional
 
@@ -13,6 +14,21 @@ ICEBERG_VARCHAR_PATTERN = re.compile(
     r"\bVARCHAR\(" + str(ICEBERG_MAX_VARCHAR_LENGTH) + r"\)", re.IGNORECASE
 )
 
+# The keys of the data_type reported by SHOW COLUMNS, for the types that can
+# be turned into what DESCRIBE TABLE reports. Other keys, like a collation or
+# the fields of a structured type, are only described by DESCRIBE TABLE.
+_SHOW_COLUMNS_KEYS = {"type", "nullable", "precision", "scale", "length", "byteLength", "fixed"}
+_SHOW_COLUMNS_BARE_TYPES = {
+    "BOOLEAN",
+    "DATE",
+    "VARIANT",
+    "OBJECT",
+    "ARRAY",
+    "GEOGRAPHY",
+    "GEOMETRY",
+}
+_SHOW_COLUMNS_SCALED_TYPES = {"TIME", "TIMESTAMP_LTZ", "TIMESTAMP_NTZ", "TIMESTAMP_TZ"}
+
 
 @dataclass
 class SnowflakeColumn(Column):
@@ -102,6 +118,44 @@ class SnowflakeColumn(Column):
             collation=collation,
         )
 
+    @classmethod
+    def from_show_columns(cls, name: str, data_type: str) -> Optional["SnowflakeColumn"]:
+        """
+        Parse column information from the data_type JSON that SHOW COLUMNS
+        reports, into the same column that DESCRIBE TABLE would give.
+        Returns None for the types that can't be, which have to be described.
+
+        Examples:
+            {"type":"FIXED","precision":38,"scale":0,"nullable":true}
+            {"type":"TEXT","length":100,"byteLength":400,"nullable":true,"fixed":false}
+        """
+        try:
+            parsed = json.loads(data_type)
+        except ValueError:
+            return None
+        if not isinstance(parsed, dict) or not set(parsed) <= _SHOW_COLUMNS_KEYS:
+            return None
+
+        type_name = parsed.get("type")
+        try:
+            if type_name == "FIXED":
+                raw_data_type = f"NUMBER({parsed['precision']},{parsed['scale']})"
+            elif type_name == "TEXT":
+                raw_data_type = f"VARCHAR({parsed['length']})"
+            elif type_name == "BINARY":
+                raw_data_type = f"BINARY({parsed['length']})"
+            elif type_name == "REAL":
+                raw_data_type = "FLOAT"
+            elif type_name in _SHOW_COLUMNS_SCALED_TYPES:
+                raw_data_type = f"{type_name}({parsed['scale']})"
+            elif type_name in _SHOW_COLUMNS_BARE_TYPES:
+                raw_data_type = type_name
+            else:
+                return None
+        except KeyError:
+            return None
+        return cls.from_description(name, raw_data_type)
+
     @staticmethod
     def _normalize_iceberg_varchar(raw_data_type: str) -> str:
         """Normalize Iceberg VARCHAR(134217728) to Snowflake VARCHAR(16777216) in composite types
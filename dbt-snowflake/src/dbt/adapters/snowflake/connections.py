@@ -2,10 +2,9 @@ import base64
 import datetime
 import os
 import sys
+from functools import lru_cache
 
 if sys.version_info < (3, 9):
-    from functools import lru_cache
-
     cache = lru_cache(maxsize=None)
 else:
     from functools import cache
@@ -14,8 +13,7 @@ import pytz
 import re
 from contextlib import contextmanager
 from dataclasses import dataclass
-from io import StringIO
-from time import sleep
+from time import perf_counter, sleep
 
 from typing import Optional, Tuple, Union, Any, List, Iterable, TYPE_CHECKING, Dict
 
@@ -36,6 +34,7 @@ from snowflake.connector.errors import (
     BadGatewayError,
     OtherHTTPRetryableError,
     BindUploadError,
+    NotSupportedError,
 )
 
 from snowflake.connector.network import WORKLOAD_IDENTITY_AUTHENTICATOR
@@ -51,9 +50,18 @@ from dbt.adapters.exceptions.connection import FailedToConnectError
 from dbt.adapters.contracts.connection import AdapterResponse, Connection, Credentials
 from dbt.adapters.snowflake.adapter_response import SnowflakeAdapterResponse
 from dbt.adapters.sql import SQLConnectionManager
+from dbt.adapters.sql.statements import SPLIT_CACHE_SIZE, split_statements
 from dbt.adapters.events.logging import AdapterLogger
-from dbt_common.events.functions import warn_or_error
-from dbt.adapters.events.types import AdapterEventWarning, AdapterEventError
+from dbt_common.events.contextvars import get_node_info
+from dbt_common.events.functions import fire_event, warn_or_error
+from dbt_common.utils import cast_to_str
+from dbt.adapters.events.types import (
+    AdapterEventWarning,
+    AdapterEventError,
+    ConnectionUsed,
+    SQLQuery,
+    SQLQueryStatus,
+)
 from dbt_common.ui import line_wrap_message, warning_tag
 from dbt.adapters.snowflake.record import SnowflakeRecordReplayHandle
 
@@ -62,6 +70,7 @@ from dbt.adapters.snowflake.query_headers import SnowflakeMacroQueryStringSetter
 
 if TYPE_CHECKING:
     import agate
+    import pyarrow
 
 
 logger = AdapterLogger("Snowflake")
@@ -137,6 +146,9 @@ class SnowflakeCredentials(Credentials):
     platform_detection_timeout_seconds: Optional[float] = (
         None if workload_identity_provider else 0.0
     )
+    # send the statements of a multi-statement query as one request, instead
+    # of one request per statement
+    batch_statements: bool = False
 
     def __post_init__(self):
         if self.authenticator != "oauth" and (self.oauth_client_secret or self.oauth_client_id):
@@ -219,6 +231,7 @@ class SnowflakeCredentials(Credentials):
             "workload_identity_provider",
             "workload_identity_entra_resource",
             "platform_detection_timeout_seconds",
+            "batch_statements",
         )
 
     def auth_args(self):
@@ -384,6 +397,41 @@ class SnowflakeCredentials(Credentials):
         return snowflake_private_key(private_key)
 
 
+_TRANSACTION_KEYWORDS = {"begin;": "begin", "commit;": "commit"}
+# PUT and GET can't be part of a multi-statement request. They may follow
+# comments, which are sent to Snowflake with the statement.
+_FILE_TRANSFER_REGEX = re.compile(
+    r"(?:\s+|--[^\n]*|//[^\n]*|/\*.*?\*/)*(?:put|get)\s", re.IGNORECASE | re.DOTALL
+)
+
+
+@dataclass(frozen=True)
+class _QueryPlan:
+    """The statements of a string of SQL, split and classified in one pass."""
+
+    queries: Tuple[str, ...]
+    # for each query: "begin", "commit", or None for any other statement
+    keywords: Tuple[Optional[str], ...]
+
+    @property
+    def transaction_only(self) -> bool:
+        # also true when there are no queries at all, which add_query reports
+        return all(self.keywords)
+
+
+@lru_cache(maxsize=SPLIT_CACHE_SIZE)
+def _plan_queries(sql: str) -> _QueryPlan:
+    # hooks and materializations send the same SQL for many models, so this
+    # is only parsed the first time
+    queries = tuple(split_statements(sql, slash_comments=True))
+    keywords = tuple(
+        # only lowercase statements short enough to be a keyword
+        _TRANSACTION_KEYWORDS.get(query.lower()) if len(query) <= 7 else None
+        for query in queries
+    )
+    return _QueryPlan(queries, keywords)
+
+
 class SnowflakeConnectionManager(SQLConnectionManager):
     TYPE = "snowflake"
 
@@ -580,10 +628,7 @@ class SnowflakeConnectionManager(SQLConnectionManager):
     def _split_queries(cls, sql):
         "Splits sql statements at semicolons into discrete queries"
 
-        sql_s = str(sql)
-        sql_buf = StringIO(sql_s)
-        split_query = snowflake.connector.util_text.split_statements(sql_buf)
-        return [part[0] for part in split_query]
+        return list(_plan_queries(str(sql)).queries)
 
     @staticmethod
     def _fix_rows(rows: Iterable[Iterable]) -> Iterable[Iterable]:
@@ -608,6 +653,36 @@ class SnowflakeConnectionManager(SQLConnectionManager):
         # to replace them with sane timezones.
         return super().process_results(column_names, cls._fix_rows(rows))
 
+    @classmethod
+    def fix_arrow_rows(cls, rows):
+        # the timestamps of an Arrow result need the same fix
+        return cls._fix_rows(rows)
+
+    @classmethod
+    def get_arrow_result_from_cursor(
+        cls, cursor: Any, limit: Optional[int]
+    ) -> Optional["pyarrow.Table"]:
+        import pyarrow
+
+        try:
+            if not limit:
+                return cursor.fetch_arrow_all(force_return_table=True)
+
+            batches = []
+            remaining = limit
+            for batch in cursor.fetch_arrow_batches():
+                batches.append(batch.slice(0, remaining))
+                remaining -= batches[-1].num_rows
+                if remaining <= 0:
+                    break
+        except NotSupportedError:
+            # results that aren't in arrow format, e.g. from SHOW commands
+            return None
+
+        if not batches:
+            return None
+        return pyarrow.concat_tables(batches)
+
     def execute(
         self, sql: str, auto_begin: bool = False, fetch: bool = False, limit: Optional[int] = None
     ) -> Tuple[AdapterResponse, "agate.Table"]:
@@ -618,7 +693,7 @@ class SnowflakeConnectionManager(SQLConnectionManager):
         _, cursor = self.add_query(sql, auto_begin)
         response = self.get_response(cursor)
         if fetch:
-            table = self.get_result_from_cursor(cursor, limit)
+            table = self._get_fetched_result(cursor, limit)
         else:
             table = empty_table()
         return response, table
@@ -642,18 +717,21 @@ class SnowflakeConnectionManager(SQLConnectionManager):
             # which allows any iterable thing to be passed as a binding.
             bindings = tuple(bindings)
 
-        stripped_queries = self._stripped_queries(sql)
+        # queries that are only comments, e.g. after the last ';', are left out. this
+        # avoids using exceptions as flow control, and also allows us to return the
+        # status of the last cursor
+        plan = _plan_queries(str(sql))
 
-        if set(query.lower() for query in stripped_queries).issubset({"begin;", "commit;"}):
+        if plan.transaction_only:
             connection, cursor = self._add_begin_commit_only_queries(
-                stripped_queries,
+                list(plan.queries),
                 auto_begin=auto_begin,
                 bindings=bindings,
                 abridge_sql_log=abridge_sql_log,
             )
         else:
             connection, cursor = self._add_standard_queries(
-                stripped_queries,
+                plan,
                 auto_begin=auto_begin,
                 bindings=bindings,
                 abridge_sql_log=abridge_sql_log,
@@ -667,20 +745,6 @@ class SnowflakeConnectionManager(SQLConnectionManager):
     def set_query_header(self, query_header_context: Dict[str, Any]) -> None:
         self.query_header = SnowflakeMacroQueryStringSetter(self.profile, query_header_context)
 
-    def _stripped_queries(self, sql: str) -> List[str]:
-        def strip_query(query):
-            """
-            hack -- after the last ';', remove comments and don't run
-            empty queries. this avoids using exceptions as flow control,
-            and also allows us to return the status of the last cursor
-            """
-            without_comments_re = re.compile(
-                r"(\".*?\"|\'.*?\')|(/\*.*?\*/|--[^\r\n]*$)", re.MULTILINE
-            )
-            return re.sub(without_comments_re, "", query).strip()
-
-        return [query for query in self._split_queries(sql) if strip_query(query) != ""]
-
     def _add_begin_commit_only_queries(
         self, queries: List[str], **kwargs
     ) -> Tuple[Connection, Any]:
@@ -698,20 +762,88 @@ class SnowflakeConnectionManager(SQLConnectionManager):
             connection, cursor = self.add_standard_query(query, **kwargs)
         return connection, cursor
 
-    def _add_standard_queries(self, queries: List[str], **kwargs) -> Tuple[Connection, Any]:
-        for query in queries:
+    def _add_standard_queries(self, plan: "_QueryPlan", **kwargs) -> Tuple[Connection, Any]:
+        batch_statements = self.profile.credentials.batch_statements and not kwargs.get("bindings")
+        batch: List[str] = []
+        for query, keyword in zip(plan.queries, plan.keywords):
+            if batch_statements and keyword is None and not _FILE_TRANSFER_REGEX.match(query):
+                batch.append(query)
+                continue
+            if batch:
+                connection, cursor = self._add_query_batch(batch, **kwargs)
+                batch = []
+
             # Even though we turn off transactions by default for Snowflake,
             # the user/macro has passed them *explicitly*, probably to wrap a DML statement
             # This also has the effect of ignoring "commit" in the RunResult for this model
             # https://github.com/dbt-labs/dbt-snowflake/issues/147
-            if query.lower() == "begin;":
+            if keyword == "begin":
                 super().add_begin_query()
-            elif query.lower() == "commit;":
+            elif keyword == "commit":
                 super().add_commit_query()
             else:
                 # This adds a query comment to *every* statement
                 # https://github.com/dbt-labs/dbt-snowflake/issues/140
                 connection, cursor = self.add_standard_query(query, **kwargs)
+        if batch:
+            connection, cursor = self._add_query_batch(batch, **kwargs)
+        return connection, cursor
+
+    def _add_query_batch(
+        self, queries: List[str], abridge_sql_log: bool = False, **kwargs
+    ) -> Tuple[Connection, Any]:
+        """Run consecutive statements as a single multi-statement request,
+        instead of one round trip per statement.
+
+        Like add_query, this returns the cursor of the last statement. The
+        status and query id of every statement is still logged.
+        """
+        connection = self.get_thread_connection()
+        if len(queries) == 1 or isinstance(connection.handle, SnowflakeRecordReplayHandle):
+            # the record/replay cursor only records single statements
+            for query in queries:
+                connection, cursor = self.add_standard_query(
+                    query, abridge_sql_log=abridge_sql_log, **kwargs
+                )
+            return connection, cursor
+
+        fire_event(
+            ConnectionUsed(
+                conn_type=self.TYPE,
+                conn_name=cast_to_str(connection.name),
+                node_info=get_node_info(),
+            )
+        )
+        # This adds a query comment to *every* statement
+        # https://github.com/dbt-labs/dbt-snowflake/issues/140
+        sql = "\n".join(self._add_query_comment(query) for query in queries)
+
+        with self.exception_handler(sql):
+            fire_event(
+                SQLQuery(
+                    conn_name=cast_to_str(connection.name),
+                    sql="{}...".format(sql[:512]) if abridge_sql_log else sql,
+                    node_info=get_node_info(),
+                )
+            )
+            pre = perf_counter()
+            cursor = connection.handle.cursor()
+            # the cursor starts out with the results of the first statement,
+            # and nextset() moves it on to the next one
+            cursor.execute(sql, num_statements=len(queries))
+            for index in range(len(queries)):
+                if index > 0:
+                    cursor.nextset()
+                result = self.get_response(cursor)
+                fire_event(
+                    SQLQueryStatus(
+                        status=str(result),
+                        elapsed=perf_counter() - pre,
+                        node_info=get_node_info(),
+                        query_id=result.query_id,
+                    )
+                )
+
         return connection, cursor
 
     def _raise_cursor_not_found_error(self, sql: str):
@@ -1,8 +1,12 @@
 from copy import deepcopy
 from dataclasses import dataclass
+import os
+import tempfile
+from uuid import uuid4
 from typing import (
     TYPE_CHECKING,
     ClassVar,
+    Iterable,
     Mapping,
     Any,
     Optional,
@@ -15,6 +19,8 @@ from typing import (
 
 from dbt.adapters.base.impl import AdapterConfig, ConstraintSupport
 from dbt.adapters.base.meta import available
+from dbt.adapters.base.relation import BaseRelation
+from dbt.adapters.bulk_load import write_csv_rows
 from dbt.adapters.capability import CapabilityDict, CapabilitySupport, Support, Capability
 from dbt.adapters.catalogs import (
     CatalogIntegration,
@@ -62,6 +68,8 @@ from dbt.adapters.snowflake import SnowflakeRelation
 import agate
 
 SHOW_OBJECT_METADATA_MACRO_NAME = "snowflake__show_object_metadata"
+# the most rows SHOW COLUMNS returns, a schema with more columns isn't prefetched
+SHOW_COLUMNS_MAX_RESULTS = 10000
 
 SNOWFLAKE_DEFAULT_TRANSIENT_DYNAMIC_TABLES = BehaviorFlag(
     name="snowflake_default_transient_dynamic_tables",
@@ -292,6 +300,25 @@ class SnowflakeAdapter(SQLAdapter):
             else:
                 raise
 
+    def parse_columns_in_schema(self, table: "agate.Table") -> Dict[str, List[SnowflakeColumn]]:
+        """Parse the result of SHOW COLUMNS IN SCHEMA. A table is left out if
+        any of its columns has a type that only DESCRIBE TABLE reports fully,
+        so its columns are described when they are needed.
+        """
+        if len(table) >= SHOW_COLUMNS_MAX_RESULTS:
+            return {}
+        table = table.rename(column_names=[col.lower() for col in table.column_names])
+
+        columns: Dict[str, List[SnowflakeColumn]] = {}
+        skipped = set()
+        for row in table:
+            column = self.Column.from_show_columns(row["column_name"], row["data_type"])
+            if column is None:
+                skipped.add(row["table_name"])
+            else:
+                columns.setdefault(row["table_name"], []).append(column)
+        return {name: cols for name, cols in columns.items() if name not in skipped}
+
     def _show_object_metadata(self, relation: SnowflakeRelation) -> Optional[dict]:
         try:
             kwargs = {"relation": relation}
@@ -443,6 +470,46 @@ class SnowflakeAdapter(SQLAdapter):
         ]
         return tabular_relations + function_relations
 
+    def _get_relations_cache_signals(
+        self, schemas: Iterable[SnowflakeRelation]
+    ) -> Dict[Tuple[Optional[str], Optional[str]], str]:
+        # one aggregate query per database instead of two `show` commands per schema;
+        # last_altered moves on any DDL or DML, and the count catches drops
+        schemas_by_database: Dict[Optional[str], Dict[str, SnowflakeRelation]] = {}
+        for schema_relation in schemas:
+            if schema_relation.schema:
+                schemas_by_database.setdefault(schema_relation.database, {})[
+                    schema_relation.schema.lower()
+                ] = schema_relation
+
+        signals: Dict[Tuple[Optional[str], Optional[str]], str] = {}
+        for database, schema_relations in schemas_by_database.items():
+            schema_list = ", ".join(
+                "'{}'".format(schema.replace("'", "''")) for schema in schema_relations
+            )
+            information_schema = next(iter(schema_relations.values())).information_schema_only()
+            sql = f"""
+                select lower(schema_name) as schema_name,
+                       count(*) as object_count,
+                       max(last_altered) as last_altered
+                from (
+                    select table_schema as schema_name, last_altered
+                    from {information_schema}.tables
+                    where lower(table_schema) in ({schema_list})
+                    union all
+                    select function_schema as schema_name, last_altered
+                    from {information_schema}.functions
+                    where lower(function_schema) in ({schema_list})
+                )
+                group by 1
+            """
+            _, table = self.execute(sql, fetch=True)
+            found = {row[0]: f"{row[1]}:{row[2]}" for row in table}
+            for schema in schema_relations:
+                key = (database.lower() if database else database, schema)
+                signals[key] = found.get(schema, "empty")
+        return signals
+
     def _parse_list_relations_result(self, result: "agate.Row") -> SnowflakeRelation:
         database, schema, identifier, relation_type, is_dynamic, is_iceberg = result
 
@@ -500,6 +567,33 @@ class SnowflakeAdapter(SQLAdapter):
         else:
             return column
 
+    @available.parse_none
+    def bulk_load_csv_rows(
+        self, relation: BaseRelation, agate_table: "agate.Table", column_names_csv: str
+    ) -> Optional[str]:
+        # stage the rows in the user stage, which always exists, so no DDL
+        # (which would commit the seed's transaction) is needed
+        stage = f"@~/dbt_seeds/{uuid4().hex}"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "seed.csv")
+            with open(path, "w", encoding="utf-8", newline="") as file:
+                write_csv_rows(agate_table.rows, file)
+            file_url = "file://" + path.replace("\\", "/")
+            self.execute(f"put '{file_url}' {stage} auto_compress = true")
+
+        sql = (
+            f"copy into {relation.render()} ({column_names_csv}) from {stage} "
+            "file_format = (type = csv field_optionally_enclosed_by = '\"' "
+            "empty_field_as_null = true null_if = ()) purge = true"
+        )
+        try:
+            self.execute(sql)
+        except Exception:
+            # purge only removes the staged file once it is loaded
+            self.execute(f"remove {stage}")
+            raise
+        return sql
+
     @available
     def standardize_grants_dict(self, grants_table: "agate.Table") -> dict:
         grants_dict: Dict[str, Any] = {}
@@ -47,6 +47,14 @@
   {% do return(columns) %}
 {% endmacro %}
 
+{% macro snowflake__get_columns_in_schema(schema_relation) -%}
+  {#-- returns at most 10000 rows, adapter.parse_columns_in_schema ignores a result that may be cut short #}
+  {%- set sql -%}
+    show columns in schema {{ schema_relation.include(identifier=False) }}
+  {%- endset -%}
+  {{ return(run_query(sql)) }}
+{% endmacro %}
+
 {% macro snowflake__show_object_metadata(relation) %}
   {%- set sql -%}
     show objects in {{ relation.include(identifier=False) }} starts with '{{ relation.identifier }}' limit 1
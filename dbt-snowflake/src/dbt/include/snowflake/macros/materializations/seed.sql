@@ -55,24 +55,21 @@
 
     {% if not is_catalog_linked %}
         {% do adapter.add_query('BEGIN', auto_begin=False) %}
-    {% endif %}
-
-    {% for chunk in agate_table.rows | batch(batch_size) %}
-        {% set bindings = [] %}
 
-        {% for row in chunk %}
-            {% do bindings.extend(row) %}
-        {% endfor %}
+        {#-- COPY INTO only appends, so clear the table in the same transaction,
+             which INSERT OVERWRITE would otherwise do. --#}
+        {% if adapter.behavior.enable_bulk_seed_loading.no_warn %}
+            {% do adapter.add_query('delete from ' ~ this.render(), auto_begin=False) %}
+            {% set sql = adapter.bulk_load_csv_rows(this, agate_table, cols_sql) %}
+            {% do adapter.add_query('COMMIT', auto_begin=False) %}
+            {{ return(sql) }}
+        {% endif %}
+    {% endif %}
 
+    {% for values_sql, bindings in adapter.seed_insert_batches(agate_table, batch_size, '%s') %}
         {% set sql %}
             insert {% if loop.first %}overwrite {% endif %}into {{ this.render() }} ({{ cols_sql }}) values
-            {% for row in chunk -%}
-                ({%- for column in agate_table.column_names -%}
-                    %s
-                    {%- if not loop.last%},{%- endif %}
-                {%- endfor -%})
-                {%- if not loop.last%},{%- endif %}
-            {%- endfor %}
+            {{ values_sql }}
         {% endset %}
 
         {% do adapter.add_query(sql, bindings=bindings, abridge_sql_log=True) %}
@@ -0,0 +1,17 @@
+import pytest
+
+from dbt.tests.adapter.fetch_results.test_arrow_results import BaseArrowFetchResults
+
+
+class TestArrowFetchResultsSnowflake(BaseArrowFetchResults):
+    @pytest.fixture(scope="class")
+    def rows_sql(self):
+        return f"""
+        select
+            seq4() as id,
+            mod(seq4() * 7919, 1000) as amount,
+            'row_' || seq4() as name,
+            dateadd(second, seq4(), '2024-01-01'::timestamp_ntz) as created_at
+        from table(generator(rowcount => {self.ROW_COUNT}))
+        order by id
+        """
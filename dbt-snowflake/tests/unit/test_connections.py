@@ -390,3 +390,35 @@ def test_connnections_credentials_wif_authenticator_fails_with_entra_resource_an
         "workload_identity_entra_resource can only be set if workload_identity_provider is Azure"
         in str(excinfo)
     )
+
+
+def test_plan_queries_classifies_begin_and_commit():
+    plan = connections._plan_queries(
+        "BEGIN;\n/* comment only */;\ndelete from t where x = 'begin;';\ncommit;"
+    )
+
+    assert plan.queries == ("BEGIN;", "delete from t where x = 'begin;';", "commit;")
+    assert plan.keywords == ("begin", None, "commit")
+    assert not plan.transaction_only
+    assert connections._plan_queries("begin; commit;").transaction_only
+    assert connections._plan_queries("/* nothing to run */").transaction_only
+
+
+def test_arrow_result_timestamps_get_fixed_offsets():
+    import datetime
+
+    import pyarrow
+    import pytz
+    from dbt.adapters.arrow import ArrowResultTable
+
+    loaded_at = datetime.datetime(2024, 1, 1, 17, tzinfo=datetime.timezone.utc)
+    table = ArrowResultTable(
+        pyarrow.table(
+            {"loaded_at": pyarrow.array([loaded_at], pyarrow.timestamp("us", "America/New_York"))}
+        ),
+        fix_rows=connections.SnowflakeConnectionManager.fix_arrow_rows,
+    )
+
+    fixed = table.rows[0][0]
+    assert fixed.tzinfo == pytz.FixedOffset(-300)
+    assert fixed == loaded_at
@@ -15,6 +15,7 @@ from dbt.context.query_header import generate_query_header_context
 from dbt.context.providers import generate_runtime_macro_context
 from dbt.contracts.graph.manifest import ManifestStateCheck
 from dbt_common.clients import agate_helper
+from dbt_common.exceptions import DbtDatabaseError
 from snowflake import connector as snowflake_connector
 
 from .utils import (
@@ -160,6 +161,84 @@ class TestSnowflakeAdapter(unittest.TestCase):
             ]
         )
 
+    def test_batch_statements(self):
+        self.adapter.config.credentials.batch_statements = True
+        self.adapter.execute(
+            "create table t (x int);\ninsert into t values (1);\nbegin;\ndelete from t;\ncommit;"
+        )
+
+        self.mock_execute.assert_has_calls(
+            [
+                mock.call(
+                    "/* dbt */\ncreate table t (x int);\n/* dbt */\ninsert into t values (1);",
+                    num_statements=2,
+                ),
+                mock.call("/* dbt */\nBEGIN", None),
+                mock.call("/* dbt */\ndelete from t;", None),
+                mock.call("/* dbt */\nCOMMIT", None),
+            ]
+        )
+        self.cursor.nextset.assert_called_once_with()
+
+    def test_batch_statements_leave_out_file_transfers(self):
+        self.adapter.config.credentials.batch_statements = True
+        self.adapter.execute(
+            "create stage s;\n-- stage\nput file:///tmp/a.csv @s;\n"
+            "/* x */ get @s file:///tmp/;\nselect 1;"
+        )
+
+        self.mock_execute.assert_has_calls(
+            [
+                mock.call("/* dbt */\ncreate stage s;", None),
+                mock.call("/* dbt */\n-- stage\nput file:///tmp/a.csv @s;", None),
+                mock.call("/* dbt */\n/* x */ get @s file:///tmp/;", None),
+                mock.call("/* dbt */\nselect 1;", None),
+            ]
+        )
+
+    def test_bulk_load_csv_rows(self):
+        staged = []
+
+        def execute_effect(sql, *args, **kwargs):
+            if sql.startswith("/* dbt */\nput "):
+                path = re.search(r"'file://([^']+)'", sql).group(1)
+                with open(path) as f:
+                    staged.append(f.read())
+
+        self.mock_execute.side_effect = execute_effect
+        relation = self.adapter.Relation.create(
+            database="test_database", schema="test_schema", identifier="seed"
+        )
+        table = agate.Table([(2, "a"), (None, 'b "c"')], ["id", "name"])
+        sql = self.adapter.bulk_load_csv_rows(relation, table, '"ID", "NAME"')
+
+        self.assertEqual(staged, ['"2","a"\n,"b ""c"""\n'])
+        stage = re.search(r"from (@~/dbt_seeds/\w+) ", sql).group(1)
+        self.assertEqual(
+            sql,
+            f'copy into test_database.test_schema.seed ("ID", "NAME") from {stage} '
+            "file_format = (type = csv field_optionally_enclosed_by = '\"' "
+            "empty_field_as_null = true null_if = ()) purge = true",
+        )
+        self.assertIn(f" {stage} auto_compress = true", self.mock_execute.call_args_list[0][0][0])
+        self.mock_execute.assert_called_with(f"/* dbt */\n{sql}", None)
+
+    def test_bulk_load_csv_rows_removes_staged_file_when_copy_fails(self):
+        def execute_effect(sql, *args, **kwargs):
+            if sql.startswith("/* dbt */\ncopy into "):
+                raise snowflake_connector.errors.ProgrammingError("copy failed")
+
+        self.mock_execute.side_effect = execute_effect
+        relation = self.adapter.Relation.create(
+            database="test_database", schema="test_schema", identifier="seed"
+        )
+        table = agate.Table([(2, "a")], ["id", "name"])
+        with self.assertRaises(DbtDatabaseError):
+            self.adapter.bulk_load_csv_rows(relation, table, '"ID", "NAME"')
+
+        stage = re.search(r" (@~/dbt_seeds/\w+) ", self.mock_execute.call_args_list[0][0][0])
+        self.mock_execute.assert_called_with(f"/* dbt */\nremove {stage.group(1)}", None)
+
     def test_quoting_on_rename(self):
         from_relation = self.adapter.Relation.create(
             database="test_database",
@@ -836,6 +915,49 @@ class TestSnowflakeAdapter(unittest.TestCase):
         assert isinstance(normalized.columns["name"].data_type, agate.Text)
         assert isinstance(normalized.columns["kind"].data_type, agate.Text)
 
+    def test_relations_cache_signals_one_query_per_database(self):
+        schemas = [
+            self.adapter.Relation.create(database="test_database", schema=schema)
+            for schema in ("analytics", "staging", "empty")
+        ]
+        signals_table = agate.Table(
+            [("analytics", 3, "2024-01-01 00:00:00"), ("staging", 1, "2024-01-02 00:00:00")],
+            column_names=["schema_name", "object_count", "last_altered"],
+        )
+        with mock.patch.object(
+            self.adapter, "execute", return_value=(None, signals_table)
+        ) as execute:
+            signals = self.adapter._get_relations_cache_signals(schemas)
+
+        execute.assert_called_once()
+        assert "information_schema.tables" in execute.call_args[0][0].lower()
+        assert signals == {
+            ("test_database", "analytics"): "3:2024-01-01 00:00:00",
+            ("test_database", "staging"): "1:2024-01-02 00:00:00",
+            ("test_database", "empty"): "empty",
+        }
+
+    def test_parse_columns_in_schema(self):
+        show_columns = agate.Table(
+            [
+                ["ORDERS", "ID", '{"type":"FIXED","precision":38,"scale":0,"nullable":false}'],
+                ["ORDERS", "STATUS", '{"type":"TEXT","length":20,"byteLength":80,"fixed":false}'],
+                ["NOTES", "BODY", '{"type":"TEXT","length":100,"collation":"en-ci"}'],
+                ["NOTES", "ID", '{"type":"FIXED","precision":38,"scale":0}'],
+            ],
+            ["TABLE_NAME", "COLUMN_NAME", "DATA_TYPE"],
+            [agate.Text()] * 3,
+        )
+
+        columns = self.adapter.parse_columns_in_schema(show_columns)
+
+        # a collation is only reported by describe table, so NOTES is described
+        assert list(columns) == ["ORDERS"]
+        assert [c.data_type for c in columns["ORDERS"]] == [
+            "NUMBER(38,0)",
+            "character varying(20)",
+        ]
+
 
 class TestSnowflakeAdapterConversions(TestAdapterConversions):
     def test_convert_text_type(self):
@@ -1138,6 +1260,36 @@ class TestSnowflakeColumnIcebergVarcharNormalization(unittest.TestCase):
         assert iceberg_col.data_type == model_col.data_type
 
 
+class TestSnowflakeColumnFromShowColumns(unittest.TestCase):
+    def test_types_match_describe_table(self):
+        cases = [
+            ('{"type":"FIXED","precision":38,"scale":2,"nullable":true}', "NUMBER"),
+            ('{"type":"TEXT","length":16777216,"byteLength":16777216,"fixed":false}', "VARCHAR"),
+            ('{"type":"REAL","nullable":true}', "FLOAT"),
+            ('{"type":"TIMESTAMP_NTZ","precision":0,"scale":9,"nullable":true}', "TIMESTAMP_NTZ"),
+            ('{"type":"BINARY","length":8388608,"byteLength":8388608,"fixed":true}', "BINARY"),
+            ('{"type":"VARIANT","nullable":true}', "VARIANT"),
+        ]
+        for data_type, dtype in cases:
+            col = SnowflakeColumn.from_show_columns("my_col", data_type)
+            assert col is not None
+            assert col.column == "my_col"
+            assert col.dtype == dtype
+
+        col = SnowflakeColumn.from_show_columns("my_col", cases[0][0])
+        assert (col.numeric_precision, col.numeric_scale) == (38, 2)
+
+    def test_types_that_need_describe_table(self):
+        for data_type in [
+            '{"type":"TEXT","length":10,"collation":"en-ci"}',
+            '{"type":"ARRAY","elementType":{"type":"FIXED"},"nullable":true}',
+            '{"type":"VECTOR","nullable":true}',
+            '{"type":"FIXED","nullable":true}',
+            "not json",
+        ]:
+            assert SnowflakeColumn.from_show_columns("my_col", data_type) is None
+
+
 class SnowflakeConnectionsTest(unittest.TestCase):
     def test_comment_stripping_regex(self):
         pattern = r"(\".*?\"|\'.*?\')|(/\*.*?\*/|--[^\r\n]*$)"
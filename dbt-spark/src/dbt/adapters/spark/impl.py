@@ -1,11 +1,15 @@
 import os
 import re
+import threading
 from concurrent.futures import Future
+from contextlib import contextmanager
 from dataclasses import dataclass
+from multiprocessing.context import SpawnContext
 from typing import (
     Any,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Union,
@@ -134,6 +138,14 @@ class SparkAdapter(SQLAdapter):
     ConnectionManager: TypeAlias = SparkConnectionManager
     AdapterSpecificConfigs: TypeAlias = SparkConfig
 
+    def __init__(self, config, mp_context: SpawnContext) -> None:
+        super().__init__(config, mp_context)
+        # DESCRIBE TABLE EXTENDED results fetched while listing relations for
+        # the catalog, kept until it reads the columns out of them. None while
+        # no catalog is being built, so nothing is kept for the rest of the run.
+        self._describe_results: Optional[Dict[Tuple[str, str], "agate.Table"]] = None
+        self._describe_results_lock = threading.Lock()
+
     @classmethod
     def date_function(cls) -> str:
         return "current_timestamp()"
@@ -196,6 +208,10 @@ class SparkAdapter(SQLAdapter):
         except DbtRuntimeError as e:
             logger.debug(f"Error while retrieving information about {table_name}: {e.msg}")
             table_results = AttrDict()
+        else:
+            with self._describe_results_lock:
+                if self._describe_results is not None:
+                    self._describe_results[(_schema.lower(), name.lower())] = table_results
 
         information = ""
         for info_row in table_results:
@@ -205,15 +221,40 @@ class SparkAdapter(SQLAdapter):
 
         return _schema, name, information
 
+    def _get_relation_information_concurrently(
+        self,
+        row_list: "agate.Table",
+        relation_info_func: Callable[["agate.Row"], RelationInfo],
+    ) -> List[RelationInfo]:
+        """Call relation_info_func for every row on the adapter's thread pool,
+        for when it has to run a query per relation. Results keep the order of
+        row_list.
+        """
+        with executor(self.config) as tpe:
+            futures: List[Future[SparkAdapter.RelationInfo]] = [
+                tpe.submit_connected(self, "describe_relations", relation_info_func, row)
+                for row in row_list
+            ]
+            return [future.result() for future in futures]
+
     def _build_spark_relation_list(
         self,
         row_list: "agate.Table",
         relation_info_func: Callable[["agate.Row"], RelationInfo],
+        concurrent: bool = False,
     ) -> List[BaseRelation]:
-        """Aggregate relations with format metadata included."""
+        """Aggregate relations with format metadata included. If concurrent,
+        relation_info_func is called for each row in parallel.
+        """
+        if concurrent:
+            relation_infos = self._get_relation_information_concurrently(
+                row_list, relation_info_func
+            )
+        else:
+            relation_infos = [relation_info_func(row) for row in row_list]
+
         relations = []
-        for row in row_list:
-            _schema, name, information = relation_info_func(row)
+        for _schema, name, information in relation_infos:
 
             rel_type: RelationType = (
                 RelationType.View
@@ -266,6 +307,7 @@ class SparkAdapter(SQLAdapter):
                 return self._build_spark_relation_list(
                     row_list=show_table_rows,
                     relation_info_func=self._get_relation_information_using_describe,
+                    concurrent=True,
                 )
             else:
                 raise
@@ -315,7 +357,36 @@ class SparkAdapter(SQLAdapter):
             pos += 1
         return pos
 
+    def _pop_describe_result(self, relation: BaseRelation) -> Optional["agate.Table"]:
+        """Get the DESCRIBE TABLE EXTENDED result fetched for the relation while
+        listing it, if there was one, so it is not described a second time.
+        """
+        key = ((relation.schema or "").lower(), (relation.identifier or "").lower())
+        with self._describe_results_lock:
+            if self._describe_results is None:
+                return None
+            return self._describe_results.pop(key, None)
+
+    @contextmanager
+    def _recording_describe_results(self) -> Iterator[None]:
+        """Keep the DESCRIBE TABLE EXTENDED results fetched while listing
+        relations until the context exits, for the catalog to read the columns
+        out of.
+        """
+        with self._describe_results_lock:
+            self._describe_results = {}
+        try:
+            yield
+        finally:
+            with self._describe_results_lock:
+                self._describe_results = None
+
     def get_columns_in_relation(self, relation: BaseRelation) -> List[SparkColumn]:
+        return self._cached_columns_in_relation(  # type: ignore[return-value]
+            relation, lambda: self._get_columns_in_relation(relation)
+        )
+
+    def _get_columns_in_relation(self, relation: BaseRelation) -> List[SparkColumn]:
         columns = []
         try:
             rows: AttrDict = self.execute_macro(
@@ -371,12 +442,21 @@ class SparkAdapter(SQLAdapter):
             # The DESCRIBE EXTENDED fallback path (e.g. Iceberg v2 tables) embeds
             # column definitions in the information string as flat "col: type"
             # lines, which INFORMATION_COLUMNS_REGEX does not match.  Fall back
-            # to querying the table schema directly via DESCRIBE EXTENDED.
-            try:
-                columns = self.get_columns_in_relation(relation)
-            except DbtRuntimeError as e:
-                logger.debug(f"Error retrieving columns for catalog entry {relation}: {e.msg}")
-                columns = []
+            # to the DESCRIBE EXTENDED result fetched while listing the relation,
+            # or else query the table schema directly.
+            describe_result = self._pop_describe_result(relation)
+            if describe_result is not None:
+                columns = [
+                    x
+                    for x in self.parse_describe_extended(relation, describe_result)
+                    if x.name not in self.HUDI_METADATA_COLUMNS
+                ]
+            else:
+                try:
+                    columns = self.get_columns_in_relation(relation)
+                except DbtRuntimeError as e:
+                    logger.debug(f"Error retrieving columns for catalog entry {relation}: {e.msg}")
+                    columns = []
 
         for column in columns:
             # convert SparkColumns into catalog dicts
@@ -386,6 +466,10 @@ class SparkAdapter(SQLAdapter):
             as_dict["table_database"] = None
             yield as_dict
 
+    def _list_columns_for_catalog(self, relation: BaseRelation) -> List[Dict[str, Any]]:
+        logger.debug("Getting table schema for relation {}", str(relation))
+        return list(self._get_columns_for_catalog(relation))
+
     def get_catalog(
         self,
         relation_configs: Iterable[RelationConfig],
@@ -397,7 +481,7 @@ class SparkAdapter(SQLAdapter):
                 f"Expected only one database in get_catalog, found " f"{list(schema_map)}"
             )
 
-        with executor(self.config) as tpe:
+        with self._recording_describe_results(), executor(self.config) as tpe:
             futures: List[Future["agate.Table"]] = []
             for info, schemas in schema_map.items():
                 for schema in schemas:
@@ -428,10 +512,16 @@ class SparkAdapter(SQLAdapter):
         database = information_schema.database
         schema = list(schemas)[0]
 
-        columns: List[Dict[str, Any]] = []
-        for relation in self.list_relations(database, schema):
-            logger.debug("Getting table schema for relation {}", str(relation))
-            columns.extend(self._get_columns_for_catalog(relation))
+        # the relations are usually served from the relations cache, so the
+        # ones whose columns aren't in their information have to be described
+        # here. Describe them in parallel rather than one after the other.
+        relations = self.list_relations(database, schema)
+        with executor(self.config) as tpe:
+            futures: List[Future[List[Dict[str, Any]]]] = [
+                tpe.submit_connected(self, str(relation), self._list_columns_for_catalog, relation)
+                for relation in relations
+            ]
+            columns = [column for future in futures for column in future.result()]
 
         import agate
 
@@ -19,24 +19,17 @@
 
   {% set statements = [] %}
 
-  {% for chunk in agate_table.rows | batch(batch_size) %}
-      {% set bindings = [] %}
-
-      {% for row in chunk %}
-          {% do bindings.extend(row) %}
-      {% endfor %}
+  {% set placeholders = [] %}
+  {% for col_name in agate_table.column_names %}
+      {%- set inferred_type = adapter.convert_type(agate_table, loop.index0) -%}
+      {%- set type = column_override.get(col_name, inferred_type) -%}
+      {% do placeholders.append('cast(' ~ get_binding_char() ~ ' as ' ~ type ~ ')') %}
+  {% endfor %}
 
+  {% for values_sql, bindings in adapter.seed_insert_batches(agate_table, batch_size, placeholders) %}
       {% set sql %}
           insert into {{ this.render() }} values
-          {% for row in chunk -%}
-              ({%- for col_name in agate_table.column_names -%}
-                  {%- set inferred_type = adapter.convert_type(agate_table, loop.index0) -%}
-                  {%- set type = column_override.get(col_name, inferred_type) -%}
-                    cast({{ get_binding_char() }} as {{type}})
-                  {%- if not loop.last%},{%- endif %}
-              {%- endfor -%})
-              {%- if not loop.last%},{%- endif %}
-          {%- endfor %}
+          {{ values_sql }}
       {% endset %}
 
       {% do adapter.add_query(sql, bindings=bindings, abridge_sql_log=True) %}
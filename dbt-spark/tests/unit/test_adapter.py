@@ -1,8 +1,10 @@
+import threading
 import unittest
 import pytest
 from multiprocessing import get_context
 from unittest import mock
 
+from dbt_common.context import set_invocation_context
 from dbt_common.exceptions import DbtRuntimeError
 from agate import Row
 from pyhive import hive
@@ -948,6 +950,103 @@ class TestGetColumnsForCatalogIcebergFallback(unittest.TestCase):
         self.assertEqual(result[0]["column_name"], "id")
         self.assertEqual(result[1]["column_name"], "name")
 
+    def test_reuses_describe_result_from_listing(self):
+        """When the relation was listed through SHOW TABLES + DESCRIBE, its columns
+        are read from that DESCRIBE result instead of describing it again."""
+        adapter = self._make_adapter()
+
+        keys = ["col_name", "data_type", "comment"]
+        describe_rows = [
+            Row(["id", "int", None], keys),
+            Row(["name", "string", None], keys),
+            Row(["", "", ""], keys),
+            Row(["# Detailed Table Information", "", ""], keys),
+            Row(["Owner", "root", ""], keys),
+            Row(["Provider", "iceberg", ""], keys),
+        ]
+        with adapter._recording_describe_results():
+            with mock.patch.object(adapter, "execute_macro", return_value=describe_rows):
+                _schema, name, information = adapter._get_relation_information_using_describe(
+                    ["default", "orders", False]
+                )
+
+            relation = SparkRelation.create(
+                schema=_schema,
+                identifier=name,
+                type=SparkRelation.get_relation_type.Table,
+                information=information,
+                is_iceberg=True,
+            )
+
+            with mock.patch.object(adapter, "get_columns_in_relation") as mock_get_cols:
+                result = list(adapter._get_columns_for_catalog(relation))
+
+        mock_get_cols.assert_not_called()
+        self.assertIsNone(adapter._describe_results)
+        self.assertEqual([c["column_name"] for c in result], ["id", "name"])
+        self.assertEqual([c["column_type"] for c in result], ["int", "string"])
+        self.assertEqual(result[0]["table_owner"], "root")
+
+    def test_describe_results_are_only_kept_for_the_catalog(self):
+        """Relations listed outside of get_catalog don't keep their DESCRIBE results."""
+        adapter = self._make_adapter()
+
+        keys = ["col_name", "data_type", "comment"]
+        describe_rows = [Row(["id", "int", None], keys)]
+        with mock.patch.object(adapter, "execute_macro", return_value=describe_rows):
+            adapter._get_relation_information_using_describe(["default", "orders", False])
+
+        self.assertIsNone(adapter._describe_results)
+        relation = SparkRelation.create(schema="default", identifier="orders")
+        self.assertIsNone(adapter._pop_describe_result(relation))
+
+    def test_catalog_describes_cached_relations_concurrently(self):
+        """In docs generate the relations come from the warm relations cache, so
+        their columns are described by the catalog, on the adapter's threads."""
+        set_invocation_context({})
+        adapter = self._make_adapter()
+        relations = [
+            SparkRelation.create(
+                schema="default",
+                identifier=name,
+                type=SparkRelation.get_relation_type.Table,
+                information="Provider: iceberg\n",
+                is_iceberg=True,
+            )
+            for name in ("orders", "customers")
+        ]
+        for relation in relations:
+            adapter.cache.add(relation)
+
+        describe_threads = set()
+
+        def describe(relation):
+            describe_threads.add(threading.get_ident())
+            return [
+                SparkColumn(
+                    table_database=None,
+                    table_schema=relation.schema,
+                    table_name=relation.name,
+                    table_type=relation.type,
+                    column_index=0,
+                    table_owner="root",
+                    column="id",
+                    dtype="int",
+                )
+            ]
+
+        with mock.patch.object(
+            adapter, "list_relations_without_caching"
+        ) as list_relations, mock.patch.object(
+            adapter, "get_columns_in_relation", side_effect=describe
+        ) as get_columns:
+            catalog = adapter._get_one_catalog(mock.Mock(database=None), {"default"}, set())
+
+        list_relations.assert_not_called()
+        self.assertEqual(get_columns.call_count, 2)
+        self.assertNotIn(threading.get_ident(), describe_threads)
+        self.assertEqual([row["table_name"] for row in catalog.rows], ["orders", "customers"])
+
     def test_fallback_swallows_runtime_error(self):
         """If the fallback get_columns_in_relation raises DbtRuntimeError"""
         adapter = self._make_adapter()
@@ -0,0 +1,68 @@
+import time
+import tracemalloc
+
+import pytest
+
+
+def _fetch(adapter, sql):
+    import pyarrow
+
+    arrow_before = pyarrow.total_allocated_bytes()
+    tracemalloc.start()
+    start = time.perf_counter()
+    with adapter.connection_named("__test"):
+        _, table = adapter.execute(sql, fetch=True)
+        row_count = len(table)
+    elapsed = time.perf_counter() - start
+    _, python_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # tracemalloc only sees Python allocations, not the buffers Arrow
+    # allocates in C++, so add those the result still holds
+    arrow_held = pyarrow.total_allocated_bytes() - arrow_before
+    return table, row_count, elapsed, python_peak, arrow_held
+
+
+class BaseArrowFetchResults:
+    """Benchmark execute(fetch=True) with and without Arrow-backed results.
+
+    Adapters with a native Arrow fetch path inherit this and override
+    `rows_sql` with an ordered query that returns `ROW_COUNT` rows. Rows/s, peak
+    Python memory and the Arrow memory held by the result are printed for
+    both paths; run with `-s` to see them.
+    """
+
+    ROW_COUNT = 100_000
+
+    @pytest.fixture(scope="class")
+    def rows_sql(self):
+        raise NotImplementedError("Override rows_sql with a query returning ROW_COUNT rows")
+
+    def test_arrow_results_match_agate_results(self, project, rows_sql):
+        pytest.importorskip("pyarrow")
+        adapter = project.adapter
+
+        adapter.connections.set_arrow_results_checker(lambda: False)
+        agate_table, agate_rows, agate_elapsed, agate_peak, agate_held = _fetch(adapter, rows_sql)
+
+        adapter.connections.set_arrow_results_checker(lambda: True)
+        arrow_table, arrow_rows, arrow_elapsed, arrow_peak, arrow_held = _fetch(adapter, rows_sql)
+
+        adapter.connections.set_arrow_results_checker(
+            lambda: adapter.behavior.enable_arrow_fetch_results.no_warn
+        )
+
+        for name, rows, elapsed, peak, held in (
+            ("agate", agate_rows, agate_elapsed, agate_peak, agate_held),
+            ("arrow", arrow_rows, arrow_elapsed, arrow_peak, arrow_held),
+        ):
+            print(
+                f"\n{name}: {rows / elapsed:,.0f} rows/s, Python peak {peak / 2**20:.1f} MiB,"
+                f" Arrow held {held / 2**20:.1f} MiB"
+            )
+
+        assert agate_rows == arrow_rows == self.ROW_COUNT
+        assert list(arrow_table.column_names) == list(agate_table.column_names)
+        # touching the rows builds the agate table, which must match
+        assert [tuple(row) for row in arrow_table.rows[:10]] == [
+            tuple(row) for row in agate_table.rows[:10]
+        ]
@@ -1,6 +1,7 @@
 from codecs import BOM_UTF8
 import csv
 from pathlib import Path
+import time
 
 import pytest
 
@@ -14,6 +15,7 @@ from dbt.tests.util import (
     read_file,
     rm_dir,
     run_dbt,
+    update_config_file,
 )
 
 
@@ -415,3 +417,47 @@ class BaseTestEmptySeed:
 
 class TestEmptySeed(BaseTestEmptySeed):
     pass
+
+
+class BaseSeedBulkLoad(SeedConfigBase):
+    """Load the same rows with batched inserts, and with the adapter's bulk
+    load path (the enable_bulk_seed_loading behavior flag), and check that
+    both produce the same table. The rows/sec of each is printed, run with
+    -s to see it.
+    """
+
+    row_count = 100_000
+
+    @pytest.fixture(scope="class")
+    def seeds(self):
+        lines = ["id,name,amount,created_at,is_active"]
+        for i in range(self.row_count):
+            amount = "" if i % 10 == 0 else str(i * 1.5)
+            lines.append(
+                f'{i},"name {i}, ""quoted""",{amount},'
+                f"2020-01-01 00:{i % 60:02d}:00,{str(i % 2 == 0).lower()}"
+            )
+        rows = "\n".join(lines) + "\n"
+        return {"seed_inserts.csv": rows, "seed_bulk.csv": rows}
+
+    def _seed(self, name):
+        start = time.perf_counter()
+        results = run_dbt(["seed", "--select", name])
+        elapsed = time.perf_counter() - start
+        assert len(results) == 1
+        print(f"\n{name}: {self.row_count / elapsed:,.0f} rows/sec ({elapsed:.2f}s)")
+
+    def test_seed_bulk_load(self, project):
+        self._seed("seed_inserts")
+        update_config_file({"flags": {"enable_bulk_seed_loading": True}}, "dbt_project.yml")
+        self._seed("seed_bulk")
+
+        check_relations_equal(project.adapter, ["seed_inserts", "seed_bulk"])
+        [(count,)] = project.run_sql(
+            f"select count(*) from {project.test_schema}.seed_bulk", fetch="all"
+        )
+        assert count == self.row_count
+
+
+class TestSeedBulkLoad(BaseSeedBulkLoad):
+    pass